@@ -0,0 +1,190 @@
+"""Benchmark fleet orchestration against the simulated provider.
+
+Runs the real sail() (bootstrap_fleet, Mutagen/scp attach, launch_fleet)
+and sink() for increasing ship counts, each in a fresh child process with
+its own HOME, so nothing touches real VMs, ~/.ssh or ~/voyages. Laptop-side
+tools (ssh, scp, mutagen, gh, tailscale) are shimmed on PATH; ship-side
+commands run through the simulated provider's local bash.
+
+Reports wall time per phase, the peak number of concurrent provider
+operations, and CPU time and peak memory per ship count.
+
+Run with: python benchmarks/bench_fleet.py [--ships 10,50,100,200]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+SHIP_COUNTS = "10,50,100,200"
+
+# Laptop-side tools sail shells out to
+_SHIMS = {
+    "ssh": "#!/bin/sh\nexit 0\n",
+    "scp": "#!/bin/sh\nexit 0\n",
+    "mutagen": "#!/bin/sh\nexit 0\n",
+    # `gh repo clone <repo> <dest>` becomes an empty repo, so git checkout -b works
+    "gh": '#!/bin/sh\n[ "$1 $2" = "repo clone" ] && exec git init -q "$4"\nexit 0\n',
+    # No tailnet: peer lookups fall back to asking the (simulated) ship
+    "tailscale": "#!/bin/sh\nexit 1\n",
+}
+
+
+def _peak_rss_mb(usage: resource.struct_rusage) -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _timed(module: Any, name: str, phases: dict[str, float]) -> None:
+    """Wrap module.name to add its wall time to phases[name]."""
+    original = getattr(module, name)
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+    setattr(module, name, wrapper)
+
+
+def run_child(ships: int) -> dict[str, Any]:
+    """Sail and sink one simulated voyage; called in a fresh process."""
+    from ocaptain import tmux, voyage
+    from ocaptain.providers import simulated
+
+    phases: dict[str, float] = {}
+    failed: list[int] = []
+    bootstrap_fleet = voyage.bootstrap_fleet
+
+    def counting_bootstrap(*args: Any, **kwargs: Any) -> Any:
+        successful, failures = bootstrap_fleet(*args, **kwargs)
+        failed.extend(index for index, _ in failures)
+        return successful, failures
+
+    voyage.bootstrap_fleet = counting_bootstrap
+    _timed(voyage, "bootstrap_fleet", phases)
+    _timed(voyage, "_attach_ship", phases)
+    _timed(tmux, "launch_fleet", phases)
+
+    tokens = {"CLAUDE_CODE_OAUTH_TOKEN": "simulated"}
+    start = time.perf_counter()
+    sailed = voyage.sail("Benchmark voyage", "owner/repo", ships, tokens, telemetry=False)
+    phases["sail"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    destroyed = voyage.sink(sailed.id)
+    phases["sink"] = time.perf_counter() - start
+
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    child_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return {
+        "ships": ships,
+        "failed": len(failed),
+        "destroyed": destroyed,
+        "phases": phases,
+        "provider": simulated.stats(),
+        "cpu_seconds": self_usage.ru_utime + self_usage.ru_stime,
+        "child_cpu_seconds": child_usage.ru_utime + child_usage.ru_stime,
+        "peak_rss_mb": _peak_rss_mb(self_usage),
+    }
+
+
+def bench(ships: int, settings: dict[str, str]) -> dict[str, Any]:
+    """Run one ship count in a child process with an isolated HOME."""
+    with tempfile.TemporaryDirectory(prefix="ocaptain-bench-") as tmp:
+        home = Path(tmp)
+        bin_dir = home / "bin"
+        bin_dir.mkdir()
+        for name, script in _SHIMS.items():
+            (bin_dir / name).write_text(script)
+            (bin_dir / name).chmod(0o755)
+        config_dir = home / ".config" / "ocaptain"
+        config_dir.mkdir(parents=True)
+        config = {
+            "provider": "simulated",
+            "tailscale": {"ip": "100.64.0.1"},
+            "local": {"workspace_dir": str(home / "voyages")},
+            "providers": {"simulated": {"root": str(home / "sim"), **settings}},
+        }
+        (config_dir / "config.json").write_text(json.dumps(config))
+        env = {
+            **os.environ,
+            "HOME": str(home),
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "OCAPTAIN_TAILSCALE_OAUTH_SECRET": "simulated",
+        }
+        result = subprocess.run(
+            [sys.executable, __file__, "--child", str(ships)],
+            cwd=home,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{ships} ships failed:\n{result.stderr[-2000:]}")
+        return dict(json.loads(result.stdout.splitlines()[-1]))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ships", default=SHIP_COUNTS, help="Comma-separated ship counts")
+    parser.add_argument(
+        "--time-scale", default="0.01", help="Multiplier on simulated latencies (1 = real time)"
+    )
+    parser.add_argument("--create-latency", default="lognormal:20,0.3")
+    parser.add_argument("--exec-latency", default="lognormal:0.15,0.5")
+    parser.add_argument("--create-failure-rate", default="0")
+    parser.add_argument("--exec-failure-rate", default="0")
+    parser.add_argument("--seed", default="1")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child)))
+        return 0
+
+    settings = {
+        "time_scale": args.time_scale,
+        "create_latency": args.create_latency,
+        "exec_latency": args.exec_latency,
+        "create_failure_rate": args.create_failure_rate,
+        "exec_failure_rate": args.exec_failure_rate,
+        "seed": args.seed,
+    }
+    results = [bench(int(n), settings) for n in args.ships.split(",")]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    header = (
+        f"{'ships':>6}  {'sail s':>7}  {'bootstrap':>9}  {'attach':>7}  {'launch':>7}  "
+        f"{'sink s':>7}  {'peak create':>11}  {'peak exec':>9}  {'failed':>6}  "
+        f"{'CPU s':>6}  {'ms/ship':>7}  {'RSS MB':>7}"
+    )
+    print(header)
+    for r in results:
+        phases, provider = r["phases"], r["provider"]
+        cpu = r["cpu_seconds"] + r["child_cpu_seconds"]
+        print(
+            f"{r['ships']:>6}  {phases['sail']:>7.2f}  {phases.get('bootstrap_fleet', 0):>9.2f}  "
+            f"{phases.get('_attach_ship', 0):>7.2f}  {phases.get('launch_fleet', 0):>7.2f}  "
+            f"{phases['sink']:>7.2f}  {provider.get('create', {}).get('peak', 0):>11}  "
+            f"{provider.get('exec', {}).get('peak', 0):>9}  {r['failed']:>6}  "
+            f"{cpu:>6.2f}  {cpu / r['ships'] * 1000:>7.1f}  {r['peak_rss_mb']:>7.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Benchmark status aggregation scaling.
+
+Aggregates synthetic task lists of increasing size with StatusAggregator and
+checks that the per-task cost stays flat (linear scaling) up to 100k tasks.
+
+Run with: python benchmarks/bench_status.py
+"""
+
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+from ocaptain.tasks import StatusAggregator, Task
+from ocaptain.voyage import Voyage
+
+SIZES = (1_000, 10_000, 100_000)
+SHIPS = 50
+# Per-task cost at the largest size may exceed the smallest by this factor
+MAX_PER_TASK_RATIO = 3.0
+
+
+def make_tasks(count: int) -> list[Task]:
+    """Build a task list with a realistic status mix (60% done, 10% active)."""
+    now = datetime.now(UTC)
+    statuses = ["completed"] * 6 + ["in_progress"] + ["pending"] * 3
+    records = []
+    for i in range(count):
+        status = statuses[i % len(statuses)]
+        data: dict[str, object] = {"id": str(i), "title": f"Task {i}", "status": status}
+        if status != "pending":
+            data["owner"] = f"ship-{i % SHIPS}"
+            data["metadata"] = {"claimed_at": (now - timedelta(minutes=i % 90)).isoformat()}
+        records.append(data)
+    return [Task.from_json(data) for data in records]
+
+
+def bench(count: int, voyage: Voyage, repeat: int = 3) -> float:
+    """Best-of-N seconds to aggregate `count` tasks into a VoyageStatus."""
+    tasks = make_tasks(count)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        StatusAggregator.from_tasks(iter(tasks)).status(voyage)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    voyage = Voyage.create("bench", "owner/repo", SHIPS)
+    per_task: list[float] = []
+
+    print(f"{'tasks':>8}  {'total ms':>10}  {'µs/task':>8}")
+    for count in SIZES:
+        seconds = bench(count, voyage)
+        per_task.append(seconds / count)
+        print(f"{count:>8}  {seconds * 1000:>10.2f}  {seconds / count * 1e6:>8.3f}")
+
+    ratio = per_task[-1] / per_task[0]
+    print(f"\nPer-task cost ratio ({SIZES[-1]} vs {SIZES[0]}): {ratio:.2f}")
+    if ratio > MAX_PER_TASK_RATIO:
+        print(f"FAIL: scaling is worse than linear (ratio > {MAX_PER_TASK_RATIO})")
+        return 1
+    print("OK: linear scaling")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
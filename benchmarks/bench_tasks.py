@@ -0,0 +1,270 @@
+"""Benchmark the task and status hot paths against stored baselines.
+
+Generates plans of 100 to 100k tasks in several DAG shapes (chain, wide,
+layered diamonds), writes them as a voyage's task files and times:
+
+- Task.from_json over the raw records
+- parse_task_ndjson over remote fetch output
+- list_tasks_local with a cold and a warm task cache
+- derive_status_local (warm cache)
+- plan validation (cli._validate_plan_dir)
+- building and rendering the `ocaptain tasks` table (up to RENDER_MAX tasks;
+  Rich table layout is far slower per task than everything else)
+
+Timings are best-of-N microseconds per task, compared against
+benchmarks/baselines.json; a case slower than its baseline by more than
+--tolerance fails the run. Baselines are machine-specific: record them with
+--update on the machine that runs the comparison.
+
+Run with: python benchmarks/bench_tasks.py [--sizes 100,1000] [--update]
+"""
+
+import argparse
+import gc
+import io
+import json
+import math
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+
+from ocaptain import cli
+from ocaptain.tasks import (
+    TASK_CACHE_FILE,
+    Task,
+    TaskCache,
+    derive_status_local,
+    list_tasks_local,
+    parse_task_ndjson,
+)
+from ocaptain.voyage import Voyage
+
+SIZES = "100,1000,10000,100000"
+SHAPES = ("chain", "wide", "layered")
+SHIPS = 50
+BASELINES = Path(__file__).with_name("baselines.json")
+BASELINE_KEY = "bench_tasks"
+# A case fails when it is this much slower than its baseline (0.5 = 50%)
+TOLERANCE = 0.5
+# Cases under this many µs in total are too noisy to compare
+MIN_COMPARE_US = 200.0
+RENDER_MAX = 10_000
+
+
+def make_records(count: int, shape: str) -> list[dict[str, Any]]:
+    """Task JSON records in a DAG shape, with bench_status's status mix.
+
+    chain: each task blocked by the previous one
+    wide: no dependencies
+    layered: sqrt(count)-wide layers, each task blocked by two in the layer above
+    """
+    now = datetime.now(UTC)
+    statuses = ["completed"] * 6 + ["in_progress"] + ["pending"] * 3
+    width = max(1, math.isqrt(count))
+    records: list[dict[str, Any]] = []
+    for i in range(count):
+        if shape == "chain":
+            blocked_by = [str(i - 1)] if i else []
+        elif shape == "layered" and i >= width:
+            above = (i // width - 1) * width
+            blocked_by = sorted({str(above + i % width), str(above + (i + 1) % width)})
+        else:
+            blocked_by = []
+        status = statuses[i % len(statuses)]
+        data: dict[str, Any] = {
+            "id": str(i),
+            "subject": f"Implement component {i} of the generated benchmark plan",
+            "description": f"Generated task {i} ({shape}).",
+            "status": status,
+            "blockedBy": blocked_by,
+            "blocks": [],
+            "created": (now - timedelta(hours=2)).isoformat(),
+            "updated": (now - timedelta(minutes=i % 90)).isoformat(),
+        }
+        if status != "pending":
+            data["owner"] = f"ship-{i % SHIPS}"
+            data["metadata"] = {"claimed_at": (now - timedelta(minutes=i % 90)).isoformat()}
+        records.append(data)
+    for data in records:
+        for blocker in data["blockedBy"]:
+            records[int(blocker)]["blocks"].append(data["id"])
+    return records
+
+
+def write_plan(root: Path, records: list[dict[str, Any]], voyage: Voyage) -> tuple[Path, Path]:
+    """Write a plan directory and a voyage directory sharing its task files."""
+    plan_dir = root / "plan"
+    tasks_dir = plan_dir / "tasks"
+    tasks_dir.mkdir(parents=True)
+    for data in records:
+        (tasks_dir / f"{data['id']}.json").write_text(json.dumps(data))
+    (plan_dir / "spec.md").write_text("# Benchmark Specification\n")
+    (plan_dir / "verify.sh").write_text("#!/bin/sh\nexit 0\n")
+    (plan_dir / "voyage.json").write_text(
+        json.dumps({"repo": "owner/repo", "recommended_ships": SHIPS})
+    )
+
+    voyage_dir = root / "voyage"
+    task_list_dir = voyage_dir / ".claude" / "tasks" / voyage.task_list_id
+    task_list_dir.parent.mkdir(parents=True)
+    task_list_dir.symlink_to(tasks_dir, target_is_directory=True)
+    return plan_dir, voyage_dir
+
+
+def ndjson_output(records: list[dict[str, Any]]) -> str:
+    """What the remote fetch script prints for these task files."""
+    lines = [
+        json.dumps({"file": f"{d['id']}.json", "mtime": 1.0 + i, "body": json.dumps(d)})
+        for i, d in enumerate(records)
+    ]
+    files = [f"{d['id']}.json" for d in records]
+    lines.append(json.dumps({"files": files, "marker": False, "progress": True}))
+    return "\n".join(lines) + "\n"
+
+
+def render_table(tasks: list[Task]) -> str:
+    buffer = io.StringIO()
+    Console(file=buffer, width=160, color_system=None).print(cli._task_table(tasks))
+    return buffer.getvalue()
+
+
+def best_of(
+    fn: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None
+) -> float:
+    """Best wall time of `repeat` calls, running `setup` untimed before each.
+
+    Like timeit, the garbage collector is off while timing.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def bench_plan(count: int, shape: str, root: Path) -> dict[str, float]:
+    """Seconds per case for one generated plan."""
+    voyage = Voyage.create("bench", "owner/repo", SHIPS)
+    records = make_records(count, shape)
+    plan_dir, voyage_dir = write_plan(root, records, voyage)
+    output = ndjson_output(records)
+    tasks = [Task.from_json(data) for data in records]
+    cache_file = voyage_dir / TASK_CACHE_FILE
+    repeat = 5 if count <= 10_000 else 2
+
+    def drop_cache() -> None:
+        cache_file.unlink(missing_ok=True)
+
+    timings = {
+        "from_json": best_of(lambda: [Task.from_json(data) for data in records], repeat),
+        "parse_ndjson": best_of(lambda: parse_task_ndjson(output), repeat),
+        "list_local_cold": best_of(
+            lambda: list_tasks_local(voyage_dir, voyage), repeat, setup=drop_cache
+        ),
+    }
+    list_tasks_local(voyage_dir, voyage)  # leave a warm persisted cache
+    timings["list_local_warm"] = best_of(lambda: list_tasks_local(voyage_dir, voyage), repeat)
+    timings["derive_status"] = best_of(lambda: derive_status_local(voyage, voyage_dir), repeat)
+    cache = TaskCache(voyage_dir, voyage)
+    timings["derive_status_held"] = best_of(
+        lambda: derive_status_local(voyage, voyage_dir, cache), repeat
+    )
+    timings["validate_plan"] = best_of(lambda: cli._validate_plan_dir(plan_dir), repeat)
+    if count <= RENDER_MAX:
+        timings["render_table"] = best_of(lambda: render_table(tasks), 1 if count > 1000 else 3)
+    return timings
+
+
+def load_baselines() -> dict[str, float]:
+    try:
+        return dict(json.loads(BASELINES.read_text()).get(BASELINE_KEY, {}))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baselines(current: dict[str, float]) -> None:
+    try:
+        saved = json.loads(BASELINES.read_text())
+    except (OSError, ValueError):
+        saved = {}
+    saved[BASELINE_KEY] = {key: round(value, 3) for key, value in sorted(current.items())}
+    BASELINES.write_text(json.dumps(saved, indent=2, sort_keys=True) + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=SIZES, help="Comma-separated task counts")
+    parser.add_argument("--shapes", default=",".join(SHAPES), help="Comma-separated DAG shapes")
+    parser.add_argument(
+        "--tolerance", type=float, default=TOLERANCE, help="Allowed slowdown vs baseline"
+    )
+    parser.add_argument("--update", action="store_true", help="Record results as the baselines")
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.sizes.split(",")]
+    shapes = args.shapes.split(",")
+    if unknown := set(shapes) - set(SHAPES):
+        parser.error(f"unknown shapes: {', '.join(sorted(unknown))}")
+
+    baselines = load_baselines()
+    current: dict[str, float] = {}
+    regressions = []
+
+    header = f"{'case':<20}  {'shape':<8}  {'tasks':>7}  {'total ms':>9}  {'µs/task':>8}"
+    print(f"{header}  {'baseline':>8}")
+    for count in sizes:
+        for shape in shapes:
+            root = Path(tempfile.mkdtemp(prefix="ocaptain-bench-"))
+            try:
+                timings = bench_plan(count, shape, root)
+            finally:
+                shutil.rmtree(root)
+            for case, seconds in timings.items():
+                key = f"{case}/{shape}/{count}"
+                per_task = seconds / count * 1e6
+                current[key] = per_task
+                baseline = baselines.get(key)
+                verdict = ""
+                if (
+                    baseline is not None
+                    and seconds * 1e6 >= MIN_COMPARE_US
+                    and per_task > baseline * (1 + args.tolerance)
+                ):
+                    verdict = f"  REGRESSION +{(per_task / baseline - 1) * 100:.0f}%"
+                    regressions.append(key)
+                print(
+                    f"{case:<20}  {shape:<8}  {count:>7}  {seconds * 1000:>9.2f}  "
+                    f"{per_task:>8.3f}  {baseline if baseline is not None else '—':>8}{verdict}"
+                )
+
+    if args.update:
+        save_baselines({**baselines, **current})
+        print(f"\nBaselines updated: {BASELINES}")
+        return 0
+    if regressions:
+        print(f"\nFAIL: {len(regressions)} case(s) slower than baseline by > {args.tolerance:.0%}")
+        return 1
+    missing = [key for key in current if key not in baselines]
+    if missing:
+        print(f"\n{len(missing)} case(s) have no baseline; record them with --update")
+    print("OK: no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
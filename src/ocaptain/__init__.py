@@ -1,10 +1,28 @@
 """ocaptain - Minimal control plane for multi-VM Claude Code orchestration."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "2.2.0"
 
-from .provider import VM, Provider, get_provider
-from .tasks import derive_status, list_tasks
-from .voyage import Voyage, load_voyage, sail, sink
+if TYPE_CHECKING:
+    from .provider import VM, Provider, get_provider
+    from .tasks import derive_status, list_tasks
+    from .voyage import Voyage, load_voyage, sail, sink
+
+# Public names are imported from their modules on first use, so that
+# `import ocaptain.cli` (and every CLI invocation) only pays for what it uses
+_EXPORTS = {
+    "Voyage": "voyage",
+    "sail": "voyage",
+    "load_voyage": "voyage",
+    "sink": "voyage",
+    "derive_status": "tasks",
+    "list_tasks": "tasks",
+    "Provider": "provider",
+    "VM": "provider",
+    "get_provider": "provider",
+}
 
 __all__ = [
     "Voyage",
@@ -17,3 +35,9 @@ __all__ = [
     "VM",
     "get_provider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if module := _EXPORTS.get(name):
+        return getattr(import_module(f".{module}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,250 @@
+"""Local SQLite index of voyages, ships, sync sessions and task summaries.
+
+sail, scale and sink keep the catalog current so list, shell and sink can
+answer without scanning voyage directories or calling provider.list().
+Callers fall back to those slower sources when the catalog has no answer.
+"""
+
+import logging
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .provider import VM, VMStatus
+
+if TYPE_CHECKING:
+    from .tasks import VoyageStatus
+    from .voyage import Voyage
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = "catalog.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS voyages (
+    id TEXT PRIMARY KEY,
+    repo TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    ship_count INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    voyage_dir TEXT NOT NULL,
+    sunk_at REAL
+);
+CREATE TABLE IF NOT EXISTS ships (
+    voyage_id TEXT NOT NULL,
+    ship_id TEXT NOT NULL,
+    vm_id TEXT NOT NULL,
+    vm_name TEXT NOT NULL,
+    ssh_dest TEXT NOT NULL,
+    ts_ip TEXT,
+    PRIMARY KEY (voyage_id, ship_id)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    session_name TEXT PRIMARY KEY,
+    voyage_id TEXT NOT NULL,
+    ship_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_summaries (
+    voyage_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    in_progress INTEGER NOT NULL,
+    pending INTEGER NOT NULL,
+    stale INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def catalog_path() -> Path:
+    """Catalog location: alongside the voyage directories it indexes."""
+    from .config import CONFIG
+
+    return Path(CONFIG.local.workspace_dir).expanduser() / CATALOG_FILE
+
+
+@dataclass(frozen=True)
+class VoyageEntry:
+    """A catalogued voyage with its last recorded task summary."""
+
+    id: str
+    repo: str
+    prompt: str
+    ship_count: int
+    created_at: str
+    sunk: bool
+    state: str | None
+    tasks_total: int
+    tasks_complete: int
+    tasks_stale: int
+    summary_at: float | None
+
+
+class Catalog:
+    """Connection to the local voyage catalog."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or catalog_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def record_voyage(self, voyage: "Voyage", voyage_dir: Path) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT INTO voyages VALUES (?, ?, ?, ?, ?, ?, NULL) "
+                "ON CONFLICT (id) DO UPDATE SET ship_count = excluded.ship_count, "
+                "voyage_dir = excluded.voyage_dir",
+                (
+                    voyage.id,
+                    voyage.repo,
+                    voyage.prompt,
+                    voyage.ship_count,
+                    voyage.created_at,
+                    str(voyage_dir),
+                ),
+            )
+
+    def record_ship(
+        self,
+        voyage_id: str,
+        ship_id: str,
+        vm: VM,
+        ts_ip: str | None,
+        sync_sessions: list[str] | None = None,
+    ) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO ships VALUES (?, ?, ?, ?, ?, ?)",
+                (voyage_id, ship_id, vm.id, vm.name, vm.ssh_dest, ts_ip),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO syncs VALUES (?, ?, ?)",
+                [(name, voyage_id, ship_id) for name in sync_sessions or []],
+            )
+
+    def remove_ship(self, voyage_id: str, ship_id: str) -> None:
+        with self._db:
+            self._db.execute(
+                "DELETE FROM ships WHERE voyage_id = ? AND ship_id = ?", (voyage_id, ship_id)
+            )
+            self._db.execute(
+                "DELETE FROM syncs WHERE voyage_id = ? AND ship_id = ?", (voyage_id, ship_id)
+            )
+
+    def mark_sunk(self, voyage_id: str) -> None:
+        """Forget a voyage's ships and syncs; the voyage stays listed as sunk."""
+        with self._db:
+            self._db.execute("DELETE FROM ships WHERE voyage_id = ?", (voyage_id,))
+            self._db.execute("DELETE FROM syncs WHERE voyage_id = ?", (voyage_id,))
+            self._db.execute(
+                "UPDATE voyages SET sunk_at = ? WHERE id = ?", (time.time(), voyage_id)
+            )
+
+    def record_status(self, voyage_status: "VoyageStatus") -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO task_summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    voyage_status.voyage.id,
+                    voyage_status.state.value,
+                    voyage_status.tasks_total,
+                    voyage_status.tasks_complete,
+                    voyage_status.tasks_in_progress,
+                    voyage_status.tasks_pending,
+                    voyage_status.tasks_stale,
+                    time.time(),
+                ),
+            )
+
+    def voyages(self) -> list[VoyageEntry]:
+        """All catalogued voyages, newest first."""
+        rows = self._db.execute(
+            "SELECT v.id, v.repo, v.prompt, v.ship_count, v.created_at, v.sunk_at, "
+            "s.state, s.total, s.completed, s.stale, s.updated_at "
+            "FROM voyages v LEFT JOIN task_summaries s ON s.voyage_id = v.id "
+            "ORDER BY v.created_at DESC"
+        )
+        return [
+            VoyageEntry(
+                id=row[0],
+                repo=row[1],
+                prompt=row[2],
+                ship_count=row[3],
+                created_at=row[4],
+                sunk=row[5] is not None,
+                state=row[6],
+                tasks_total=row[7] or 0,
+                tasks_complete=row[8] or 0,
+                tasks_stale=row[9] or 0,
+                summary_at=row[10],
+            )
+            for row in rows
+        ]
+
+    def ships(self, voyage_id: str) -> list[VM]:
+        """Catalogued ship VMs for a voyage. Status is UNKNOWN (not probed)."""
+        rows = self._db.execute(
+            "SELECT vm_id, vm_name, ssh_dest FROM ships WHERE voyage_id = ? ORDER BY ship_id",
+            (voyage_id,),
+        )
+        return [VM(id=r[0], name=r[1], ssh_dest=r[2], status=VMStatus.UNKNOWN) for r in rows]
+
+    def ship(self, voyage_id: str, ship_id: str) -> VM | None:
+        row = self._db.execute(
+            "SELECT vm_id, vm_name, ssh_dest FROM ships WHERE voyage_id = ? AND ship_id = ?",
+            (voyage_id, ship_id),
+        ).fetchone()
+        if row is None:
+            return None
+        return VM(id=row[0], name=row[1], ssh_dest=row[2], status=VMStatus.UNKNOWN)
+
+    def ship_ips(self, voyage_id: str) -> dict[str, str]:
+        """Tailscale IP by ship ID, for ships whose IP was recorded."""
+        rows = self._db.execute(
+            "SELECT ship_id, ts_ip FROM ships WHERE voyage_id = ? AND ts_ip IS NOT NULL",
+            (voyage_id,),
+        )
+        return dict(rows.fetchall())
+
+    def sync_sessions(self, voyage_id: str) -> list[str]:
+        rows = self._db.execute(
+            "SELECT session_name FROM syncs WHERE voyage_id = ? ORDER BY session_name",
+            (voyage_id,),
+        )
+        return [r[0] for r in rows]
+
+
+def open_catalog() -> Catalog | None:
+    """Open the catalog, or None (with a warning) if it can't be opened."""
+    try:
+        return Catalog()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Voyage catalog unavailable: %s", e)
+        return None
+
+
+@contextmanager
+def catalog_session() -> Iterator[Catalog | None]:
+    """Open the catalog for best-effort use: errors are logged, never raised.
+
+    Yields None if the catalog can't be opened, so callers fall back to the
+    provider or the voyage directories.
+    """
+    catalog = open_catalog()
+    try:
+        yield catalog
+    except sqlite3.Error as e:
+        logger.warning("Voyage catalog access failed: %s", e)
+    finally:
+        if catalog:
+            catalog.close()
@@ -3,17 +3,17 @@
 import json
 import re
 import subprocess  # nosec B404
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 
 from . import logs as logs_mod
 from . import tasks as tasks_mod
 from . import voyage as voyage_mod
-from .config import CONFIG
+from .config import CONFIG, get_config
 from .provider import get_provider
 from .secrets import load_tokens, validate_repo_access
 
@@ -24,6 +24,23 @@ app = typer.Typer(
 )
 console = Console()
 
+bench_app = typer.Typer(
+    help="Benchmark a voyage's network and infrastructure", no_args_is_help=True
+)
+app.add_typer(bench_app, name="bench")
+
+stats_app = typer.Typer(help="Show statistics recorded by earlier commands", no_args_is_help=True)
+app.add_typer(stats_app, name="stats")
+
+
+@app.callback()
+def _record_provider_stats(ctx: typer.Context) -> None:
+    # Time provider calls made by this command; persisted and exported on exit
+    from . import provider_stats
+
+    provider_stats.enable()
+    ctx.call_on_close(provider_stats.flush)
+
 
 @app.command()
 def sail(
@@ -162,23 +179,87 @@ def _sail_empty(repo: str | None, no_telemetry: bool) -> None:
     console.print(f"  [dim]ocaptain shell {voyage.id}[/dim]")
 
 
+@app.command("list")
+def list_voyages(
+    rescan: bool = typer.Option(
+        False, "--rescan", help="Add voyages found on disk but missing from the index"
+    ),
+) -> None:
+    """List voyages from the local index."""
+    from .catalog import catalog_session
+    from .local_storage import list_voyage_dirs
+
+    entries = []
+    with catalog_session() as catalog:
+        if catalog:
+            entries = catalog.voyages()
+            if rescan or not entries:
+                known = {e.id for e in entries}
+                for voyage_dir in list_voyage_dirs():
+                    if voyage_dir.name in known:
+                        continue
+                    try:
+                        voyage = voyage_mod.Voyage.from_json(
+                            (voyage_dir / "voyage.json").read_text()
+                        )
+                    except (OSError, ValueError, TypeError):
+                        continue
+                    catalog.record_voyage(voyage, voyage_dir)
+                entries = catalog.voyages()
+
+    if not entries:
+        console.print("[yellow]No voyages found.[/yellow]")
+        raise typer.Exit(1)
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Voyage", no_wrap=True)
+    table.add_column("Repo")
+    table.add_column("Ships")
+    table.add_column("State")
+    table.add_column("Tasks")
+    table.add_column("Created")
+
+    now = datetime.now(UTC)
+    for entry in entries:
+        if entry.sunk:
+            state = "[dim]sunk[/dim]"
+        elif entry.state:
+            state = _state_style(tasks_mod.VoyageState(entry.state))
+        else:
+            state = "—"
+        tasks_str = f"{entry.tasks_complete}/{entry.tasks_total}" if entry.state else "—"
+        created = datetime.fromisoformat(entry.created_at)
+        table.add_row(
+            entry.id,
+            entry.repo,
+            "—" if entry.sunk else str(entry.ship_count),
+            state,
+            tasks_str,
+            _format_duration((now - created).total_seconds()) + " ago",
+        )
+
+    console.print(table)
+    console.print("[dim]Task counts are as of the last ocaptain status.[/dim]")
+
+
 @app.command()
 def status(
     voyage_id: str | None = typer.Argument(None, help="Voyage ID (optional if only one active)"),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Live dashboard, redrawn on change"),
+    all_voyages: bool = typer.Option(False, "--all", "-a", help="Overview of every voyage"),
+    interval: float = typer.Option(30.0, "--interval", help="Max seconds between --watch redraws"),
 ) -> None:
     """Show voyage status (derived from task list)."""
-    from .local_storage import get_voyage_dir
+    from .catalog import catalog_session
+    from .local_storage import get_voyage_dir, list_voyage_dirs
+
+    if all_voyages:
+        _status_all()
+        return
 
     # If no voyage_id, try to find the only active one
     if not voyage_id:
-        workspace_dir = Path(CONFIG.local.workspace_dir).expanduser()
-        if not workspace_dir.exists():
-            console.print("[yellow]No active voyages found.[/yellow]")
-            raise typer.Exit(1)
-
-        voyage_dirs = [
-            d for d in workspace_dir.iterdir() if d.is_dir() and d.name.startswith("voyage-")
-        ]
+        voyage_dirs = list_voyage_dirs()
 
         if len(voyage_dirs) == 0:
             console.print("[yellow]No active voyages found.[/yellow]")
@@ -187,29 +268,154 @@ def status(
             console.print("[yellow]Multiple voyages found. Please specify voyage_id:[/yellow]")
             for d in voyage_dirs:
                 console.print(f"  {d.name}")
+            console.print("[dim]Or see them all with: ocaptain status --all[/dim]")
             raise typer.Exit(1)
         else:
             voyage_id = voyage_dirs[0].name
 
     voyage = voyage_mod.load_voyage(voyage_id)
     voyage_dir = get_voyage_dir(voyage_id)
+
+    if watch:
+        _watch_status(voyage, voyage_dir, interval)
+        return
+
     voyage_status = tasks_mod.derive_status_local(voyage, voyage_dir)
+    with catalog_session() as catalog:
+        if catalog:
+            catalog.record_status(voyage_status)
+    console.print(_status_renderable(voyage_status))
+
+
+def _voyage_overview(
+    voyage_dir: Path,
+) -> tuple[tasks_mod.VoyageStatus, float | None] | None:
+    """Status and last activity time for one voyage dir (None if unreadable)."""
+    from .local_storage import stat_snapshot
+
+    try:
+        voyage = voyage_mod.Voyage.from_json((voyage_dir / "voyage.json").read_text())
+    except (OSError, ValueError, TypeError):
+        return None
+
+    cache = tasks_mod.TaskCache(voyage_dir, voyage)
+    voyage_status = tasks_mod.derive_status_local(voyage, voyage_dir, cache)
+
+    mtimes = [mtime_ns / 1e9 for mtime_ns, _ in stat_snapshot([voyage_dir / "logs"]).values()]
+    if (tasks_modified := cache.last_modified()) is not None:
+        mtimes.append(tasks_modified)
+    return voyage_status, max(mtimes, default=None)
+
+
+def _status_all() -> None:
+    """One-table overview of every local voyage, newest activity first."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .catalog import catalog_session
+    from .local_storage import list_voyage_dirs
+
+    voyage_dirs = list_voyage_dirs()
+    if not voyage_dirs:
+        console.print("[yellow]No voyages found.[/yellow]")
+        raise typer.Exit(1)
+
+    with ThreadPoolExecutor(max_workers=min(16, len(voyage_dirs))) as executor:
+        overviews = [o for o in executor.map(_voyage_overview, voyage_dirs) if o]
+
+    with catalog_session() as catalog:
+        if catalog:
+            for voyage_status, _ in overviews:
+                catalog.record_status(voyage_status)
+
+    overviews.sort(key=lambda o: o[1] or 0.0, reverse=True)
+    now = datetime.now().timestamp()
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Voyage", no_wrap=True)
+    table.add_column("State")
+    table.add_column("Ships")
+    table.add_column("Tasks")
+    table.add_column("Stale")
+    table.add_column("Last Activity")
+
+    for voyage_status, last_activity in overviews:
+        working = sum(
+            1
+            for s in voyage_status.ships
+            if s.state in (tasks_mod.ShipState.WORKING, tasks_mod.ShipState.STALE)
+        )
+        total = voyage_status.tasks_total
+        percent = f" ({voyage_status.tasks_complete * 100 // total}%)" if total else ""
+        table.add_row(
+            voyage_status.voyage.id,
+            _state_style(voyage_status.state),
+            f"{working}/{voyage_status.voyage.ship_count} working",
+            f"{voyage_status.tasks_complete}/{total}{percent}",
+            str(voyage_status.tasks_stale or "—"),
+            _format_duration(now - last_activity) + " ago" if last_activity else "—",
+        )
+
+    console.print(table)
+
+
+def _watch_status(voyage: voyage_mod.Voyage, voyage_dir: Path, interval: float) -> None:
+    """Live status dashboard, redrawn when task files or logs change."""
+    from rich.live import Live
+
+    from .journal import open_journal
+    from .local_storage import wait_for_change
+
+    cache = tasks_mod.TaskCache(voyage_dir, voyage)
+    journal = open_journal(voyage_dir)
+    tracker = tasks_mod.ProgressTracker()
+    task_dir = voyage_dir / ".claude" / "tasks" / voyage.task_list_id
+    logs_dir = voyage_dir / "logs"
+    watched = [task_dir, logs_dir, voyage_dir / "artifacts"]
+
+    def render() -> Group:
+        voyage_status = tasks_mod.derive_status_local(voyage, voyage_dir, cache)
+        tracker.record(voyage_status)
+        if journal:
+            journal.record(cache.tasks())
+        return _status_renderable(voyage_status, tracker, logs_dir)
+
+    try:
+        with Live(render(), console=console, auto_refresh=False) as live:
+            while True:
+                # Redraw on change, and at least every interval so ages stay current
+                wait_for_change(watched, timeout=interval)
+                live.update(render(), refresh=True)
+    except KeyboardInterrupt:
+        pass
+
+
+def _status_renderable(
+    voyage_status: tasks_mod.VoyageStatus,
+    tracker: tasks_mod.ProgressTracker | None = None,
+    logs_dir: Path | None = None,
+) -> Group:
+    """Render voyage status. Throughput, ETA and log activity need a tracker."""
+    voyage = voyage_status.voyage
+    parts: list[RenderableType] = []
 
     # Header
-    console.print(f"\n[bold]Voyage:[/bold] {voyage.id}")
-    console.print(
+    parts.append(f"\n[bold]Voyage:[/bold] {voyage.id}")
+    parts.append(
         f"[bold]Prompt:[/bold] {voyage.prompt[:80]}{'...' if len(voyage.prompt) > 80 else ''}"
     )
-    console.print(f"[bold]Status:[/bold] {_state_style(voyage_status.state)}")
+    parts.append(f"[bold]Status:[/bold] {_state_style(voyage_status.state)}")
 
     # Ships table
     if voyage_status.ships:
-        console.print("\n[bold]Ships:[/bold]")
+        parts.append("\n[bold]Ships:[/bold]")
         table = Table(show_header=True, header_style="bold")
         table.add_column("Ship")
         table.add_column("State")
         table.add_column("Current Task")
         table.add_column("Completed")
+        if tracker:
+            table.add_column("Rate")
+            table.add_column("Last Log")
 
         for ship in voyage_status.ships:
             state_str = _state_style(ship.state)
@@ -218,25 +424,33 @@ def status(
                 age = _format_age(ship.claimed_at)
                 task_str = f"{task_str} ({age} ago)"
 
-            table.add_row(
-                ship.id,
-                state_str,
-                task_str,
-                str(ship.completed_count),
-            )
+            row = [ship.id, state_str, task_str, str(ship.completed_count)]
+            if tracker:
+                row.append(_format_rate(tracker.rate(ship.id)))
+                row.append(_log_age(logs_dir, ship.id))
+            table.add_row(*row)
 
-        console.print(table)
+        parts.append(table)
 
     # Tasks summary
-    console.print("\n[bold]Tasks:[/bold]")
-    console.print(f"  Complete:    {voyage_status.tasks_complete}")
-    console.print(
+    parts.append("\n[bold]Tasks:[/bold]")
+    parts.append(f"  Complete:    {voyage_status.tasks_complete}")
+    parts.append(
         f"  In Progress: {voyage_status.tasks_in_progress}"
         + (f" ({voyage_status.tasks_stale} stale)" if voyage_status.tasks_stale else "")
     )
-    console.print(f"  Pending:     {voyage_status.tasks_pending}")
-    console.print("  ─────────────")
-    console.print(f"  Total:       {voyage_status.tasks_total}")
+    parts.append(f"  Pending:     {voyage_status.tasks_pending}")
+    parts.append("  ─────────────")
+    parts.append(f"  Total:       {voyage_status.tasks_total}")
+
+    if tracker:
+        rate = tracker.rate() or _lifetime_rate(voyage_status)
+        remaining = voyage_status.tasks_total - voyage_status.tasks_complete
+        eta = _format_duration(remaining / rate * 3600) if rate else "—"
+        parts.append(f"\n[bold]Throughput:[/bold] {_format_rate(rate)}   [bold]ETA:[/bold] {eta}")
+        parts.append(f"[dim]Updated {datetime.now().strftime('%H:%M:%S')} · Ctrl+C to exit[/dim]")
+
+    return Group(*parts)
 
 
 @app.command()
@@ -244,15 +458,58 @@ def logs(
     voyage_id: str = typer.Argument(..., help="Voyage ID"),
     ship: str | None = typer.Option(None, "--ship", "-s", help="Filter to specific ship"),
     follow: bool = typer.Option(False, "--follow", "-f", help="Follow log output"),
-    grep: str | None = typer.Option(None, "--grep", "-g", help="Filter log lines"),
+    grep: str | None = typer.Option(None, "--grep", "-g", help="Filter log lines (regex)"),
     tail: int | None = typer.Option(None, "--tail", "-n", help="Show last N lines"),
+    since: str | None = typer.Option(
+        None, "--since", help="Only records after this time (e.g. 30m, 2h, ISO timestamp)"
+    ),
+    until: str | None = typer.Option(None, "--until", help="Only records before this time"),
+    fetch: bool = typer.Option(
+        True, "--fetch/--no-fetch", help="Collect new log output from ships first"
+    ),
+    color: bool | None = typer.Option(
+        None, "--color/--no-color", help="Colour ship prefixes when following (default: if tty)"
+    ),
 ) -> None:
     """View aggregated logs."""
     from .local_storage import get_voyage_dir
+    from .log_index import parse_time
+
+    try:
+        since_ts = parse_time(since).timestamp() if since else None
+        until_ts = parse_time(until).timestamp() if until else None
+        if grep:
+            re.compile(grep)
+    except (ValueError, re.error) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
 
     voyage = voyage_mod.load_voyage(voyage_id)
     voyage_dir = get_voyage_dir(voyage_id)
-    logs_mod.view_logs_local(voyage_dir, voyage, ship_id=ship, follow=follow, grep=grep, tail=tail)
+
+    collect = None
+    if fetch:
+        collector = logs_mod.LogCollector(voyage_dir)
+        provider = get_provider()
+        try:
+            vms = voyage_mod.known_ships(voyage, provider)
+        except Exception as e:
+            console.print(f"[yellow]Warning:[/yellow] Can't reach ships, showing local logs: {e}")
+            vms = []
+        collector.collect(vms, provider)
+        if vms:
+
+            def collect() -> None:
+                collector.collect(vms, provider)
+
+    if follow:
+        logs_mod.follow_logs_local(
+            voyage_dir, ship, grep, backlog=tail or 10, color=color, collect=collect
+        )
+    elif grep or since or until:
+        logs_mod.search_logs_local(voyage_dir, ship, grep, since_ts, until_ts, tail)
+    else:
+        logs_mod.view_logs_local(voyage_dir, voyage, ship_id=ship, tail=tail)
 
 
 @app.command()
@@ -263,13 +520,27 @@ def tasks(
     """Show task list."""
     from .local_storage import get_voyage_dir
 
+    wanted = None
+    if status_filter:
+        try:
+            wanted = tasks_mod.TaskStatus(status_filter)
+        except ValueError:
+            choices = ", ".join(s.value for s in tasks_mod.TaskStatus)
+            console.print(f"[red]Error:[/red] Unknown status '{status_filter}' ({choices})")
+            raise typer.Exit(1) from None
+
     voyage = voyage_mod.load_voyage(voyage_id)
     voyage_dir = get_voyage_dir(voyage_id)
     all_tasks = tasks_mod.list_tasks_local(voyage_dir, voyage)
 
-    if status_filter:
-        all_tasks = [t for t in all_tasks if t.status.value == status_filter]
+    if wanted is not None:
+        all_tasks = [t for t in all_tasks if t.status is wanted]
 
+    console.print(_task_table(all_tasks))
+
+
+def _task_table(all_tasks: list[tasks_mod.Task]) -> Table:
+    """Build the `ocaptain tasks` table, sorted by task ID."""
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID")
     table.add_column("Title")
@@ -277,8 +548,9 @@ def tasks(
     table.add_column("Assignee")
     table.add_column("Blocked By")
 
+    now = datetime.now(UTC)
     for task in sorted(all_tasks, key=lambda t: t.id):
-        status_str = _task_status_style(task.status, task.is_stale())
+        status_str = _task_status_style(task.status, task.is_stale(now=now))
         blocked = ", ".join(task.blocked_by) if task.blocked_by else "—"
 
         table.add_row(
@@ -289,7 +561,253 @@ def tasks(
             blocked,
         )
 
-    console.print(table)
+    return table
+
+
+@app.command()
+def report(
+    voyage_id: str = typer.Argument(..., help="Voyage ID"),
+) -> None:
+    """Report throughput, queue wait, cycle time and rework from the task journal."""
+    from .journal import JOURNAL_FILE, TaskJournal, build_report
+    from .local_storage import get_voyage_dir
+
+    voyage_dir = get_voyage_dir(voyage_id)
+    if not (voyage_dir / JOURNAL_FILE).exists():
+        console.print(f"[yellow]No task journal for {voyage_id} yet.[/yellow]")
+        console.print(f"[dim]It is recorded by: ocaptain watch {voyage_id}[/dim]")
+        raise typer.Exit(1)
+
+    journal = TaskJournal(voyage_dir)
+    try:
+        voyage_report = build_report(journal)
+    finally:
+        journal.close()
+
+    def duration(seconds: float | None) -> str:
+        return _format_duration(seconds) if seconds is not None else "—"
+
+    console.print(f"\n[bold]Voyage:[/bold] {voyage_id}")
+    console.print(f"[bold]Completed:[/bold] {voyage_report.completed}")
+    console.print(f"[bold]Mean cycle time:[/bold] {duration(voyage_report.cycle_time)}")
+    console.print(f"[bold]Mean queue wait:[/bold] {duration(voyage_report.queue_wait)}")
+    console.print(
+        f"[bold]Rework:[/bold] {voyage_report.rework} "
+        f"(across {voyage_report.reworked_tasks} tasks)\n"
+    )
+
+    ships_table = Table(show_header=True, header_style="bold", title="Ships")
+    ships_table.add_column("Ship")
+    ships_table.add_column("Completed")
+    ships_table.add_column("Cycle Time")
+    ships_table.add_column("Rate")
+    for ship_report in sorted(voyage_report.ships, key=lambda r: (len(r.ship), r.ship)):
+        ships_table.add_row(
+            ship_report.ship,
+            str(ship_report.completed),
+            duration(ship_report.cycle_time),
+            _format_rate(ship_report.tasks_per_hour),
+        )
+    console.print(ships_table)
+
+    layers_table = Table(show_header=True, header_style="bold", title="DAG Layers")
+    layers_table.add_column("Layer")
+    layers_table.add_column("Tasks")
+    layers_table.add_column("Queue Wait")
+    layers_table.add_column("Rate")
+    for layer in voyage_report.layers:
+        layers_table.add_row(
+            str(layer.layer),
+            f"{layer.completed}/{layer.tasks}",
+            duration(layer.queue_wait),
+            _format_rate(layer.tasks_per_hour),
+        )
+    console.print(layers_table)
+
+
+@app.command()
+def metrics(
+    voyage_id: str = typer.Argument(..., help="Voyage ID"),
+    ship: str | None = typer.Option(None, "--ship", "-s", help="Filter to specific ship"),
+    since: str | None = typer.Option(
+        None, "--since", help="Only events after this time (e.g. 30m, 2h, ISO timestamp)"
+    ),
+    until: str | None = typer.Option(None, "--until", help="Only events before this time"),
+    bucket: str = typer.Option("1h", "--bucket", help="Time bucket for the over-time table"),
+) -> None:
+    """Report tokens, cost, API latency and tool calls from ship telemetry."""
+    from .log_index import parse_duration, parse_time
+    from .telemetry import build_metrics, scan_events, telemetry_dir
+
+    try:
+        since_ts = parse_time(since).timestamp() if since else None
+        until_ts = parse_time(until).timestamp() if until else None
+        bucket_seconds = parse_duration(bucket).total_seconds()
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    root = telemetry_dir()
+    if not root.exists():
+        console.print(f"[yellow]No telemetry found in {root}[/yellow]")
+        console.print("[dim]Start the collector with: ocaptain telemetry-start[/dim]")
+        raise typer.Exit(1)
+
+    try:
+        events = scan_events(root, voyage_id, ship, since_ts, until_ts)
+        metrics_report = build_metrics(events, bucket_seconds=bucket_seconds or 3600)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    if not metrics_report.ships:
+        console.print(f"[yellow]No telemetry events for {voyage_id}.[/yellow]")
+        return
+
+    def latency(value: float | None) -> str:
+        return f"{value / 1000:.1f}s" if value is not None else "—"
+
+    total = metrics_report.total
+    console.print(f"\n[bold]Voyage:[/bold] {voyage_id}")
+    console.print(f"[bold]API requests:[/bold] {total.requests}")
+    console.print(
+        f"[bold]Tokens:[/bold] {total.tokens:,} "
+        f"(in {total.input_tokens:,}, out {total.output_tokens:,}, "
+        f"cache read {total.cache_read_tokens:,}, cache write {total.cache_creation_tokens:,})"
+    )
+    console.print(f"[bold]Cost:[/bold] ${total.cost_usd:.2f}")
+    console.print(
+        f"[bold]API latency:[/bold] p50 {latency(total.latency_p50)}, "
+        f"p95 {latency(total.latency_p95)}"
+    )
+    top_tools = ", ".join(f"{name} {count}" for name, count in total.tools.most_common(5))
+    console.print(
+        f"[bold]Tool calls:[/bold] {total.tool_calls} ({total.tool_failures} failed)"
+        + (f" — {top_tools}" if top_tools else "")
+        + "\n"
+    )
+
+    ships_table = Table(show_header=True, header_style="bold", title="Ships")
+    ships_table.add_column("Ship")
+    ships_table.add_column("Requests")
+    ships_table.add_column("Tokens")
+    ships_table.add_column("Cost")
+    ships_table.add_column("p50")
+    ships_table.add_column("p95")
+    ships_table.add_column("Tool Calls")
+    for ship_metrics in metrics_report.ships:
+        ships_table.add_row(
+            ship_metrics.ship,
+            str(ship_metrics.requests),
+            f"{ship_metrics.tokens:,}",
+            f"${ship_metrics.cost_usd:.2f}",
+            latency(ship_metrics.latency_p50),
+            latency(ship_metrics.latency_p95),
+            f"{ship_metrics.tool_calls} ({ship_metrics.tool_failures} failed)",
+        )
+    console.print(ships_table)
+
+    time_table = Table(show_header=True, header_style="bold", title="Over Time")
+    time_table.add_column("From")
+    time_table.add_column("Requests")
+    time_table.add_column("Tokens")
+    time_table.add_column("Cost")
+    time_table.add_column("Tool Calls")
+    for time_bucket in metrics_report.buckets:
+        time_table.add_row(
+            datetime.fromtimestamp(time_bucket.start).strftime("%Y-%m-%d %H:%M"),
+            str(time_bucket.requests),
+            f"{time_bucket.tokens:,}",
+            f"${time_bucket.cost_usd:.2f}",
+            str(time_bucket.tool_calls),
+        )
+    console.print(time_table)
+
+
+@app.command()
+def watch(
+    voyage_id: str = typer.Argument(..., help="Voyage ID"),
+    interval: int = typer.Option(60, "--interval", help="Seconds between checks"),
+    threshold: int | None = typer.Option(
+        None, "--threshold", help="Minutes before a claim is stale (default: config)"
+    ),
+    relaunch: bool = typer.Option(
+        True, "--relaunch/--no-relaunch", help="Relaunch Claude on ships whose session ended"
+    ),
+    max_restarts: int = typer.Option(5, "--max-restarts", help="Relaunch limit per ship"),
+    once: bool = typer.Option(False, "--once", help="Run a single check and exit"),
+) -> None:
+    """Supervise a voyage: reclaim stale tasks and relaunch crashed ships."""
+    import time
+
+    from . import watch as watch_mod
+    from .journal import open_journal
+    from .local_storage import get_voyage_dir
+    from .log_index import LogIndex
+
+    voyage = voyage_mod.load_voyage(voyage_id)
+    voyage_dir = get_voyage_dir(voyage_id)
+    provider = get_provider()
+
+    watchdog = None
+    if relaunch:
+        try:
+            oauth_token = load_tokens()["CLAUDE_CODE_OAUTH_TOKEN"]
+            watchdog = watch_mod.ShipWatchdog(voyage, oauth_token, max_restarts=max_restarts)
+        except ValueError as e:
+            console.print(f"[yellow]Warning:[/yellow] Relaunch disabled: {e}")
+
+    console.print(f"[dim]Watching {voyage_id} every {interval}s (Ctrl+C to stop)[/dim]")
+    cache = tasks_mod.TaskCache(voyage_dir, voyage)
+    journal = open_journal(voyage_dir)
+    collector = logs_mod.LogCollector(voyage_dir)
+    log_index = LogIndex(collector.logs_dir)
+
+    while True:
+        vms = watch_mod.fleet_vms(voyage, provider)
+        live_ships = {watch_mod.ship_id_for(vm) for vm in vms} if vms is not None else None
+
+        for reclaim in watch_mod.reclaim_stale_tasks(voyage, voyage_dir, threshold, live_ships):
+            console.print(
+                f"[yellow]↺[/yellow] Released task {reclaim.task_id} "
+                f"from {reclaim.ship or 'unknown'} ({reclaim.reason})"
+            )
+
+        cache.refresh()
+        cache.save()
+        all_tasks = cache.tasks()
+        if journal:
+            journal.record(all_tasks)
+        if all_tasks and all(t.status == tasks_mod.TaskStatus.COMPLETED for t in all_tasks):
+            console.print("[green]All tasks complete.[/green] Watch stopped.")
+            return
+
+        if vms:
+            collector.collect(vms, provider)
+            log_index.ingest()
+
+        if watchdog and vms:
+            for event in watchdog.check(vms, all_tasks, provider):
+                if event.gave_up:
+                    console.print(
+                        f"[red]✗[/red] {event.ship} keeps stopping "
+                        f"(exit {event.exit_code}); not relaunching again"
+                    )
+                elif event.error:
+                    console.print(
+                        f"[red]✗[/red] Failed to relaunch Claude on {event.ship} "
+                        f"(attempt {event.attempt}): {event.error}"
+                    )
+                else:
+                    console.print(
+                        f"[yellow]↻[/yellow] Relaunched Claude on {event.ship} "
+                        f"(exit {event.exit_code}, attempt {event.attempt})"
+                    )
+
+        if once:
+            return
+
+        time.sleep(interval)
 
 
 @app.command()
@@ -302,10 +820,17 @@ def shell(
     # Verify voyage exists
     voyage_mod.load_voyage(voyage_id)
 
-    provider = get_provider()
+    from .catalog import catalog_session
+
     idx = _parse_ship_index(ship_id)
     ship_name = f"{voyage_id}-ship{idx}"
-    vm = next((v for v in provider.list() if v.name == ship_name), None)
+
+    vm = None
+    with catalog_session() as catalog:
+        if catalog:
+            vm = catalog.ship(voyage_id, f"ship-{idx}")
+    if not vm:
+        vm = next((v for v in get_provider().list() if v.name == ship_name), None)
 
     if not vm:
         console.print(f"[red]Ship not found: {ship_name}[/red]")
@@ -380,14 +905,84 @@ def clone(
     console.print(f"  Branch: {voyage.branch}")
 
 
+@app.command()
+def scale(
+    voyage_id: str = typer.Argument(..., help="Voyage ID"),
+    ships: int | None = typer.Argument(None, help="Target ship count"),
+    auto: bool = typer.Option(False, "--auto", help="Keep sizing the fleet to ready work"),
+    min_ships: int = typer.Option(1, "--min", help="Minimum ships in --auto mode"),
+    max_ships: int | None = typer.Option(None, "--max", help="Maximum ships in --auto mode"),
+    interval: int = typer.Option(60, "--interval", help="Seconds between --auto checks"),
+    drain_timeout: int = typer.Option(
+        1800, "--drain-timeout", help="Seconds to wait for removed ships to finish their task"
+    ),
+    no_telemetry: bool = typer.Option(False, "--no-telemetry", help="Disable OTLP telemetry"),
+) -> None:
+    """Add or remove ships from a running voyage."""
+    import time
+
+    from .local_storage import get_voyage_dir
+
+    if ships is None and not auto:
+        console.print("[red]Specify a ship count or --auto[/red]")
+        raise typer.Exit(1)
+
+    try:
+        tokens = load_tokens()
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    telemetry = not no_telemetry and CONFIG.telemetry_enabled
+    voyage = voyage_mod.load_voyage(voyage_id)
+
+    if not auto and ships is not None:
+        with console.status(f"Scaling {voyage_id} to {ships} ships..."):
+            voyage = voyage_mod.scale(voyage_id, ships, tokens, telemetry, drain_timeout)
+        console.print(
+            f"[green]✓[/green] Voyage [bold]{voyage.id}[/bold] has {voyage.ship_count} ships"
+        )
+        return
+
+    max_ships = max_ships or ships or voyage.ship_count
+    voyage_dir = get_voyage_dir(voyage_id)
+    provider = get_provider()
+    console.print(f"[dim]Autoscaling {voyage_id} between {min_ships} and {max_ships} ships[/dim]")
+    # Drains are requested, then finished on later ticks, so demand is still checked meanwhile
+    drainer = voyage_mod.Drainer(voyage, voyage_dir, provider, drain_timeout)
+
+    while True:
+        for ship_id in drainer.poll():
+            console.print(f"[dim]Removed drained {ship_id}[/dim]")
+
+        all_tasks = tasks_mod.list_tasks_local(voyage_dir, voyage)
+        if all_tasks and all(t.status == tasks_mod.TaskStatus.COMPLETED for t in all_tasks):
+            console.print("[green]All tasks complete.[/green] Autoscaling stopped.")
+            return
+
+        current = len(drainer.active(voyage_mod.list_ships(voyage, provider)))
+        target = voyage_mod.autoscale_target(all_tasks, min_ships, max_ships)
+        if target != current:
+            console.print(f"[dim]Scaling {current} → {target} ships[/dim]")
+            voyage = voyage_mod.scale(
+                voyage_id, target, tokens, telemetry, drain_timeout, drainer=drainer
+            )
+
+        time.sleep(interval)
+
+
 @app.command()
 def sink(
     voyage_id: str | None = typer.Argument(None, help="Voyage ID"),
     all_voyages: bool = typer.Option(False, "--all", help="Destroy ALL ocaptain VMs"),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
+    compact_telemetry: bool = typer.Option(
+        False, "--compact-telemetry", help="Compact collected telemetry afterwards"
+    ),
 ) -> None:
     """Destroy voyage VMs and clean up local session."""
     from . import mutagen as mutagen_mod
+    from .catalog import catalog_session
 
     if all_voyages:
         if not force:
@@ -399,7 +994,15 @@ def sink(
         console.print(f"[green]✓[/green] Destroyed {count} VMs.")
     elif voyage_id:
         # Clean up Mutagen sessions
-        mutagen_mod.terminate_voyage_syncs(voyage_id)
+        sessions: list[str] = []
+        with catalog_session() as catalog:
+            if catalog:
+                sessions = catalog.sync_sessions(voyage_id)
+        if sessions:
+            for session_name in sessions:
+                mutagen_mod.terminate_sync(session_name)
+        else:
+            mutagen_mod.terminate_voyage_syncs(voyage_id)
 
         if not force:
             confirm = typer.confirm(f"Destroy all VMs for {voyage_id}?")
@@ -412,127 +1015,169 @@ def sink(
         console.print("[red]Specify voyage_id or --all[/red]")
         raise typer.Exit(1)
 
+    if compact_telemetry:
+        _compact_telemetry(min_age=0)
 
-def _find_tool(name: str) -> str | None:
-    """Find a tool, including macOS app bundles."""
-    import shutil
 
-    # Try standard PATH first
-    path = shutil.which(name)
-    if path:
-        return path
+@bench_app.command("net")
+def bench_net(
+    voyage_id: str = typer.Argument(..., help="Voyage ID"),
+    size: int = typer.Option(16, "--size", help="MB to transfer each way per ship"),
+    workers: int = typer.Option(
+        0, "--workers", "-w", help="Ships measured at once (default: all; 1 isolates each ship)"
+    ),
+) -> None:
+    """Measure RTT, path type and throughput between each ship and this machine."""
+    from . import netbench
 
-    # Check macOS app bundle locations
-    if name == "tailscale":
-        macos_paths = [
-            "/Applications/Tailscale.app/Contents/MacOS/Tailscale",
-            "/usr/local/bin/tailscale",
-        ]
-        for p in macos_paths:
-            if Path(p).exists():
-                return p
+    voyage_mod.load_voyage(voyage_id)
+    targets, missing = netbench.voyage_targets(voyage_id)
+    for ship_id in missing:
+        console.print(f"[yellow]![/yellow] {ship_id}: no Tailscale IP known, skipped")
+    if not targets:
+        console.print(f"[red]No reachable ships for {voyage_id}[/red]")
+        raise typer.Exit(1)
 
-    return None
+    with console.status(f"Measuring {len(targets)} ships..."):
+        results = netbench.bench_fleet(targets, size * 1024 * 1024, workers or None)
+
+    def number(value: float | None, fmt: str) -> str:
+        return format(value, fmt) if value is not None else "—"
+
+    table = Table(show_header=True, header_style="bold", title=f"Network: {voyage_id}")
+    table.add_column("Ship")
+    table.add_column("Tailscale IP")
+    table.add_column("Path")
+    table.add_column("RTT (ms)", justify="right")
+    table.add_column("Up (MB/s)", justify="right")
+    table.add_column("Down (MB/s)", justify="right")
+    table.add_column("Flags")
+    for r in results:
+        path = f"relayed ({r.relay})" if r.path == "relayed" and r.relay else r.path
+        flags = "; ".join(r.flags)
+        if r.action:
+            flags = f"[red]{r.action}[/red]: {flags}"
+        table.add_row(
+            r.ship_id,
+            r.ip,
+            path,
+            number(r.rtt_ms, ".0f"),
+            number(r.upload_mb_s, ".1f"),
+            number(r.download_mb_s, ".1f"),
+            flags or "[green]ok[/green]",
+        )
+    console.print(table)
 
+    flagged = [r for r in results if r.action]
+    if flagged:
+        console.print(
+            f"\n{len(flagged)} of {len(results)} ships flagged. Relayed ships reach this "
+            "machine through a DERP server; check UDP/NAT on either side, or replace them."
+        )
 
-@app.command()
-def doctor() -> None:
-    """Check system prerequisites and configuration."""
-    import os
 
-    # CONFIG import ensures .env files are loaded
-    _ = CONFIG
+@stats_app.command("provider")
+def stats_provider(
+    provider: str | None = typer.Option(None, "--provider", "-p", help="Only this provider"),
+    reset: bool = typer.Option(False, "--reset", help="Clear recorded statistics"),
+) -> None:
+    """Latency percentiles, errors, retries and payload per provider operation."""
+    from . import provider_stats
 
-    all_ok = True
+    if reset:
+        provider_stats.reset()
+        console.print("Provider statistics cleared.")
+        return
 
-    console.print("\n[bold]Checking prerequisites...[/bold]\n")
+    histograms = provider_stats.load()
+    rows = sorted(key for key in histograms if provider is None or key[0] == provider)
+    if not rows:
+        console.print("[dim]No provider calls recorded yet.[/dim]")
+        return
 
-    # Check tools
-    tools = [
-        ("tailscale", "brew install tailscale (or https://tailscale.com/download)"),
-        ("mutagen", "brew install mutagen-io/mutagen/mutagen"),
-        ("otlp2parquet", "cargo install otlp2parquet (or GitHub releases)"),
-    ]
+    def seconds(value: float | None) -> str:
+        if value is None:
+            return "—"
+        return f"{value * 1000:.0f} ms" if value < 1 else f"{value:.2f} s"
+
+    def size(count: int) -> str:
+        if count < 1024:
+            return f"{count} B"
+        value, units = count / 1024, ["KB", "MB", "GB"]
+        while value >= 1024 and len(units) > 1:
+            value /= 1024
+            units.pop(0)
+        return f"{value:.1f} {units[0]}"
+
+    table = Table(show_header=True, header_style="bold", title="Provider calls")
+    table.add_column("Provider")
+    table.add_column("Operation")
+    for column in ("Calls", "Errors", "Retries", "p50", "p90", "p99", "Max", "Sent", "Received"):
+        table.add_column(column, justify="right")
+    for key in rows:
+        h = histograms[key]
+        errors = f"[red]{h.errors}[/red]" if h.errors else "0"
+        table.add_row(
+            *key,
+            str(h.count),
+            errors,
+            str(h.retries),
+            seconds(h.quantile(0.5)),
+            seconds(h.quantile(0.9)),
+            seconds(h.quantile(0.99)),
+            seconds(h.max),
+            size(h.bytes_sent),
+            size(h.bytes_received),
+        )
+    console.print(table)
+    console.print(f"[dim]From {provider_stats.stats_path()}; --reset to start over.[/dim]")
 
-    for tool, install_hint in tools:
-        if _find_tool(tool):
-            console.print(f"  [green]✓[/green] {tool}")
-        else:
-            console.print(f"  [red]✗[/red] {tool} — {install_hint}")
-            all_ok = False
 
-    # Check tailscale connection
-    console.print()
-    tailscale_path = _find_tool("tailscale")
-    try:
-        result = subprocess.run(  # nosec B603, B607
-            [tailscale_path or "tailscale", "status", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            import json as json_mod
-
-            ts_status = json_mod.loads(result.stdout)
-            if ts_status.get("Self", {}).get("Online"):
-                ts_ip = ts_status.get("Self", {}).get("TailscaleIPs", ["?"])[0]
-                console.print(f"  [green]✓[/green] Tailscale connected ({ts_ip})")
-            else:
-                console.print("  [red]✗[/red] Tailscale not connected — run: tailscale up")
-                all_ok = False
-        else:
-            console.print("  [red]✗[/red] Tailscale not running — run: tailscale up")
-            all_ok = False
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        console.print("  [red]✗[/red] Tailscale not available")
-        all_ok = False
+@app.command()
+def doctor(
+    deep: bool = typer.Option(
+        False, "--deep", help="Also time provider, GitHub, Mutagen and disk round trips"
+    ),
+) -> None:
+    """Check system prerequisites and configuration."""
+    from . import doctor as doctor_mod
 
-    # Check mutagen daemon
-    try:
-        result = subprocess.run(  # nosec B603, B607
-            ["mutagen", "daemon", "status"],
-            capture_output=True,
-            text=True,
-            timeout=5,
+    # Loading config ensures .env files are loaded
+    config = get_config()
+
+    checks = doctor_mod.standard_checks()
+    if deep:
+        checks += doctor_mod.deep_checks(
+            config.provider, Path(config.local.workspace_dir).expanduser()
         )
-        if "running" in result.stdout.lower() or result.returncode == 0:
-            console.print("  [green]✓[/green] Mutagen daemon running")
-        else:
-            console.print(
-                "  [yellow]![/yellow] Mutagen daemon not running — run: mutagen daemon start"
-            )
-            all_ok = False
-    except subprocess.TimeoutExpired:
-        console.print("  [yellow]![/yellow] Mutagen daemon status check timed out")
-        all_ok = False
-    except FileNotFoundError:
-        pass  # Already reported as missing tool above
-
-    # Check environment variables (already loaded from .env by CONFIG)
-    console.print("\n[bold]Checking environment...[/bold]\n")
-
-    env_vars = [
-        ("OCAPTAIN_TAILSCALE_OAUTH_SECRET", True),
-        ("CLAUDE_CODE_OAUTH_TOKEN", True),
-        ("GH_TOKEN", False),  # Optional
-    ]
-
-    for var, required in env_vars:
-        value = os.environ.get(var)
-
-        if value:
-            masked = value[:12] + "..." if len(value) > 15 else "***"
-            console.print(f"  [green]✓[/green] {var} ({masked})")
-        elif required:
-            console.print(f"  [red]✗[/red] {var} — required")
-            all_ok = False
-        else:
-            console.print(f"  [yellow]![/yellow] {var} — optional, not set")
+    results = doctor_mod.run_checks(checks)
+
+    marks = {
+        doctor_mod.OK: "[green]✓[/green]",
+        doctor_mod.WARN: "[yellow]![/yellow]",
+        doctor_mod.FAIL: "[red]✗[/red]",
+    }
+    titles = {
+        "prerequisites": "Checking prerequisites...",
+        "environment": "Checking environment...",
+        "deep": "Timing dependencies...",
+    }
+    for section, title in titles.items():
+        section_results = [r for r in results if r.section == section]
+        if not section_results:
+            continue
+        console.print(f"\n[bold]{title}[/bold]\n")
+        for r in section_results:
+            latency = f" [dim]({r.seconds * 1000:.0f} ms)[/dim]" if r.seconds >= 0.001 else ""
+            console.print(f"  {marks[r.status]} {r.name} — {r.detail}{latency}")
+
+    if deep:
+        slowest = max(results, key=lambda r: r.seconds)
+        console.print(f"\nSlowest: {slowest.name} ({slowest.seconds:.2f}s)")
 
     # Summary
     console.print()
-    if all_ok:
+    if all(r.status != doctor_mod.FAIL for r in results):
         console.print("[green]All systems ready. You may set sail![/green]")
     else:
         console.print("[red]Some issues found. Please address them before sailing.[/red]")
@@ -540,23 +1185,70 @@ def doctor() -> None:
 
 
 @app.command()
-def telemetry_start() -> None:
+def telemetry_start(
+    builtin: bool = typer.Option(
+        False, "--builtin", help="Use the built-in receiver instead of otlp2parquet"
+    ),
+) -> None:
     """Start the local telemetry collector."""
+    import os
+    import sys
     from importlib.resources import as_file, files
 
+    env = {**os.environ, "OCAPTAIN_OTLP_PORT": str(CONFIG.local.otlp_port)}
+    if builtin:
+        from .telemetry import require_pyarrow
+
+        try:
+            require_pyarrow()
+        except RuntimeError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from None
+        env["OCAPTAIN_RECEIVER_PYTHON"] = sys.executable
+
     script = files("ocaptain.scripts").joinpath("start-telemetry.sh")
     with as_file(script) as script_path:
-        subprocess.run(["bash", str(script_path)], check=True)  # nosec: B603, B607
+        subprocess.run(["bash", str(script_path)], check=True, env=env)  # nosec: B603, B607
 
 
 @app.command()
 def telemetry_stop() -> None:
     """Stop the local telemetry collector."""
+    import os
     from importlib.resources import as_file, files
 
+    env = {**os.environ, "OCAPTAIN_OTLP_PORT": str(CONFIG.local.otlp_port)}
     script = files("ocaptain.scripts").joinpath("stop-telemetry.sh")
     with as_file(script) as script_path:
-        subprocess.run(["bash", str(script_path)], check=True)  # nosec: B603, B607
+        subprocess.run(["bash", str(script_path)], check=True, env=env)  # nosec: B603, B607
+
+
+@app.command()
+def telemetry_compact(
+    min_age: float = typer.Option(
+        60, "--min-age", help="Leave collector files younger than this many seconds"
+    ),
+) -> None:
+    """Merge small telemetry files into voyage/ship/date partitions."""
+    _compact_telemetry(min_age)
+
+
+def _compact_telemetry(min_age: float) -> None:
+    from .telemetry import compact, telemetry_dir
+
+    root = telemetry_dir()
+    if not root.exists():
+        console.print(f"[yellow]No telemetry found in {root}[/yellow]")
+        return
+    try:
+        result = compact(root, min_age=min_age)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+    console.print(
+        f"[green]✓[/green] Compacted {result.files} files ({result.rows:,} rows) "
+        f"into {result.partitions} partitions."
+    )
 
 
 # Helper functions
@@ -607,11 +1299,12 @@ def _parse_ship_index(ship_id: str) -> int:
 
 def _format_age(dt: datetime) -> str:
     """Format datetime as human-readable age."""
-    from datetime import UTC, datetime
+    return _format_duration((datetime.now(UTC) - dt).total_seconds())
 
-    delta = datetime.now(UTC) - dt
-    minutes = int(delta.total_seconds() / 60)
 
+def _format_duration(seconds: float) -> str:
+    """Format a duration in seconds as a compact human-readable string."""
+    minutes = int(seconds / 60)
     if minutes < 1:
         return "<1m"
     elif minutes < 60:
@@ -621,6 +1314,33 @@ def _format_age(dt: datetime) -> str:
         return f"{hours}h{minutes % 60}m"
 
 
+def _format_rate(tasks_per_hour: float | None) -> str:
+    """Format a completion rate."""
+    if tasks_per_hour is None:
+        return "—"
+    return f"{tasks_per_hour:.1f}/h"
+
+
+def _lifetime_rate(voyage_status: tasks_mod.VoyageStatus) -> float | None:
+    """Average completed tasks per hour since the voyage was created."""
+    created = datetime.fromisoformat(voyage_status.voyage.created_at)
+    hours = (datetime.now(UTC) - created).total_seconds() / 3600
+    if hours <= 0 or not voyage_status.tasks_complete:
+        return None
+    return voyage_status.tasks_complete / hours
+
+
+def _log_age(logs_dir: Path | None, ship_id: str) -> str:
+    """Age of a ship's last log write."""
+    if logs_dir is None:
+        return "—"
+    try:
+        mtime = (logs_dir / f"{ship_id}.log").stat().st_mtime
+    except OSError:
+        return "—"
+    return _format_duration(datetime.now().timestamp() - mtime) + " ago"
+
+
 def _validate_plan_dir(plan_dir: Path) -> list[str]:
     """Validate plan directory has required artifacts. Returns list of errors."""
     errors = []
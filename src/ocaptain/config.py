@@ -5,7 +5,7 @@ import logging
 import os
 import subprocess  # nosec: B404
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, cast
 
 from pydantic import BaseModel, Field
 
@@ -16,7 +16,7 @@ class TailscaleConfig(BaseModel):
     """Tailscale configuration for ship networking."""
 
     oauth_secret: str | None = None  # OCAPTAIN_TAILSCALE_OAUTH_SECRET
-    ip: str | None = None  # Auto-detected or manual override
+    ip: str | None = None  # Manual override; see tailscale_ip()
     ship_tag: str = "tag:ocaptain-ship"  # Tag applied to ships for ACL isolation
 
 
@@ -40,41 +40,12 @@ class OcaptainConfig(BaseModel):
     local: LocalStorageConfig = LocalStorageConfig()
 
 
-def _find_tailscale() -> str | None:
-    """Find tailscale binary, including macOS app bundle."""
-    import shutil
-
-    # Check standard PATH
-    if path := shutil.which("tailscale"):
-        return path
-
-    # Check macOS app bundle
-    macos_path = "/Applications/Tailscale.app/Contents/MacOS/Tailscale"
-    if Path(macos_path).exists():
-        return macos_path
-
-    return None
-
-
 def _get_tailscale_ip() -> str | None:
-    """Auto-detect tailscale IP if available."""
-    tailscale = _find_tailscale()
-    if not tailscale:
-        return None
+    """This machine's Tailscale IP, if it's connected (cached, see tailscale.py)."""
+    from . import tailscale
 
-    try:
-        result = subprocess.run(  # nosec: B603, B607
-            [tailscale, "ip", "-4"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=False,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    return None
+    current = tailscale.status()
+    return current.ip if current and current.online else None
 
 
 def _load_dotenv_files() -> None:
@@ -118,11 +89,6 @@ def load_config() -> OcaptainConfig:
     if oauth_secret := os.environ.get("OCAPTAIN_TAILSCALE_OAUTH_SECRET"):
         data.setdefault("tailscale", {})["oauth_secret"] = oauth_secret
 
-    # Auto-detect tailscale IP if not set
-    tailscale_data = data.get("tailscale", {})
-    if not tailscale_data.get("ip") and (detected_ip := _get_tailscale_ip()):
-        data.setdefault("tailscale", {})["ip"] = detected_ip
-
     # Set default user to current user
     local_data = data.get("local", {})
     if not local_data.get("user"):
@@ -185,5 +151,34 @@ def get_ssh_keypair() -> tuple[str, str]:
     return private_key_path.read_text(), public_key_path.read_text()
 
 
-# Global config (loaded once)
-CONFIG = load_config()
+_config: OcaptainConfig | None = None
+
+
+def get_config() -> OcaptainConfig:
+    """The global config, loaded (with .env files) on first use."""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def tailscale_ip() -> str | None:
+    """The laptop's Tailscale IP: the configured override, else auto-detected.
+
+    Detection reads Tailscale status (cached for a short TTL), so it's only
+    done by commands that need the IP: sail and ship bootstrap.
+    """
+    if configured := CONFIG.tailscale.ip:
+        return configured
+    return _get_tailscale_ip()
+
+
+class _LazyConfig:
+    """Stands in for the global config until an attribute is first read."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+
+# Global config (loaded on first attribute access, so importing is cheap)
+CONFIG = cast(OcaptainConfig, _LazyConfig())
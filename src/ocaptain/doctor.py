@@ -0,0 +1,214 @@
+"""Prerequisite and latency checks behind `ocaptain doctor`.
+
+Each check is a small function returning (status, detail); run_checks()
+runs them concurrently and times each one, so the slowest dependency
+(provider API, tailnet, GitHub, Mutagen, disk) stands out before sailing.
+"""
+
+import importlib.util
+import os
+import shutil
+import socket
+import subprocess  # nosec: B404
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+OK, WARN, FAIL = "ok", "warn", "fail"
+CHECK_TIMEOUT = 10
+
+# Control endpoint each provider's CLI talks to, for the network round trip
+PROVIDER_ENDPOINTS = {"exedev": ("exe.dev", 22), "sprites": ("api.sprites.dev", 443)}
+GITHUB_API = "https://api.github.com/rate_limit"
+DISK_PROBE_BYTES = 64 * 1024 * 1024
+
+TOOLS = [
+    ("tailscale", "brew install tailscale (or https://tailscale.com/download)"),
+    ("mutagen", "brew install mutagen-io/mutagen/mutagen"),
+    ("otlp2parquet", "cargo install otlp2parquet (or GitHub releases)"),
+]
+
+# (variable, required)
+ENV_VARS = [
+    ("OCAPTAIN_TAILSCALE_OAUTH_SECRET", True),
+    ("CLAUDE_CODE_OAUTH_TOKEN", True),
+    ("GH_TOKEN", False),
+]
+
+
+@dataclass
+class Check:
+    """A named check in a report section."""
+
+    section: str
+    name: str
+    run: Callable[[], tuple[str, str]]
+
+
+@dataclass
+class CheckResult:
+    section: str
+    name: str
+    status: str  # OK, WARN or FAIL
+    detail: str
+    seconds: float
+
+
+def find_tool(name: str) -> str | None:
+    """Find a tool, including the Tailscale macOS app bundle."""
+    if name == "tailscale":
+        from .tailscale import find_tailscale
+
+        return find_tailscale()
+    return shutil.which(name)
+
+
+def _run(cmd: list[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # nosec: B603
+        cmd, capture_output=True, text=True, timeout=CHECK_TIMEOUT, check=False
+    )
+
+
+def check_tool(tool: str, install_hint: str) -> tuple[str, str]:
+    if path := find_tool(tool):
+        return OK, path
+    if tool == "otlp2parquet" and importlib.util.find_spec("pyarrow"):
+        return WARN, "not installed; use: ocaptain telemetry-start --builtin"
+    return FAIL, install_hint
+
+
+def check_tailscale() -> tuple[str, str]:
+    from . import tailscale
+
+    # A fresh query, so the latency is real; it also refreshes the shared cache
+    ts_status = tailscale.status(refresh=True)
+    if ts_status is None:
+        return FAIL, "not running — run: tailscale up"
+    if not ts_status.online:
+        return FAIL, "not connected — run: tailscale up"
+    tags = f", {', '.join(ts_status.tags)}" if ts_status.tags else ""
+    return OK, f"connected ({ts_status.ip}{tags}, {len(ts_status.peers)} peers)"
+
+
+def check_mutagen_daemon() -> tuple[str, str]:
+    if not find_tool("mutagen"):
+        return WARN, "mutagen not installed"
+    result = _run(["mutagen", "daemon", "status"])
+    if "running" in result.stdout.lower() or result.returncode == 0:
+        return OK, "running"
+    return FAIL, "not running — run: mutagen daemon start"
+
+
+def check_env(var: str, required: bool) -> tuple[str, str]:
+    if value := os.environ.get(var):
+        return OK, value[:12] + "..." if len(value) > 15 else "***"
+    return (FAIL, "required") if required else (WARN, "optional, not set")
+
+
+def check_provider_list() -> tuple[str, str]:
+    from .provider import get_provider
+
+    vms = get_provider().list()
+    return OK, f"{len(vms)} VMs"
+
+
+def check_provider_rtt(provider_name: str) -> tuple[str, str]:
+    """TCP connect time to the provider's control endpoint."""
+    if provider_name not in PROVIDER_ENDPOINTS:
+        return WARN, f"no endpoint known for provider {provider_name!r}"
+    host, port = PROVIDER_ENDPOINTS[provider_name]
+    start = time.perf_counter()
+    with socket.create_connection((host, port), timeout=CHECK_TIMEOUT):
+        elapsed = time.perf_counter() - start
+    return OK, f"{host}:{port} connect {elapsed * 1000:.0f} ms"
+
+
+def check_github() -> tuple[str, str]:
+    request = urllib.request.Request(GITHUB_API, headers={"Accept": "application/json"})
+    if token := os.environ.get("GH_TOKEN"):
+        request.add_header("Authorization", f"Bearer {token}")
+    try:
+        with urllib.request.urlopen(request, timeout=CHECK_TIMEOUT) as response:  # nosec: B310
+            remaining = response.headers.get("X-RateLimit-Remaining", "?")
+    except urllib.error.HTTPError as e:
+        return FAIL, f"HTTP {e.code}"
+    return OK, f"reachable ({remaining} requests left this hour)"
+
+
+def check_mutagen_sessions() -> tuple[str, str]:
+    """Time a round trip through the Mutagen daemon."""
+    if not find_tool("mutagen"):
+        return WARN, "mutagen not installed"
+    result = _run(["mutagen", "sync", "list"])
+    if result.returncode != 0:
+        lines = (result.stderr or result.stdout).strip().splitlines()
+        return FAIL, lines[-1] if lines else f"exit {result.returncode}"
+    sessions = result.stdout.count("Name:")
+    return OK, f"responsive ({sessions} sync sessions)"
+
+
+def check_disk(directory: Path, size: int = DISK_PROBE_BYTES) -> tuple[str, str]:
+    """Time writing (and fsyncing) a probe file under directory.
+
+    Only writes are measured: reading the file straight back would be served
+    from the page cache, not the disk.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    block = os.urandom(1024 * 1024)
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=".doctor-") as f:
+        start = time.perf_counter()
+        for _ in range(size // len(block)):
+            f.write(block)
+        f.flush()
+        os.fsync(f.fileno())
+        write_seconds = time.perf_counter() - start
+
+    mb = size / (1024 * 1024)
+    return OK, f"{directory}: write {mb / max(write_seconds, 1e-9):.0f} MB/s (fsynced)"
+
+
+def standard_checks() -> list[Check]:
+    checks = [Check("prerequisites", tool, partial(check_tool, tool, hint)) for tool, hint in TOOLS]
+    checks += [
+        Check("prerequisites", "Tailscale", check_tailscale),
+        Check("prerequisites", "Mutagen daemon", check_mutagen_daemon),
+    ]
+    checks += [
+        Check("environment", var, partial(check_env, var, required)) for var, required in ENV_VARS
+    ]
+    return checks
+
+
+def deep_checks(provider_name: str, workspace: Path) -> list[Check]:
+    return [
+        Check("deep", "provider.list()", check_provider_list),
+        Check("deep", f"{provider_name} round trip", partial(check_provider_rtt, provider_name)),
+        Check("deep", "GitHub API", check_github),
+        Check("deep", "Mutagen sessions", check_mutagen_sessions),
+        Check("deep", "Disk write throughput", partial(check_disk, workspace)),
+    ]
+
+
+def _timed(check: Check) -> CheckResult:
+    start = time.perf_counter()
+    try:
+        status, detail = check.run()
+    except subprocess.TimeoutExpired:
+        status, detail = FAIL, f"timed out after {CHECK_TIMEOUT}s"
+    except Exception as e:
+        status, detail = FAIL, f"{type(e).__name__}: {e}"
+    return CheckResult(check.section, check.name, status, detail, time.perf_counter() - start)
+
+
+def run_checks(checks: list[Check], max_workers: int = 16) -> list[CheckResult]:
+    """Run checks concurrently; results come back in the order given."""
+    if not checks:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(checks))) as pool:
+        return list(pool.map(_timed, checks))
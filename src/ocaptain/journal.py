@@ -0,0 +1,340 @@
+"""Append-only journal of task transitions and the voyage report built from it."""
+
+import json
+import logging
+import sqlite3
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .tasks import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE = "journal.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transitions (
+    at REAL NOT NULL,
+    task_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    old_status TEXT,
+    new_status TEXT,
+    old_owner TEXT,
+    new_owner TEXT
+);
+CREATE INDEX IF NOT EXISTS transitions_task ON transitions (task_id, at);
+CREATE TABLE IF NOT EXISTS task_state (
+    task_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    owner TEXT,
+    blocked_by TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One observed change to a task.
+
+    kind is "appeared", "status", "owner" or "disappeared". Status rows also
+    carry the owner before and after, since claims change both at once.
+    """
+
+    at: float
+    task_id: str
+    kind: str
+    old_status: str | None
+    new_status: str | None
+    old_owner: str | None
+    new_owner: str | None
+
+
+def _event_time(task: Task, observed: float) -> float:
+    """Best known time for a task's latest change: its own timestamps, else observed."""
+    if task.status == TaskStatus.COMPLETED and task.completed_at:
+        return task.completed_at.timestamp()
+    if task.status == TaskStatus.IN_PROGRESS and task.claimed_at:
+        return task.claimed_at.timestamp()
+    return observed
+
+
+class TaskJournal:
+    """SQLite journal of task transitions, stored in the voyage directory.
+
+    record() diffs the current task list against the last recorded state and
+    appends a row per change, so it is safe to call from every poll of any
+    process watching the voyage.
+    """
+
+    def __init__(self, voyage_dir: Path) -> None:
+        self.path = voyage_dir / JOURNAL_FILE
+        self._db = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._state: dict[str, tuple[str, str | None, str]] = {}
+        self._data_version = -1
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _sync_state(self) -> None:
+        """Reload the last recorded state if another process wrote since we read it."""
+        data_version = self._db.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return
+        self._state = {
+            row[0]: (row[1], row[2], row[3])
+            for row in self._db.execute("SELECT task_id, status, owner, blocked_by FROM task_state")
+        }
+        self._data_version = data_version
+
+    def record(self, tasks: Iterable[Task], now: float | None = None) -> int:
+        """Append transitions between the recorded state and `tasks`. Returns rows added."""
+        observed = now if now is not None else time.time()
+        rows: list[tuple[float, str, str, str | None, str | None, str | None, str | None]] = []
+        upserts: list[tuple[str, str, str | None, str]] = []
+
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._sync_state()
+            seen: set[str] = set()
+
+            for task in tasks:
+                seen.add(task.id)
+                status, owner = task.status.value, task.assignee
+                blocked_by = json.dumps(task.blocked_by)
+                old = self._state.get(task.id)
+
+                if old is None:
+                    at = task.created.timestamp() if task.created else _event_time(task, observed)
+                    rows.append((at, task.id, "appeared", None, status, None, owner))
+                elif old[0] != status:
+                    at = _event_time(task, observed)
+                    rows.append((at, task.id, "status", old[0], status, old[1], owner))
+                elif old[1] != owner:
+                    rows.append((observed, task.id, "owner", status, status, old[1], owner))
+                elif old[2] == blocked_by:
+                    continue
+                upserts.append((task.id, status, owner, blocked_by))
+
+            gone = self._state.keys() - seen
+            for task_id in gone:
+                old_status, old_owner, _ = self._state[task_id]
+                rows.append((observed, task_id, "disappeared", old_status, None, old_owner, None))
+
+            self._db.executemany("INSERT INTO transitions VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.executemany("INSERT OR REPLACE INTO task_state VALUES (?, ?, ?, ?)", upserts)
+            self._db.executemany("DELETE FROM task_state WHERE task_id = ?", [(t,) for t in gone])
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            self._data_version = -1
+            raise
+
+        for task_id, status, owner, blocked_by in upserts:
+            self._state[task_id] = (status, owner, blocked_by)
+        for task_id in gone:
+            del self._state[task_id]
+        return len(rows)
+
+    def transitions(self) -> list[Transition]:
+        """All recorded transitions, oldest first."""
+        cursor = self._db.execute("SELECT * FROM transitions ORDER BY at, rowid")
+        return [Transition(*row) for row in cursor]
+
+    def blockers(self) -> dict[str, list[str]]:
+        """Last recorded blockedBy list for every task still present."""
+        self._sync_state()
+        return {task_id: json.loads(state[2]) for task_id, state in self._state.items()}
+
+
+def open_journal(voyage_dir: Path) -> TaskJournal | None:
+    """Open the voyage's journal, or None (with a warning) if it can't be opened."""
+    try:
+        return TaskJournal(voyage_dir)
+    except sqlite3.Error as e:
+        logger.warning("Task journal unavailable in %s: %s", voyage_dir, e)
+        return None
+
+
+# --- Report ---
+
+
+@dataclass
+class TaskTimeline:
+    """Lifecycle of one task, reconstructed from the journal."""
+
+    task_id: str
+    appeared_at: float | None = None
+    claims: list[tuple[float, str | None]] = field(default_factory=list)
+    completed_at: float | None = None
+    completed_by: str | None = None
+    rework: int = 0
+
+    @property
+    def cycle_time(self) -> float | None:
+        """Seconds from the last claim to completion."""
+        if self.completed_at is None or not self.claims:
+            return None
+        return max(0.0, self.completed_at - self.claims[-1][0])
+
+
+def build_timelines(transitions: Iterable[Transition]) -> dict[str, TaskTimeline]:
+    """Fold journal rows into per-task timelines."""
+    timelines: dict[str, TaskTimeline] = {}
+    for t in transitions:
+        timeline = timelines.setdefault(t.task_id, TaskTimeline(t.task_id))
+        if t.kind == "appeared":
+            timeline.appeared_at = t.at
+        elif t.kind == "disappeared":
+            continue
+        elif t.kind == "owner":
+            if t.new_status == TaskStatus.IN_PROGRESS.value and t.new_owner:
+                timeline.claims.append((t.at, t.new_owner))
+            continue
+        elif (
+            t.old_status in (TaskStatus.IN_PROGRESS.value, TaskStatus.COMPLETED.value)
+            and t.new_status != TaskStatus.COMPLETED.value
+        ):
+            # Claimed or finished work going backwards is rework
+            timeline.rework += 1
+            timeline.completed_at = timeline.completed_by = None
+
+        if t.new_status == TaskStatus.IN_PROGRESS.value:
+            timeline.claims.append((t.at, t.new_owner))
+        elif t.new_status == TaskStatus.COMPLETED.value:
+            timeline.completed_at = t.at
+            last_owner = timeline.claims[-1][1] if timeline.claims else None
+            timeline.completed_by = t.new_owner or last_owner
+    return timelines
+
+
+def dag_layers(blockers: dict[str, list[str]]) -> dict[str, int]:
+    """Depth of each task in the dependency DAG (0 = no blockers). Cycles are ignored."""
+    layers: dict[str, int] = {}
+    for root in blockers:
+        stack = [root]
+        visiting: set[str] = set()
+        while stack:
+            task_id = stack[-1]
+            if task_id in layers:
+                stack.pop()
+                continue
+            visiting.add(task_id)
+            deps = blockers[task_id]
+            todo = [b for b in deps if b in blockers and b not in layers and b not in visiting]
+            if todo:
+                stack.extend(todo)
+                continue
+            layers[task_id] = 1 + max((layers[b] for b in deps if b in layers), default=-1)
+            visiting.discard(task_id)
+            stack.pop()
+    return layers
+
+
+def _mean(values: list[float]) -> float | None:
+    return sum(values) / len(values) if values else None
+
+
+def _per_hour(count: int, start: float | None, end: float | None) -> float | None:
+    if not count or start is None or end is None or end <= start:
+        return None
+    return count / ((end - start) / 3600)
+
+
+@dataclass(frozen=True)
+class ShipReport:
+    ship: str
+    completed: int
+    cycle_time: float | None  # mean seconds, claim to completion
+    tasks_per_hour: float | None
+
+
+@dataclass(frozen=True)
+class LayerReport:
+    layer: int
+    tasks: int
+    completed: int
+    queue_wait: float | None  # mean seconds from ready to first claim
+    tasks_per_hour: float | None
+
+
+@dataclass(frozen=True)
+class VoyageReport:
+    ships: list[ShipReport]
+    layers: list[LayerReport]
+    completed: int
+    cycle_time: float | None
+    queue_wait: float | None
+    reworked_tasks: int
+    rework: int
+
+
+def _queue_wait(
+    timeline: TaskTimeline, blockers: list[str], done: dict[str, float]
+) -> float | None:
+    """Seconds between a task becoming claimable and its first claim."""
+    if not timeline.claims or timeline.appeared_at is None:
+        return None
+    ready_at = max([timeline.appeared_at, *(done[b] for b in blockers if b in done)])
+    return max(0.0, timeline.claims[0][0] - ready_at)
+
+
+def build_report(journal: TaskJournal) -> VoyageReport:
+    """Throughput per ship and per DAG layer, queue wait, cycle time and rework."""
+    timelines = build_timelines(journal.transitions())
+    blockers = journal.blockers()
+    layers = dag_layers(blockers)
+    done = {t.task_id: t.completed_at for t in timelines.values() if t.completed_at is not None}
+    waits = {
+        task_id: _queue_wait(t, blockers.get(task_id, []), done) for task_id, t in timelines.items()
+    }
+
+    by_ship: dict[str, list[TaskTimeline]] = defaultdict(list)
+    for timeline in timelines.values():
+        if timeline.completed_at is not None and timeline.completed_by:
+            by_ship[timeline.completed_by].append(timeline)
+    ships = [
+        ShipReport(
+            ship=ship,
+            completed=len(done_tasks),
+            cycle_time=_mean([c for t in done_tasks if (c := t.cycle_time) is not None]),
+            tasks_per_hour=_per_hour(
+                len(done_tasks),
+                min((t.claims[0][0] for t in done_tasks if t.claims), default=None),
+                max(t.completed_at for t in done_tasks if t.completed_at is not None),
+            ),
+        )
+        for ship, done_tasks in sorted(by_ship.items())
+    ]
+
+    by_layer: dict[int, list[TaskTimeline]] = defaultdict(list)
+    for task_id, timeline in timelines.items():
+        if task_id in layers:
+            by_layer[layers[task_id]].append(timeline)
+    layer_reports = []
+    for layer, members in sorted(by_layer.items()):
+        finished = [t.completed_at for t in members if t.completed_at is not None]
+        first_claim = min((t.claims[0][0] for t in members if t.claims), default=None)
+        layer_reports.append(
+            LayerReport(
+                layer=layer,
+                tasks=len(members),
+                completed=len(finished),
+                queue_wait=_mean([w for t in members if (w := waits[t.task_id]) is not None]),
+                tasks_per_hour=_per_hour(len(finished), first_claim, max(finished, default=None)),
+            )
+        )
+
+    return VoyageReport(
+        ships=ships,
+        layers=layer_reports,
+        completed=len(done),
+        cycle_time=_mean([c for t in timelines.values() if (c := t.cycle_time) is not None]),
+        queue_wait=_mean([w for w in waits.values() if w is not None]),
+        reworked_tasks=sum(1 for t in timelines.values() if t.rework),
+        rework=sum(t.rework for t in timelines.values()),
+    )
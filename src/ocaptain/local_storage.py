@@ -1,5 +1,8 @@
 """Local storage management for voyages."""
 
+import os
+import time
+from collections.abc import Iterable
 from pathlib import Path
 
 from . import config
@@ -11,6 +14,20 @@ def get_voyage_dir(voyage_id: str) -> Path:
     return workspace / voyage_id
 
 
+def list_voyage_dirs() -> list[Path]:
+    """All local voyage directories (those with a voyage.json), sorted by name."""
+    workspace = Path(config.CONFIG.local.workspace_dir).expanduser()
+    try:
+        entries = list(os.scandir(workspace))
+    except OSError:
+        return []
+    return sorted(
+        Path(e.path)
+        for e in entries
+        if e.name.startswith("voyage-") and os.path.exists(os.path.join(e.path, "voyage.json"))
+    )
+
+
 def setup_local_voyage(voyage_id: str, task_list_id: str) -> Path:
     """Set up local directory structure for a voyage.
 
@@ -25,3 +42,35 @@ def setup_local_voyage(voyage_id: str, task_list_id: str) -> Path:
     (voyage_dir / ".claude" / "tasks" / task_list_id).mkdir(parents=True, exist_ok=True)
 
     return voyage_dir
+
+
+def stat_snapshot(dirs: Iterable[Path]) -> dict[str, tuple[int, int]]:
+    """Map every file directly inside `dirs` to its (mtime_ns, size)."""
+    snapshot: dict[str, tuple[int, int]] = {}
+    for directory in dirs:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def wait_for_change(dirs: list[Path], timeout: float, poll_interval: float = 0.25) -> bool:
+    """Block until a file in `dirs` is added, removed or modified, or `timeout` passes.
+
+    Polls directory listings (cheap scandir/stat calls) rather than relying on
+    inotify, which isn't available on macOS. Returns True if a change was seen.
+    """
+    before = stat_snapshot(dirs)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(min(poll_interval, max(deadline - time.monotonic(), 0)))
+        if stat_snapshot(dirs) != before:
+            return True
+    return False
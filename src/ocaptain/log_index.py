@@ -0,0 +1,303 @@
+"""Searchable index of cleaned ship log records.
+
+Raw ship logs are Claude TUI output: ANSI escapes, carriage-return redraws and
+whole screens repeated on every refresh. Ingestion turns the new bytes of each
+local logs/ship-N.log into plain, timestamped records (with TUI redraws
+deduplicated) stored in logs/index.db, so searches by ship, time range and
+regex read only the matching rows instead of scanning every log file.
+"""
+
+import contextlib
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+INDEX_FILE = "index.db"
+
+# CSI sequences, OSC sequences (BEL or ST terminated), and two-byte escapes
+_ANSI = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]")
+_CONTROL = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+# Per-line epoch time written by the ship's log-rotate.py (TIME_MARK there)
+_TIME_MARK = re.compile(rb"\x1b\]ocaptain;ts=([\d.]+)\x07")
+# "[ship-N] Starting at <iso>" / "[ship-N] Exit <code> at <iso>" written by tmux.py
+_ANCHOR = re.compile(r"^\[ship-\d+\] (?:Starting|Exit -?\d+) at (\S+)")
+# Carriage returns and cursor movement: the line was drawn by the TUI
+_REDRAW = re.compile(r"\r(?!$)|\x1b\[[0-9;?]*[ABCDEFGHJKSTf]")
+# Redrawn lines repeated within this many distinct recent ones are dropped
+_DEDUPE_WINDOW = 512
+_LOG_NAME = re.compile(r"^(ship-\d+)\.log$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    ship TEXT NOT NULL,
+    ts REAL NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_ship_ts ON records (ship, ts);
+CREATE INDEX IF NOT EXISTS records_ts ON records (ts);
+CREATE TABLE IF NOT EXISTS sources (
+    ship TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    ship TEXT NOT NULL,
+    inode INTEGER NOT NULL,
+    first_rowid INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS segments_ship ON segments (ship, first_rowid);
+"""
+
+
+def clean_line(raw: str) -> str:
+    """Strip ANSI escapes and control characters, keeping what a terminal would show last."""
+    # A carriage return redraws the line; only the final overwrite is visible
+    visible = raw.rsplit("\r", 1)[-1] if "\r" in raw.rstrip("\r") else raw
+    return _CONTROL.sub("", _ANSI.sub("", visible)).rstrip()
+
+
+def strip_time_marks(raw: bytes) -> bytes:
+    """Remove the ship's per-line TIME_MARK escapes, leaving the line as written."""
+    return _TIME_MARK.sub(b"", raw)
+
+
+_DURATION = re.compile(r"(\d+)([smhd])")
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+
+
+def parse_duration(spec: str) -> timedelta:
+    """Parse a duration such as "90s", "30m", "2h" or "1d"."""
+    if not (match := _DURATION.fullmatch(spec.strip())):
+        raise ValueError(f"Invalid duration: {spec!r} (use e.g. 30m, 2h, 1d)")
+    return timedelta(**{_UNITS[match.group(2)]: int(match.group(1))})
+
+
+def parse_time(spec: str, now: datetime | None = None) -> datetime:
+    """Parse a relative age ("90s", "30m", "2h", "1d") or an ISO timestamp."""
+    if _DURATION.fullmatch(spec.strip()):
+        return (now or datetime.now(UTC)) - parse_duration(spec)
+    try:
+        dt = datetime.fromisoformat(spec)
+    except ValueError:
+        raise ValueError(
+            f"Invalid time: {spec!r} (use e.g. 30m, 2h, 1d or an ISO timestamp)"
+        ) from None
+    return dt if dt.tzinfo else dt.astimezone(UTC)
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    ship: str
+    ts: float
+    text: str
+
+
+def _regexp(pattern: str, text: str) -> bool:
+    return _compiled(pattern).search(text) is not None
+
+
+_PATTERNS: dict[str, re.Pattern[str]] = {}
+
+
+def _compiled(pattern: str) -> re.Pattern[str]:
+    if pattern not in _PATTERNS:
+        _PATTERNS[pattern] = re.compile(pattern)
+    return _PATTERNS[pattern]
+
+
+class LogIndex:
+    """SQLite index over the cleaned records of a voyage's local ship logs.
+
+    A record's time is the TIME_MARK the ship's log writer put on its line.
+    Unmarked lines (logs written by plain `tee`, or echoed into the log) take
+    the previous mark in the same batch, the time in a "[ship-N]
+    Starting/Exit at" line itself, or else the time they were ingested.
+
+    Only lines drawn by the TUI (carriage returns, cursor movement) are
+    deduplicated; repeated plain output is kept so searches find every one.
+
+    Records remember which local file they came from, and are dropped once
+    the collector's rotation has deleted that file, so the index holds no
+    more than the local logs do.
+    """
+
+    def __init__(self, logs_dir: Path) -> None:
+        self.logs_dir = logs_dir
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        # Transactions are explicit (BEGIN IMMEDIATE in _ingest_ship)
+        self._db = sqlite3.connect(logs_dir / INDEX_FILE, timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.create_function("regexp", 2, _regexp, deterministic=True)
+        # Recently indexed lines per ship, to drop redraws across batches
+        self._recent: dict[str, OrderedDict[str, None]] = {}
+
+    def close(self) -> None:
+        self._db.close()
+
+    def ingest(self, now: float | None = None) -> int:
+        """Index new output from every local ship log. Returns records added."""
+        try:
+            names = sorted(os.listdir(self.logs_dir))
+        except OSError:
+            return 0
+        added = 0
+        for name in names:
+            if match := _LOG_NAME.match(name):
+                added += self._ingest_ship(match.group(1), now or time.time())
+        return added
+
+    def _ingest_ship(self, ship: str, now: float) -> int:
+        path = self.logs_dir / f"{ship}.log"
+        try:
+            stat = path.stat()
+        except OSError:
+            return 0
+
+        # Reading the offset, inserting and advancing it in one write transaction
+        # keeps concurrent ingests (watch and logs --grep) from indexing a range twice
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            added = self._ingest_file(ship, path, stat, now)
+            self._prune(ship, path)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        return added
+
+    def _ingest_file(self, ship: str, path: Path, stat: os.stat_result, now: float) -> int:
+        row = self._db.execute(
+            "SELECT inode, offset FROM sources WHERE ship = ?", (ship,)
+        ).fetchone()
+        inode, offset = row if row else (stat.st_ino, 0)
+
+        added = 0
+        if inode != stat.st_ino or offset > stat.st_size:
+            # The collector rotated the log; finish the previous file first
+            rotated = path.with_name(f"{path.name}.1")
+            try:
+                if rotated.stat().st_ino == inode:
+                    rows, _ = self._read_records(ship, rotated, offset, now)
+                    self._db.executemany("INSERT INTO records VALUES (?, ?, ?)", rows)
+                    added += len(rows)
+            except OSError:
+                pass
+            inode, offset = stat.st_ino, 0
+
+        self._start_segment(ship, inode)
+        rows, offset = self._read_records(ship, path, offset, now)
+        self._db.executemany("INSERT INTO records VALUES (?, ?, ?)", rows)
+        self._db.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)", (ship, inode, offset))
+        return added + len(rows)
+
+    def _start_segment(self, ship: str, inode: int) -> None:
+        """Note where records from the local file with this inode begin."""
+        latest = self._db.execute(
+            "SELECT inode FROM segments WHERE ship = ? ORDER BY first_rowid DESC LIMIT 1", (ship,)
+        ).fetchone()
+        if latest and latest[0] == inode:
+            return
+        (first,) = self._db.execute("SELECT COALESCE(MAX(rowid), 0) + 1 FROM records").fetchone()
+        self._db.execute("INSERT INTO segments VALUES (?, ?, ?)", (ship, inode, first))
+
+    def _prune(self, ship: str, path: Path) -> None:
+        """Drop records from local files the collector's rotation has deleted."""
+        # Rotation shifts path to path.1, path.2, ... and deletes the oldest, so
+        # only the newest segments, one per local file, still have a file.
+        # (Inodes can't tell: a deleted file's inode is often reused.)
+        files = sum(1 for local in [path, *path.parent.glob(f"{path.name}.*")] if local.is_file())
+        segments = self._db.execute(
+            "SELECT first_rowid FROM segments WHERE ship = ? ORDER BY first_rowid", (ship,)
+        ).fetchall()
+        if len(segments) > max(files, 1):
+            (keep_from,) = segments[-max(files, 1)]
+            self._db.execute("DELETE FROM records WHERE ship = ? AND rowid < ?", (ship, keep_from))
+            self._db.execute(
+                "DELETE FROM segments WHERE ship = ? AND first_rowid < ?", (ship, keep_from)
+            )
+
+    def _read_records(
+        self, ship: str, path: Path, offset: int, now: float
+    ) -> tuple[list[tuple[str, float, str]], int]:
+        """Clean the complete lines after offset. Returns (record rows, new offset)."""
+        with path.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # leave a partial last line for next time
+        if not end:
+            return [], offset
+
+        recent = self._recent.setdefault(ship, OrderedDict())
+        rows: list[tuple[str, float, str]] = []
+        marked: float | None = None  # time of the last marked line in this batch
+        for raw_bytes in data[:end].split(b"\n"):
+            ts = marked
+            if mark := _TIME_MARK.search(raw_bytes):
+                with contextlib.suppress(ValueError):
+                    ts = marked = float(mark.group(1))
+                raw_bytes = strip_time_marks(raw_bytes)
+            raw = raw_bytes.decode("utf-8", errors="replace")
+            text = clean_line(raw)
+            if not text:
+                continue
+            if ts is None and (anchor := _ANCHOR.match(text)):
+                with contextlib.suppress(ValueError):
+                    ts = parse_time(anchor.group(1)).timestamp()
+            if _REDRAW.search(raw):
+                if text in recent:
+                    recent.move_to_end(text)
+                    continue
+                recent[text] = None
+                if len(recent) > _DEDUPE_WINDOW:
+                    recent.popitem(last=False)
+            rows.append((ship, now if ts is None else ts, text))
+        return rows, offset + end
+
+    def search(
+        self,
+        pattern: str | None = None,
+        ships: list[str] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+    ) -> Iterator[LogRecord]:
+        """Records matching all given filters, oldest first.
+
+        With a limit, the newest `limit` matches are returned (still oldest first).
+        """
+        if pattern is not None:
+            _compiled(pattern)  # raise re.error before querying
+        clauses: list[str] = []
+        params: list[str | float] = []
+        if ships:
+            clauses.append(f"ship IN ({', '.join('?' * len(ships))})")
+            params.extend(ships)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(until)
+        if pattern is not None:
+            clauses.append("text REGEXP ?")
+            params.append(pattern)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        if limit is not None:
+            query = (
+                f"SELECT * FROM (SELECT rowid, ship, ts, text FROM records {where} "
+                "ORDER BY ts DESC, rowid DESC LIMIT ?) ORDER BY ts, rowid"
+            )
+            params.append(limit)
+        else:
+            query = f"SELECT rowid, ship, ts, text FROM records {where} ORDER BY ts, rowid"
+
+        for _, ship, ts, text in self._db.execute(query, params):
+            yield LogRecord(ship, ts, text)
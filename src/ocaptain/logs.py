@@ -1,17 +1,32 @@
 """Log viewing and aggregation."""
 
+import asyncio
+import base64
+import contextlib
+import fcntl
+import json
+import logging
+import os
 import re
 import shlex
-import subprocess  # nosec B404
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from typing import Any, BinaryIO, TextIO
 
-from fabric import Connection
+from .provider import VM, Provider
+from .voyage import Voyage, _ship_index
 
-from .provider import VM
-from .voyage import Voyage
+logger = logging.getLogger(__name__)
 
 # Valid ship_id pattern: "ship-" followed by digits
 _SHIP_ID_PATTERN = re.compile(r"^ship-\d+$")
+_LOG_FILE = re.compile(r"^(ship-\d+)\.log$")
 
 
 def view_logs(
@@ -42,6 +57,8 @@ def view_logs(
     if grep:
         cmd = f"{cmd} | grep --color=always {shlex.quote(grep)}"
 
+    from fabric import Connection
+
     with Connection(storage.ssh_dest) as c:
         # Use pty=True for follow mode to handle Ctrl+C properly
         c.run(cmd, pty=follow)
@@ -65,10 +82,14 @@ def view_logs_local(
         print(f"No logs directory found: {logs_dir}")
         return
 
+    if follow:
+        follow_logs_local(voyage_dir, ship_id=ship_id, grep=grep, backlog=tail or 10)
+        return
+
     # Get log files
     if ship_id:
         log_files = [logs_dir / f"{ship_id}.log"]
-        if not log_files[0].exists():
+        if not _local_segments(log_files[0]):
             print(f"Log file not found: {log_files[0]}")
             return
     else:
@@ -77,20 +98,455 @@ def view_logs_local(
             print("No log files found")
             return
 
-    # Build command
-    file_paths = [str(f) for f in log_files]
+    from .log_index import strip_time_marks
 
-    if follow:
-        cmd = ["tail", "-f"] + file_paths
-    elif tail:
-        cmd = ["tail", "-n", str(tail)] + file_paths
-    else:
-        cmd = ["cat"] + file_paths
+    pattern = re.compile(grep.encode()) if grep else None
+    out = sys.stdout.buffer
+    for log_file in log_files:
+        if len(log_files) > 1 and tail:
+            out.write(f"==> {log_file} <==\n".encode())
+        lines: Iterable[bytes] = map(strip_time_marks, _read_lines(_local_segments(log_file)))
+        if pattern:
+            lines = (line for line in lines if pattern.search(line))
+        if tail:
+            lines = deque(lines, maxlen=tail)
+        out.writelines(lines)
+    out.flush()
 
-    if grep:
-        # Use shell to pipe through grep
-        cmd_str = " ".join(shlex.quote(c) for c in cmd)
-        cmd_str = f"{cmd_str} | grep --color=always {shlex.quote(grep)}"
-        subprocess.run(cmd_str, shell=True)  # nosec B602 - grep pattern is quoted
+
+def _local_segments(path: Path) -> list[Path]:
+    """A local log and its rotated backups, oldest first."""
+    backups = sorted(
+        (p for p in path.parent.glob(f"{path.name}.*") if p.suffix[1:].isdigit()),
+        key=lambda p: int(p.suffix[1:]),
+        reverse=True,
+    )
+    return [*backups, path] if path.exists() else backups
+
+
+def _read_lines(paths: list[Path]) -> Iterator[bytes]:
+    """Lines across consecutive log files, joining a line split by rotation."""
+    partial = b""
+    for path in paths:
+        with path.open("rb") as f:
+            for line in f:
+                if partial:
+                    line, partial = partial + line, b""
+                if line.endswith(b"\n"):
+                    yield line
+                else:
+                    partial = line
+    if partial:
+        yield partial + b"\n"
+
+
+def search_logs_local(
+    voyage_dir: Path,
+    ship_id: str | None = None,
+    grep: str | None = None,
+    since: float | None = None,
+    until: float | None = None,
+    tail: int | None = None,
+) -> None:
+    """Print cleaned log records matching the filters, via the log index."""
+    from .log_index import LogIndex
+
+    if ship_id is not None and not _SHIP_ID_PATTERN.match(ship_id):
+        raise ValueError(f"Invalid ship_id format: {ship_id}")
+
+    logs_dir = voyage_dir / "logs"
+    if not logs_dir.exists():
+        print(f"No logs directory found: {logs_dir}")
+        return
+
+    index = LogIndex(logs_dir)
+    try:
+        index.ingest()
+        records = index.search(
+            grep, ships=[ship_id] if ship_id else None, since=since, until=until, limit=tail
+        )
+        highlight = re.compile(grep) if grep and sys.stdout.isatty() else None
+        for record in records:
+            text = record.text
+            if highlight:
+                text = highlight.sub(lambda m: f"\x1b[1;31m{m.group(0)}\x1b[0m", text)
+            stamp = datetime.fromtimestamp(record.ts).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{record.ship} {stamp}] {text}")
+    finally:
+        index.close()
+
+
+# Ship prefix colours for followed output, picked by ship index
+_PREFIX_COLORS = ("36", "33", "35", "32", "34", "91", "96", "93")
+# Bytes read from the end of a log to find the backlog lines shown on start
+_BACKLOG_BYTES = 64 * 1024
+
+
+@dataclass
+class _Tail:
+    ship: str
+    file: BinaryIO
+    inode: int
+    partial: bytes = b""
+
+
+class LogFollower:
+    """Follow every ship log in a logs directory from a single process.
+
+    Logs are polled for new bytes and new ship files (ships added by scale
+    appear automatically). Lines are cleaned of terminal escapes, filtered in
+    process and printed with a ship prefix. Rotated logs are picked up again
+    from the start.
+    """
+
+    def __init__(
+        self,
+        logs_dir: Path,
+        ship_id: str | None = None,
+        grep: str | None = None,
+        color: bool = False,
+        backlog: int = 10,
+        out: TextIO | None = None,
+    ) -> None:
+        self.logs_dir = logs_dir
+        self.ship_id = ship_id
+        self.pattern = re.compile(grep) if grep else None
+        self.color = color
+        self.backlog = backlog
+        self.out = out or sys.stdout
+        self._tails: dict[str, _Tail] = {}
+        self._started = False
+
+    def close(self) -> None:
+        for tail in self._tails.values():
+            tail.file.close()
+        self._tails.clear()
+
+    def _open(self, ship: str, path: Path, at_end: bool) -> None:
+        try:
+            f = path.open("rb")
+        except OSError:
+            return
+        inode = os.fstat(f.fileno()).st_ino
+        if at_end:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - _BACKLOG_BYTES)
+            f.seek(start)
+            lines = f.read().split(b"\n")[:-1]
+            if start:
+                lines = lines[1:]  # first line is probably cut
+            for line in lines[-self.backlog :] if self.backlog else []:
+                self._emit(ship, line)
+            f.seek(size)
+        self._tails[ship] = _Tail(ship, f, inode)
+
+    def _discover(self) -> None:
+        """Open ship logs not followed yet (existing ones at startup begin at the end)."""
+        try:
+            names = sorted(os.listdir(self.logs_dir))
+        except OSError:
+            names = []
+        for name in names:
+            match = _LOG_FILE.match(name)
+            if not match or match.group(1) in self._tails:
+                continue
+            if self.ship_id and match.group(1) != self.ship_id:
+                continue
+            self._open(match.group(1), self.logs_dir / name, at_end=not self._started)
+        self._started = True
+
+    def _emit(self, ship: str, raw: bytes) -> None:
+        from .log_index import clean_line
+
+        text = clean_line(raw.decode("utf-8", errors="replace"))
+        if not text or (self.pattern and not self.pattern.search(text)):
+            return
+        prefix = f"[{ship}]"
+        if self.color:
+            index = int(ship.rsplit("-", 1)[-1])
+            prefix = f"\x1b[{_PREFIX_COLORS[index % len(_PREFIX_COLORS)]}m{prefix}\x1b[0m"
+        self.out.write(f"{prefix} {text}\n")
+
+    def _read(self, tail: _Tail) -> None:
+        data = tail.partial + tail.file.read()
+        *lines, tail.partial = data.split(b"\n")
+        for line in lines:
+            self._emit(tail.ship, line)
+
+    def poll(self) -> None:
+        """Print new lines from every followed log."""
+        self._discover()
+        for ship, tail in list(self._tails.items()):
+            self._read(tail)
+            path = self.logs_dir / f"{ship}.log"
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if stat.st_ino != tail.inode or stat.st_size < tail.file.tell():
+                # Rotated or truncated: continue with the new file from its start
+                tail.file.close()
+                del self._tails[ship]
+                self._open(ship, path, at_end=False)
+                if ship in self._tails:
+                    self._read(self._tails[ship])
+        self.out.flush()
+
+    async def run(
+        self,
+        interval: float = 0.5,
+        collect: Callable[[], object] | None = None,
+        collect_interval: float = 5.0,
+    ) -> None:
+        """Poll forever. `collect` (e.g. a LogCollector pass) runs in a worker thread."""
+
+        async def collect_loop(collect: Callable[[], object]) -> None:
+            while True:
+                await asyncio.to_thread(collect)
+                await asyncio.sleep(collect_interval)
+
+        collector = asyncio.create_task(collect_loop(collect)) if collect else None
+        try:
+            while True:
+                self.poll()
+                await asyncio.sleep(interval)
+        finally:
+            if collector:
+                collector.cancel()
+            self.close()
+
+
+def follow_logs_local(
+    voyage_dir: Path,
+    ship_id: str | None = None,
+    grep: str | None = None,
+    backlog: int = 10,
+    color: bool | None = None,
+    collect: Callable[[], object] | None = None,
+) -> None:
+    """Follow all ship logs until interrupted."""
+    if ship_id is not None and not _SHIP_ID_PATTERN.match(ship_id):
+        raise ValueError(f"Invalid ship_id format: {ship_id}")
+
+    follower = LogFollower(
+        voyage_dir / "logs",
+        ship_id=ship_id,
+        grep=grep,
+        color=sys.stdout.isatty() if color is None else color,
+        backlog=backlog,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(follower.run(collect=collect))
+
+
+# --- Collection from ships ---
+
+OFFSETS_FILE = ".offsets.json"
+DEFAULT_MAX_LOG_BYTES = 100 * 1024 * 1024
+DEFAULT_LOG_BACKUPS = 3
+# Bytes fetched per round trip; a larger backlog takes several
+_CHUNK_BYTES = 8 * 1024 * 1024
+# log-rotate.py --read-segment exit status asking to retry later
+_SEGMENT_BUSY = 3
+
+
+def _fetch_command(ship_id: str, offset: int) -> str:
+    """Print the remote log's size and inode, then base64 of up to _CHUNK_BYTES from offset."""
+    return (
+        f'f="$HOME/voyage/logs/{ship_id}.log"; '
+        'stat -c "%s %i" "$f" 2>/dev/null || echo "0 0"; '
+        f'if [ "$(stat -c %s "$f" 2>/dev/null || echo 0)" -gt {offset} ]; then '
+        f'tail -c +{offset + 1} "$f" | head -c {_CHUNK_BYTES} | base64 -w0; fi'
+    )
+
+
+def _segment_command(ship_id: str, inode: int, offset: int) -> str:
+    """Read a rotated segment via the ship's log-rotate.py (see templates/log_rotate.py)."""
+    return (
+        f'python3 "$HOME/.ocaptain/log-rotate.py" --read-segment '
+        f'"$HOME/voyage/logs/{ship_id}.log" {inode} {offset} {_CHUNK_BYTES}'
+    )
+
+
+def parse_fetch_output(output: str) -> tuple[int, int, bytes]:
+    """Split fetch command output into (remote size, remote inode, data chunk).
+
+    Segment reads print only a size, so their inode is 0.
+    """
+    header, _, payload = output.partition("\n")
+    fields = header.split()
+    if not 1 <= len(fields) <= 2 or not all(f.isdigit() for f in fields):
+        raise ValueError(f"Unexpected log fetch output: {header[:80]!r}")
+    inode = int(fields[1]) if len(fields) == 2 else 0
+    return int(fields[0]), inode, base64.b64decode(payload.strip())
+
+
+def rotate_log(path: Path, max_bytes: int, backups: int) -> bool:
+    """Rotate path to path.1 (shifting older backups) once it reaches max_bytes."""
+    try:
+        if path.stat().st_size < max_bytes:
+            return False
+    except OSError:
+        return False
+
+    for i in range(backups - 1, 0, -1):
+        older = path.with_name(f"{path.name}.{i}")
+        if older.exists():
+            os.replace(older, path.with_name(f"{path.name}.{i + 1}"))
+    if backups:
+        os.replace(path, path.with_name(f"{path.name}.1"))
     else:
-        subprocess.run(cmd)  # nosec B603, B607
+        path.unlink()
+    return True
+
+
+@contextlib.contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive flock on path (created if missing) for the block."""
+    with path.open("a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class LogCollector:
+    """Incrementally copy ship logs into the local voyage's logs directory.
+
+    Each ship's log is read from the byte offset reached last time (persisted
+    with the remote file's inode in logs/.offsets.json), so collection resumes
+    where it stopped after a disconnect or restart. When the ship has rotated
+    its log, the rest of the old segment is drained before starting on the new
+    file. Local copies rotate by size.
+
+    Several commands may collect the same voyage at once (`watch` alongside
+    `logs -f`), so each ship's pass holds logs/.ship-N.lock and re-reads its
+    offset from disk; bytes are appended and their offset saved under it.
+    """
+
+    def __init__(
+        self,
+        voyage_dir: Path,
+        max_bytes: int = DEFAULT_MAX_LOG_BYTES,
+        backups: int = DEFAULT_LOG_BACKUPS,
+    ) -> None:
+        self.logs_dir = voyage_dir / "logs"
+        self.offsets_path = self.logs_dir / OFFSETS_FILE
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, int]]:
+        """Offset and inode per ship, as persisted in .offsets.json."""
+        states: dict[str, dict[str, int]] = {}
+        with contextlib.suppress(OSError, ValueError, AttributeError, TypeError):
+            for ship_id, state in json.loads(self.offsets_path.read_text()).items():
+                # Older collectors stored a bare offset
+                if isinstance(state, int):
+                    state = {"offset": state}
+                states[ship_id] = {
+                    "offset": int(state["offset"]),
+                    "inode": int(state.get("inode", 0)),
+                }
+        return states
+
+    def _position(self, ship_id: str) -> tuple[int, int]:
+        """The persisted (offset, inode) of a ship's log."""
+        state = self._load().get(ship_id, {})
+        return state.get("offset", 0), state.get("inode", 0)
+
+    def _append(self, ship_id: str, chunk: bytes) -> None:
+        path = self.logs_dir / f"{ship_id}.log"
+        with path.open("ab") as f:
+            f.write(chunk)
+        rotate_log(path, self.max_bytes, self.backups)
+
+    def _advance(self, ship_id: str, offset: int, inode: int) -> None:
+        """Persist a ship's position; other ships' entries are re-read, not overwritten."""
+        with self._lock, _locked(self.logs_dir / f"{OFFSETS_FILE}.lock"):
+            states = self._load()
+            states[ship_id] = {"offset": offset, "inode": inode}
+            tmp = self.offsets_path.with_name(f"{OFFSETS_FILE}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(states, indent=2))
+            os.replace(tmp, self.offsets_path)
+
+    def _drain_segment(self, c: Any, ship_id: str, inode: int, offset: int) -> int:
+        """Append what is left of the rotated segment that had inode. Returns bytes appended."""
+        appended = 0
+        while True:
+            result = c.run(
+                _segment_command(ship_id, inode, offset), hide=True, warn=True, timeout=120
+            )
+            if result.return_code == _SEGMENT_BUSY:
+                # Mid-compression; offsets are unchanged so the next pass retries
+                raise RuntimeError("rotated log segment is being compressed")
+            if not result.ok:
+                # Pruned already, or the ship has no log-rotate.py
+                logger.warning("Rotated log segment of %s could not be read; skipping it", ship_id)
+                return appended
+            size, _, chunk = parse_fetch_output(str(result.stdout))
+            if not chunk:
+                return appended
+            self._append(ship_id, chunk)
+            offset += len(chunk)
+            appended += len(chunk)
+            self._advance(ship_id, offset, inode)
+            if offset >= size:
+                return appended
+
+    def collect_ship(self, vm: VM, ship_id: str, provider: Provider) -> int:
+        """Fetch new log bytes from one ship. Returns the number of bytes appended."""
+        with _locked(self.logs_dir / f".{ship_id}.lock"):
+            return self._collect_ship(vm, ship_id, provider)
+
+    def _collect_ship(self, vm: VM, ship_id: str, provider: Provider) -> int:
+        from .provider import get_connection
+
+        offset, known_inode = self._position(ship_id)
+        appended = 0
+        with get_connection(vm, provider) as c:
+            while True:
+                result = c.run(_fetch_command(ship_id, offset), hide=True, warn=True, timeout=120)
+                if not result.ok:
+                    raise RuntimeError(f"log fetch exited {result.return_code}")
+                size, inode, chunk = parse_fetch_output(str(result.stdout))
+                if known_inode and inode and inode != known_inode:
+                    # The ship rotated its log; finish the old segment, then the new file
+                    appended += self._drain_segment(c, ship_id, known_inode, offset)
+                    offset, known_inode = 0, inode
+                    self._advance(ship_id, offset, inode)
+                    continue
+                if size < offset:
+                    # Remote log was truncated or replaced; start over on the new file
+                    offset = 0
+                    continue
+                known_inode = inode
+                if not chunk:
+                    break
+                self._append(ship_id, chunk)
+                offset += len(chunk)
+                appended += len(chunk)
+                self._advance(ship_id, offset, inode)
+                if offset >= size:
+                    break
+        return appended
+
+    def collect(self, vms: list[VM], provider: Provider) -> dict[str, int]:
+        """Fetch new log bytes from every ship in parallel; unreachable ships are skipped."""
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        if not vms:
+            return {}
+
+        def collect_one(vm: VM) -> tuple[str, int]:
+            ship_id = f"ship-{_ship_index(vm)}"
+            try:
+                return ship_id, self.collect_ship(vm, ship_id, provider)
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                logger.warning("Log collection from %s failed: %s", ship_id, e)
+                return ship_id, 0
+
+        with ThreadPoolExecutor(max_workers=min(16, len(vms))) as executor:
+            return dict(executor.map(collect_one, vms))
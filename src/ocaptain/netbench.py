@@ -0,0 +1,209 @@
+"""Ship-to-laptop network benchmark behind `ocaptain bench net`.
+
+For each ship, concurrently:
+
+- RTT and path type with `tailscale ping` (a direct UDP path, or relayed
+  through a DERP server), falling back to the cached peer map
+- throughput in both directions over the port-2222 sshd path that Mutagen
+  syncs use: stream bytes into `cat > /dev/null`, then out of /dev/zero,
+  and subtract the SSH handshake time
+
+Ships that are unreachable, relayed, far away or much slower than the rest
+of the fleet are flagged with a suggested action.
+"""
+
+import re
+import statistics
+import subprocess  # nosec: B404
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_SIZE = 16 * 1024 * 1024
+PING_COUNT = 3
+SSH_PORT = 2222
+TIMEOUT = 120
+
+# Flag thresholds
+MAX_RTT_MS = 150.0
+MIN_MB_PER_SEC = 5.0
+SLOW_FRACTION = 0.5  # of the fleet median
+
+_PONG = re.compile(r"via (\S+) in ([\d.]+)ms")
+
+
+@dataclass
+class ShipTarget:
+    ship_id: str
+    ip: str
+    user: str
+
+
+@dataclass
+class NetResult:
+    """Measurements and flags for one ship."""
+
+    ship_id: str
+    ip: str
+    rtt_ms: float | None = None
+    path: str = "unknown"  # "direct", "relayed" or "unknown"
+    relay: str = ""
+    upload_mb_s: float | None = None
+    download_mb_s: float | None = None
+    error: str | None = None
+    flags: list[str] = field(default_factory=list)
+
+    @property
+    def action(self) -> str:
+        """Suggested action: replace, re-route, or empty for a healthy ship."""
+        if self.error:
+            return "replace"
+        if self.path == "relayed":
+            return "re-route"
+        return "replace" if self.flags else ""
+
+
+def voyage_targets(voyage_id: str) -> tuple[list[ShipTarget], list[str]]:
+    """Ships to measure, from the catalog or provider, and names with no Tailscale IP."""
+    from . import tailscale
+    from .catalog import catalog_session
+    from .provider import get_provider
+    from .voyage import _get_remote_user, _ship_index
+
+    with catalog_session() as catalog:
+        vms = catalog.ships(voyage_id) if catalog else []
+        ips = catalog.ship_ips(voyage_id) if catalog else {}
+    if not vms:
+        vms = get_provider().list(prefix=f"{voyage_id}-ship")
+
+    targets, missing = [], []
+    for vm in sorted(vms, key=_ship_index):
+        ship_id = f"ship-{_ship_index(vm)}"
+        if ip := ips.get(ship_id) or tailscale.peer_ip(vm.name):
+            targets.append(ShipTarget(ship_id, ip, _get_remote_user(vm)))
+        else:
+            missing.append(ship_id)
+    return targets, missing
+
+
+def _run(cmd: list[str], stdin: bytes | None = None) -> subprocess.CompletedProcess[bytes]:
+    return subprocess.run(  # nosec: B603
+        cmd, input=stdin, capture_output=True, timeout=TIMEOUT, check=False
+    )
+
+
+def parse_ping(output: str) -> tuple[float | None, str, str]:
+    """(median RTT ms, path, DERP region) from `tailscale ping` output."""
+    pongs = _PONG.findall(output)
+    if not pongs:
+        return None, "unknown", ""
+    via = pongs[-1][0]  # the last pong shows the path settled on
+    rtt = statistics.median(float(ms) for _, ms in pongs)
+    if derp := re.fullmatch(r"DERP\((.*)\)", via):
+        return rtt, "relayed", derp.group(1)
+    return rtt, "direct", ""
+
+
+def _ping(target: ShipTarget, result: NetResult) -> None:
+    from . import tailscale
+
+    if binary := tailscale.find_tailscale():
+        ping = _run([binary, "ping", "-c", str(PING_COUNT), "--until-direct=false", target.ip])
+        result.rtt_ms, result.path, result.relay = parse_ping(ping.stdout.decode(errors="replace"))
+    if result.path == "unknown" and (ts_status := tailscale.status()):
+        peer = next((p for p in ts_status.peers.values() if p.ip == target.ip), None)
+        if peer:
+            result.path = "direct" if peer.direct else "relayed"
+            result.relay = peer.relay
+
+
+def _ssh_command(target: ShipTarget) -> list[str]:
+    cmd = ["ssh", "-p", str(SSH_PORT)]
+    for option in (
+        "BatchMode=yes",
+        "StrictHostKeyChecking=no",
+        "UserKnownHostsFile=/dev/null",
+        "LogLevel=ERROR",
+        "Compression=no",
+        "ConnectTimeout=10",
+    ):
+        cmd += ["-o", option]
+    key = Path.home() / ".config" / "ocaptain" / "id_ed25519"
+    if key.exists():
+        cmd += ["-i", str(key)]
+    return [*cmd, f"{target.user}@{target.ip}"]
+
+
+def _timed_ssh(
+    target: ShipTarget, remote: str, stdin: bytes | None = None
+) -> tuple[float, subprocess.CompletedProcess[bytes]]:
+    start = time.perf_counter()
+    result = _run([*_ssh_command(target), remote], stdin)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        message = result.stderr.decode(errors="replace").strip() or f"exit {result.returncode}"
+        raise RuntimeError(f"ssh to {target.ip}:{SSH_PORT} failed: {message}")
+    return elapsed, result
+
+
+def _throughput(target: ShipTarget, result: NetResult, size: int) -> None:
+    handshake, _ = _timed_ssh(target, "true")
+    mb = size / (1024 * 1024)
+
+    elapsed, _ = _timed_ssh(target, "cat > /dev/null", bytes(size))
+    result.upload_mb_s = mb / max(elapsed - handshake, 1e-3)
+
+    elapsed, download = _timed_ssh(target, f"head -c {size} /dev/zero")
+    if len(download.stdout) != size:
+        raise RuntimeError(f"download returned {len(download.stdout)} of {size} bytes")
+    result.download_mb_s = mb / max(elapsed - handshake, 1e-3)
+
+
+def measure_ship(target: ShipTarget, size: int = DEFAULT_SIZE) -> NetResult:
+    """RTT, path type and both-way throughput for one ship."""
+    result = NetResult(target.ship_id, target.ip)
+    try:
+        _ping(target, result)
+        _throughput(target, result, size)
+    except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+        result.error = str(e)
+    return result
+
+
+def flag_results(results: list[NetResult]) -> None:
+    """Flag unreachable, relayed, distant and slow ships (against the fleet median)."""
+    medians = {}
+    for direction in ("upload_mb_s", "download_mb_s"):
+        values = [v for r in results if (v := getattr(r, direction)) is not None]
+        medians[direction] = statistics.median(values) if values else None
+
+    for r in results:
+        r.flags = []
+        if r.error:
+            r.flags.append(f"unreachable: {r.error}")
+            continue
+        if r.path == "relayed":
+            r.flags.append(f"relayed via DERP({r.relay or '?'})")
+        if r.rtt_ms is not None and r.rtt_ms > MAX_RTT_MS:
+            r.flags.append(f"RTT {r.rtt_ms:.0f} ms")
+        for direction, label in (("upload_mb_s", "upload"), ("download_mb_s", "download")):
+            value, median = getattr(r, direction), medians[direction]
+            if value is None:
+                continue
+            if value < MIN_MB_PER_SEC:
+                r.flags.append(f"{label} {value:.1f} MB/s")
+            elif median and value < median * SLOW_FRACTION:
+                r.flags.append(f"{label} {value:.1f} MB/s vs fleet {median:.1f}")
+
+
+def bench_fleet(
+    targets: list[ShipTarget], size: int = DEFAULT_SIZE, max_workers: int | None = None
+) -> list[NetResult]:
+    """Measure every ship concurrently (max_workers at a time) and flag outliers."""
+    if not targets:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers or len(targets)) as pool:
+        results = list(pool.map(lambda t: measure_ship(t, size), targets))
+    flag_results(results)
+    return results
@@ -0,0 +1,320 @@
+"""Decode OTLP/HTTP log and metric exports into flat rows.
+
+Ships export with OTEL_EXPORTER_OTLP_PROTOCOL=http/protobuf (see ship.py).
+Rather than depend on protobuf and the generated OTLP classes, this module
+walks the protobuf wire format against a table of the few OTLP messages it
+needs, producing the same dict shape as OTLP's JSON encoding. One code path
+then turns either encoding into rows for the built-in receiver.
+"""
+
+import base64
+import json
+import struct
+import time
+from collections.abc import Iterator
+from typing import Any
+
+# message -> {field number: (JSON name, type, repeated)}. Types are message
+# names or one of the scalar kinds handled by _scalar(). Unlisted fields
+# (trace ids, exemplars, bucket counts, ...) are skipped.
+_MESSAGES: dict[str, dict[int, tuple[str, str, bool]]] = {
+    "ExportLogsServiceRequest": {1: ("resourceLogs", "ResourceLogs", True)},
+    "ResourceLogs": {1: ("resource", "Resource", False), 2: ("scopeLogs", "ScopeLogs", True)},
+    "ScopeLogs": {
+        1: ("scope", "InstrumentationScope", False),
+        2: ("logRecords", "LogRecord", True),
+    },
+    "LogRecord": {
+        1: ("timeUnixNano", "fixed64", False),
+        2: ("severityNumber", "varint", False),
+        3: ("severityText", "string", False),
+        5: ("body", "AnyValue", False),
+        6: ("attributes", "KeyValue", True),
+        11: ("observedTimeUnixNano", "fixed64", False),
+        12: ("eventName", "string", False),
+    },
+    "ExportMetricsServiceRequest": {1: ("resourceMetrics", "ResourceMetrics", True)},
+    "ResourceMetrics": {
+        1: ("resource", "Resource", False),
+        2: ("scopeMetrics", "ScopeMetrics", True),
+    },
+    "ScopeMetrics": {1: ("scope", "InstrumentationScope", False), 2: ("metrics", "Metric", True)},
+    "Metric": {
+        1: ("name", "string", False),
+        3: ("unit", "string", False),
+        5: ("gauge", "Gauge", False),
+        7: ("sum", "Sum", False),
+        9: ("histogram", "Histogram", False),
+    },
+    "Gauge": {1: ("dataPoints", "NumberDataPoint", True)},
+    "Sum": {
+        1: ("dataPoints", "NumberDataPoint", True),
+        2: ("aggregationTemporality", "varint", False),
+        3: ("isMonotonic", "bool", False),
+    },
+    "Histogram": {
+        1: ("dataPoints", "HistogramDataPoint", True),
+        2: ("aggregationTemporality", "varint", False),
+    },
+    "NumberDataPoint": {
+        2: ("startTimeUnixNano", "fixed64", False),
+        3: ("timeUnixNano", "fixed64", False),
+        4: ("asDouble", "double", False),
+        6: ("asInt", "sfixed64", False),
+        7: ("attributes", "KeyValue", True),
+    },
+    "HistogramDataPoint": {
+        2: ("startTimeUnixNano", "fixed64", False),
+        3: ("timeUnixNano", "fixed64", False),
+        4: ("count", "fixed64", False),
+        5: ("sum", "double", False),
+        9: ("attributes", "KeyValue", True),
+    },
+    "Resource": {1: ("attributes", "KeyValue", True)},
+    "InstrumentationScope": {1: ("name", "string", False), 2: ("version", "string", False)},
+    "KeyValue": {1: ("key", "string", False), 2: ("value", "AnyValue", False)},
+    "AnyValue": {
+        1: ("stringValue", "string", False),
+        2: ("boolValue", "bool", False),
+        3: ("intValue", "int64", False),
+        4: ("doubleValue", "double", False),
+        5: ("arrayValue", "ArrayValue", False),
+        6: ("kvlistValue", "KeyValueList", False),
+        7: ("bytesValue", "bytes", False),
+    },
+    "ArrayValue": {1: ("values", "AnyValue", True)},
+    "KeyValueList": {1: ("values", "KeyValue", True)},
+}
+
+# Wire type each scalar kind is encoded with
+_WIRE_TYPES = {
+    "varint": 0,
+    "bool": 0,
+    "int64": 0,
+    "fixed64": 1,
+    "sfixed64": 1,
+    "double": 1,
+    "string": 2,
+    "bytes": 2,
+}
+
+
+def _varint(buf: memoryview, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        if pos >= len(buf):
+            raise ValueError("truncated varint")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift > 63:
+            raise ValueError("varint too long")
+
+
+def _fields(buf: memoryview) -> Iterator[tuple[int, int, Any]]:
+    """(field number, wire type, raw value) for each field of an encoded message."""
+    pos = 0
+    while pos < len(buf):
+        key, pos = _varint(buf, pos)
+        number, wire_type = key >> 3, key & 7
+        value: Any
+        if wire_type == 0:
+            value, pos = _varint(buf, pos)
+        elif wire_type == 1:
+            value, pos = buf[pos : pos + 8], pos + 8
+        elif wire_type == 2:
+            length, pos = _varint(buf, pos)
+            value, pos = buf[pos : pos + length], pos + length
+        elif wire_type == 5:
+            value, pos = buf[pos : pos + 4], pos + 4
+        else:
+            raise ValueError(f"unsupported wire type {wire_type}")
+        if pos > len(buf):
+            raise ValueError("truncated message")
+        yield number, wire_type, value
+
+
+def _scalar(kind: str, value: Any) -> Any:
+    if kind == "string":
+        return bytes(value).decode("utf-8", errors="replace")
+    if kind == "bytes":
+        return base64.b64encode(value).decode()  # as in OTLP JSON
+    if kind == "bool":
+        return bool(value)
+    if kind == "int64":
+        return value - (1 << 64) if value >= 1 << 63 else value
+    if kind == "fixed64":
+        return int.from_bytes(value, "little")
+    if kind == "sfixed64":
+        return int.from_bytes(value, "little", signed=True)
+    if kind == "double":
+        return struct.unpack("<d", value)[0]
+    return value  # varint
+
+
+def decode_protobuf(message: str, buf: bytes | memoryview) -> dict[str, Any]:
+    """Decode an OTLP protobuf message into its OTLP JSON shape."""
+    schema = _MESSAGES[message]
+    result: dict[str, Any] = {}
+    # Nested messages are slices of one memoryview rather than copies
+    for number, wire_type, value in _fields(memoryview(buf)):
+        if number not in schema:
+            continue
+        name, kind, repeated = schema[number]
+        if kind in _MESSAGES:
+            if wire_type != 2:
+                continue
+            decoded: Any = decode_protobuf(kind, value)
+        elif wire_type == _WIRE_TYPES[kind]:
+            decoded = _scalar(kind, value)
+        else:
+            continue
+        if repeated:
+            result.setdefault(name, []).append(decoded)
+        else:
+            result[name] = decoded
+    return result
+
+
+def _plain(value: dict[str, Any] | None) -> Any:
+    """An AnyValue as a plain Python value."""
+    if not value:
+        return None
+    if "arrayValue" in value:
+        return [_plain(v) for v in value["arrayValue"].get("values", [])]
+    if "kvlistValue" in value:
+        return {
+            kv.get("key", ""): _plain(kv.get("value"))
+            for kv in value["kvlistValue"].get("values", [])
+        }
+    if "intValue" in value:
+        return int(value["intValue"])  # a string in OTLP JSON
+    for key in ("stringValue", "boolValue", "doubleValue", "bytesValue"):
+        if key in value:
+            return value[key]
+    return None
+
+
+def any_value_text(value: dict[str, Any] | None) -> str | None:
+    """An AnyValue as text: strings as-is, booleans lowercase, structures as JSON."""
+    plain = _plain(value)
+    if plain is None or isinstance(plain, str):
+        return plain
+    if isinstance(plain, bool):
+        return "true" if plain else "false"
+    if isinstance(plain, int | float):
+        return str(plain)
+    return json.dumps(plain, separators=(",", ":"))
+
+
+def attribute_map(key_values: list[dict[str, Any]] | None) -> dict[str, str]:
+    """OTLP KeyValue list to a string map (the Parquet attribute column type)."""
+    result: dict[str, str] = {}
+    for kv in key_values or []:
+        text = any_value_text(kv.get("value"))
+        if text is not None:
+            result[kv.get("key", "")] = text
+    return result
+
+
+_TEMPORALITIES = {"AGGREGATION_TEMPORALITY_DELTA": 1, "AGGREGATION_TEMPORALITY_CUMULATIVE": 2}
+
+
+def _enum(value: Any, names: dict[str, int] | None = None) -> int | None:
+    """An enum field: a number, or its name in OTLP JSON."""
+    if value is None or isinstance(value, int):
+        return value
+    if str(value).isdigit():
+        return int(value)
+    return (names or {}).get(str(value))
+
+
+def _nanos(*values: Any) -> int:
+    """First non-zero timestamp (ints, or strings in OTLP JSON), else now."""
+    for value in values:
+        if value and int(value):
+            return int(value)
+    return time.time_ns()
+
+
+def log_rows(request: dict[str, Any]) -> list[dict[str, Any]]:
+    """Rows for an ExportLogsServiceRequest."""
+    rows = []
+    for resource_logs in request.get("resourceLogs", []):
+        resource = attribute_map(resource_logs.get("resource", {}).get("attributes"))
+        service = resource.get("service.name", "unknown")
+        for scope_logs in resource_logs.get("scopeLogs", []):
+            scope = scope_logs.get("scope", {}).get("name", "")
+            for record in scope_logs.get("logRecords", []):
+                attributes = attribute_map(record.get("attributes"))
+                if record.get("eventName"):
+                    attributes.setdefault("event.name", record["eventName"])
+                rows.append(
+                    {
+                        "Timestamp": _nanos(
+                            record.get("timeUnixNano"), record.get("observedTimeUnixNano")
+                        ),
+                        "ServiceName": service,
+                        "SeverityText": record.get("severityText", ""),
+                        "SeverityNumber": _enum(record.get("severityNumber")) or 0,
+                        "Body": any_value_text(record.get("body")),
+                        "ResourceAttributes": resource,
+                        "ScopeName": scope,
+                        "LogAttributes": attributes,
+                    }
+                )
+    return rows
+
+
+def metric_rows(request: dict[str, Any]) -> list[dict[str, Any]]:
+    """Rows for an ExportMetricsServiceRequest: one per gauge, sum or histogram point."""
+    rows = []
+    for resource_metrics in request.get("resourceMetrics", []):
+        resource = attribute_map(resource_metrics.get("resource", {}).get("attributes"))
+        service = resource.get("service.name", "unknown")
+        for scope_metrics in resource_metrics.get("scopeMetrics", []):
+            scope = scope_metrics.get("scope", {}).get("name", "")
+            for metric in scope_metrics.get("metrics", []):
+                for kind in ("gauge", "sum", "histogram"):
+                    if kind not in metric:
+                        continue
+                    data = metric[kind]
+                    for point in data.get("dataPoints", []):
+                        if kind == "histogram":
+                            value = point.get("sum")
+                            count = int(point.get("count", 0))
+                        else:
+                            value = point.get("asDouble", point.get("asInt"))
+                            count = None
+                        rows.append(
+                            {
+                                "Timestamp": _nanos(point.get("timeUnixNano")),
+                                "StartTimestamp": int(point.get("startTimeUnixNano") or 0) or None,
+                                "ServiceName": service,
+                                "MetricName": metric.get("name", ""),
+                                "MetricUnit": metric.get("unit", ""),
+                                "MetricType": kind,
+                                "Value": float(value) if value is not None else None,
+                                "Count": count,
+                                "IsMonotonic": data.get("isMonotonic"),
+                                "AggregationTemporality": _enum(
+                                    data.get("aggregationTemporality"), _TEMPORALITIES
+                                ),
+                                "ResourceAttributes": resource,
+                                "ScopeName": scope,
+                                "Attributes": attribute_map(point.get("attributes")),
+                            }
+                        )
+    return rows
+
+
+def decode_request(signal: str, body: bytes, json_encoded: bool) -> list[dict[str, Any]]:
+    """Rows for an OTLP/HTTP export of signal ("logs" or "metrics")."""
+    message = "ExportLogsServiceRequest" if signal == "logs" else "ExportMetricsServiceRequest"
+    request = json.loads(body) if json_encoded else decode_protobuf(message, body)
+    if not isinstance(request, dict):
+        raise ValueError("OTLP request must be an object")
+    return log_rows(request) if signal == "logs" else metric_rows(request)
@@ -5,6 +5,7 @@ from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import wraps
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -66,17 +67,39 @@ class Provider(Protocol):
 # Provider registry
 _PROVIDERS: dict[str, type[Provider]] = {}
 
+# Provider methods timed by provider_stats
+_INSTRUMENTED = ("create", "destroy", "get", "list", "wait_ready")
+
+
+def _instrument(name: str, method: "Callable[..., Any]") -> "Callable[..., Any]":
+    from . import provider_stats
+
+    @wraps(method)
+    def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+        with provider_stats.timed(name, method.__name__):
+            return method(*args, **kwargs)
+
+    return wrapper
+
 
 def register_provider(name: str) -> Callable[[type[Provider]], type[Provider]]:
-    """Decorator to register a provider implementation."""
+    """Decorator to register a provider implementation, timing its methods."""
 
     def decorator(cls: type[Provider]) -> type[Provider]:
+        for attr in _INSTRUMENTED:
+            if attr in vars(cls):
+                setattr(cls, attr, _instrument(name, vars(cls)[attr]))
         _PROVIDERS[name] = cls
         return cls
 
     return decorator
 
 
+def provider_name(provider: Provider) -> str:
+    """The name a provider instance's class was registered under."""
+    return next((n for n, cls in _PROVIDERS.items() if isinstance(provider, cls)), "unknown")
+
+
 def get_provider(name: str | None = None) -> Provider:
     """Get provider instance by name."""
     # Import providers to trigger registration
@@ -95,9 +118,14 @@ def is_sprite_vm(vm: VM) -> bool:
     return vm.ssh_dest.startswith("sprite://")
 
 
+def is_simulated_vm(vm: VM) -> bool:
+    """Check if a VM is simulated (uses sim:// URI scheme)."""
+    return vm.ssh_dest.startswith("sim://")
+
+
 @contextmanager
 def get_connection(vm: VM, provider: Provider) -> "Generator[Any, None, None]":
-    """Get appropriate connection for a VM (Fabric or Sprite).
+    """Get appropriate connection for a VM (Fabric, Sprite or simulated).
 
     Yields a connection object with run() and put() methods.
     """
@@ -109,8 +137,18 @@ def get_connection(vm: VM, provider: Provider) -> "Generator[Any, None, None]":
                 yield c
         else:
             raise ValueError(f"Sprite VM requires SpritesProvider, got {type(provider)}")
+    elif is_simulated_vm(vm):
+        from .providers.simulated import SimulatedProvider
+
+        if isinstance(provider, SimulatedProvider):
+            with provider.get_connection(vm) as c:
+                yield c
+        else:
+            raise ValueError(f"Simulated VM requires SimulatedProvider, got {type(provider)}")
     else:
         from fabric import Connection
 
+        from .provider_stats import TimedConnection
+
         with Connection(vm.ssh_dest) as c:
-            yield c
+            yield TimedConnection(c, provider_name(provider))
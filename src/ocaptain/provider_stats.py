@@ -0,0 +1,360 @@
+"""Latency histograms for provider calls behind `ocaptain stats provider`.
+
+Every registered Provider method and every remote command (provider CLI
+calls, exec and file uploads on VMs) is timed with its exit status, retry
+count and payload size, aggregated per (provider, operation) into
+fixed-bucket histograms.
+
+The CLI enables collection for each command and calls flush() when it
+finishes. A command that made provider calls merges them into
+~/.config/ocaptain/provider-stats.json (under a lock, as commands may run
+at once) and, with telemetry enabled and the local OTLP collector running,
+sends them to it as delta metrics (POST /v1/metrics).
+"""
+
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE = "provider-stats.json"
+_STATS_VERSION = 1
+# Upper bounds (seconds) of the latency buckets; a last bucket catches the rest
+BOUNDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+EXPORT_TIMEOUT = 1.0
+_OK_STATUSES = ("ok", "0")
+
+
+@dataclass
+class Observation:
+    """One call in progress; the caller fills in status and payload sizes."""
+
+    status: str = "ok"  # "ok", an exit code, or an exception type name
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+@dataclass
+class Histogram:
+    """Aggregated observations for one (provider, operation)."""
+
+    count: int = 0
+    sum: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BOUNDS) + 1))
+    statuses: dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    @property
+    def errors(self) -> int:
+        return sum(n for status, n in self.statuses.items() if status not in _OK_STATUSES)
+
+    @property
+    def mean(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+    def observe(self, seconds: float, obs: Observation) -> None:
+        self.min = min(self.min, seconds) if self.count else seconds
+        self.max = max(self.max, seconds)
+        self.count += 1
+        self.sum += seconds
+        self.buckets[next((i for i, b in enumerate(BOUNDS) if seconds <= b), len(BOUNDS))] += 1
+        self.statuses[obs.status] = self.statuses.get(obs.status, 0) + 1
+        self.retries += obs.retries
+        self.bytes_sent += obs.bytes_sent
+        self.bytes_received += obs.bytes_received
+
+    def merge(self, other: "Histogram") -> None:
+        if not other.count:
+            return
+        self.min = min(self.min, other.min) if self.count else other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.sum += other.sum
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets, strict=True)]
+        for status, n in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + n
+        self.retries += other.retries
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile, interpolating inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                low = max(BOUNDS[i - 1] if i else 0.0, self.min)
+                high = min(BOUNDS[i] if i < len(BOUNDS) else self.max, self.max)
+                return low + (high - low) * max(rank - seen, 0) / n
+            seen += n
+        return self.max
+
+
+_histograms: dict[tuple[str, str], Histogram] = {}
+_lock = threading.Lock()
+_local = threading.local()
+_enabled = False
+_started_ns = time.time_ns()  # start of the current OTLP delta window
+
+
+def stats_path() -> Path:
+    return Path.home() / ".config" / "ocaptain" / STATS_FILE
+
+
+def enable() -> None:
+    """Start collecting observations in this process (until the next flush)."""
+    global _enabled
+    _enabled = True
+
+
+def record(provider: str, operation: str, seconds: float, obs: Observation) -> None:
+    if not _enabled:
+        return
+    with _lock:
+        _histograms.setdefault((provider, operation), Histogram()).observe(seconds, obs)
+
+
+def _stack() -> list[Observation]:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    stack: list[Observation] = _local.stack
+    return stack
+
+
+@contextmanager
+def timed(provider: str, operation: str, bytes_sent: int = 0) -> Iterator[Observation]:
+    """Time a provider call; exceptions are recorded by type and re-raised."""
+    obs = Observation(bytes_sent=bytes_sent)
+    stack = _stack()
+    stack.append(obs)
+    start = time.perf_counter()
+    try:
+        yield obs
+    except BaseException as e:
+        obs.status = type(e).__name__
+        raise
+    finally:
+        stack.pop()
+        record(provider, operation, time.perf_counter() - start, obs)
+
+
+def retried(count: int = 1) -> None:
+    """Count a retry against the innermost call being timed on this thread."""
+    if stack := _stack():
+        stack[-1].retries += count
+
+
+def payload_size(local: BytesIO | BinaryIO | Path) -> int:
+    """Bytes in an upload source, or 0 if that can't be told without reading it."""
+    if isinstance(local, Path):
+        try:
+            return local.stat().st_size
+        except OSError:
+            return 0
+    if isinstance(local, BytesIO):
+        return local.getbuffer().nbytes
+    return 0
+
+
+class TimedConnection:
+    """Wraps a Fabric connection so run() and put() are timed."""
+
+    def __init__(self, connection: Any, provider: str):
+        self._connection = connection
+        self._provider = provider
+
+    def run(self, cmd: str, **kwargs: Any) -> Any:
+        with timed(self._provider, "exec", len(cmd.encode())) as obs:
+            result = self._connection.run(cmd, **kwargs)
+            obs.status = str(getattr(result, "return_code", 0))
+            obs.bytes_received = len((getattr(result, "stdout", "") or "").encode())
+        return result
+
+    def put(self, local: BytesIO | BinaryIO | Path, remote: str) -> Any:
+        with timed(self._provider, "put", payload_size(local)):
+            return self._connection.put(local, remote)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+
+def snapshot() -> dict[tuple[str, str], Histogram]:
+    """A copy of this process's unflushed histograms."""
+    with _lock:
+        return {key: Histogram(**asdict(h)) for key, h in _histograms.items()}
+
+
+def load() -> dict[tuple[str, str], Histogram]:
+    """Histograms persisted by earlier commands."""
+    try:
+        saved = json.loads(stats_path().read_text())
+        if saved.get("version") != _STATS_VERSION:
+            return {}
+        loaded = {}
+        for key, data in saved.get("histograms", {}).items():
+            provider, _, operation = key.partition("/")
+            histogram = Histogram(**data)
+            if len(histogram.buckets) == len(BOUNDS) + 1:
+                loaded[(provider, operation)] = histogram
+        return loaded
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def _save(histograms: dict[tuple[str, str], Histogram]) -> None:
+    path = stats_path()
+    payload = {
+        "version": _STATS_VERSION,
+        "histograms": {f"{p}/{op}": asdict(h) for (p, op), h in sorted(histograms.items())},
+    }
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(payload))
+    os.replace(tmp, path)
+
+
+def persist(histograms: dict[tuple[str, str], Histogram]) -> None:
+    """Merge histograms into the stats file, locked against concurrent commands."""
+    path = stats_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.with_name(f"{path.name}.lock").open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            merged = load()
+            for key, histogram in histograms.items():
+                merged.setdefault(key, Histogram()).merge(histogram)
+            _save(merged)
+    except OSError as e:
+        logger.debug("Could not write provider stats: %s", e)
+
+
+def reset() -> None:
+    """Forget persisted and unflushed histograms."""
+    with _lock:
+        _histograms.clear()
+    stats_path().unlink(missing_ok=True)
+
+
+def _attributes(**values: str) -> list[dict[str, Any]]:
+    return [{"key": k, "value": {"stringValue": v}} for k, v in values.items()]
+
+
+def otlp_request(
+    histograms: dict[tuple[str, str], Histogram], start_ns: int, end_ns: int
+) -> dict[str, Any]:
+    """OTLP/JSON ExportMetricsServiceRequest with delta histograms and counters."""
+    durations, retries, errors, payload = [], [], [], []
+    for (provider, operation), h in sorted(histograms.items()):
+        times = {"startTimeUnixNano": str(start_ns), "timeUnixNano": str(end_ns)}
+        attrs = _attributes(provider=provider, operation=operation)
+        durations.append(
+            {
+                **times,
+                "attributes": attrs,
+                "count": str(h.count),
+                "sum": h.sum,
+                "min": h.min,
+                "max": h.max,
+                "bucketCounts": [str(n) for n in h.buckets],
+                "explicitBounds": list(BOUNDS),
+            }
+        )
+        retries.append({**times, "attributes": attrs, "asInt": str(h.retries)})
+        errors.append({**times, "attributes": attrs, "asInt": str(h.errors)})
+        for direction, size in (("sent", h.bytes_sent), ("received", h.bytes_received)):
+            payload.append(
+                {
+                    **times,
+                    "attributes": [*attrs, *_attributes(direction=direction)],
+                    "asInt": str(size),
+                }
+            )
+
+    def counter(name: str, unit: str, points: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "name": name,
+            "unit": unit,
+            "sum": {"dataPoints": points, "aggregationTemporality": 1, "isMonotonic": True},
+        }
+
+    return {
+        "resourceMetrics": [
+            {
+                "resource": {"attributes": _attributes(**{"service.name": "ocaptain"})},
+                "scopeMetrics": [
+                    {
+                        "scope": {"name": __name__},
+                        "metrics": [
+                            {
+                                "name": "ocaptain.provider.duration",
+                                "unit": "s",
+                                "histogram": {
+                                    "dataPoints": durations,
+                                    "aggregationTemporality": 1,
+                                },
+                            },
+                            counter("ocaptain.provider.retries", "1", retries),
+                            counter("ocaptain.provider.errors", "1", errors),
+                            counter("ocaptain.provider.payload", "By", payload),
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def export_otlp(request: dict[str, Any], port: int) -> bool:
+    """POST metrics to the local OTLP receiver; False if it isn't listening."""
+    http_request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/v1/metrics",
+        data=json.dumps(request).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(http_request, timeout=EXPORT_TIMEOUT):  # nosec: B310
+            return True
+    except (urllib.error.URLError, OSError) as e:
+        logger.debug("Provider metrics not exported: %s", e)
+        return False
+
+
+def flush() -> None:
+    """Persist and export this process's observations, then stop collecting."""
+    global _enabled, _started_ns
+    with _lock:
+        pending = dict(_histograms)
+        _histograms.clear()
+        _enabled = False
+    if not pending:
+        return
+    persist(pending)
+
+    from .config import get_config
+    from .telemetry import collector_running
+
+    config = get_config()
+    now = time.time_ns()
+    # Only post when the collector is up, so commands don't wait on a dead port
+    if config.telemetry_enabled and collector_running():
+        export_otlp(otlp_request(pending, _started_ns, now), config.local.otlp_port)
+    _started_ns = now
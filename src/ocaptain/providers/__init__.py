@@ -2,5 +2,6 @@
 
 from . import (
     exedev,  # noqa: F401 - triggers registration
+    simulated,  # noqa: F401 - triggers registration
     sprites,  # noqa: F401 - triggers registration
 )
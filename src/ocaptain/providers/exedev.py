@@ -10,6 +10,7 @@ from io import BytesIO
 
 from fabric import Connection
 
+from .. import provider_stats
 from ..config import get_ssh_keypair
 from ..provider import VM, Provider, VMStatus, register_provider
 
@@ -17,7 +18,10 @@ from ..provider import VM, Provider, VMStatus, register_provider
 def _run_exedev(*args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
     """Run an exe.dev command via SSH."""
     cmd = ["ssh", "exe.dev", *args]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)  # nosec: B603, B607
+    with provider_stats.timed("exedev", f"cli {args[0]}") as obs:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)  # nosec: B603, B607
+        obs.status = str(result.returncode)
+        obs.bytes_received = len(result.stdout.encode())
     if result.returncode != 0 and check:
         import sys
 
@@ -121,6 +125,7 @@ class ExeDevProvider(Provider):
                     c.run("echo ready", hide=True)
                 return True
             except Exception:
+                provider_stats.retried()
                 time.sleep(5)
 
         return False
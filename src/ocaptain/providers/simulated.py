@@ -0,0 +1,316 @@
+"""Simulated VM provider for exercising orchestration without real VMs.
+
+VMs are directories under a local root, each with a home directory that
+commands run in. Commands go through a real local `bash`, with shims on
+PATH for what only exists on a VM (sudo, tailscale, curl, apt-get,
+systemctl, tmux, gh), so bootstrap_ship and friends run unmodified.
+
+Every operation sleeps for a latency sampled from a configurable
+distribution (scaled by time_scale) and can fail at a configurable rate.
+Settings come from the "simulated" entry in config.json's providers:
+
+    {"provider": "simulated",
+     "providers": {"simulated": {"time_scale": "0.01",
+                                 "create_latency": "lognormal:20,0.3",
+                                 "exec_failure_rate": "0.01"}}}
+
+Latencies are "fixed:S", "uniform:LO,HI", "normal:MEAN,SD" or
+"lognormal:MEDIAN,SIGMA" (seconds), or a bare number.
+"""
+
+import json
+import math
+import os
+import random
+import shutil
+import subprocess  # nosec: B404
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+from .. import provider_stats
+from ..provider import VM, Provider, VMStatus, register_provider
+
+DEFAULTS = {
+    "time_scale": "1",
+    "create_latency": "lognormal:20,0.3",
+    "destroy_latency": "lognormal:3,0.3",
+    "list_latency": "lognormal:0.8,0.3",
+    "exec_latency": "lognormal:0.15,0.5",
+    "create_failure_rate": "0",
+    "exec_failure_rate": "0",
+}
+
+# Programs that only make sense on a real VM; they succeed without doing anything
+_NOOP_SHIMS = ("sudo", "curl", "apt-get", "systemctl", "tmux", "gh")
+_TAILSCALE_SHIM = '#!/bin/sh\n[ "$1" = ip ] && cat "$HOME/.sim_tailscale_ip"\nexit 0\n'
+
+
+@dataclass(frozen=True)
+class Latency:
+    """A latency distribution in seconds."""
+
+    kind: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, _, args = spec.partition(":")
+        if not args:
+            return cls("fixed", (float(kind),))
+        params = tuple(float(a) for a in args.split(","))
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if expected.get(kind) != len(params):
+            raise ValueError(f"Invalid latency spec: {spec!r}")
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        elif self.kind == "lognormal":
+            median, sigma = self.params
+            value = rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        else:
+            value = self.params[0]
+        return max(0.0, value)
+
+
+@dataclass
+class _OpStats:
+    calls: int = 0
+    failures: int = 0
+    in_flight: int = 0
+    peak: int = 0
+    seconds: float = 0.0
+
+
+_stats: dict[str, _OpStats] = {}
+_stats_lock = threading.Lock()
+
+
+def stats() -> dict[str, dict[str, float]]:
+    """Per-operation calls, failures, peak concurrency and simulated seconds."""
+    with _stats_lock:
+        return {
+            op: {"calls": s.calls, "failures": s.failures, "peak": s.peak, "seconds": s.seconds}
+            for op, s in _stats.items()
+        }
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+@dataclass
+class SimResult:
+    """Result of a command run on a simulated VM."""
+
+    stdout: str
+    stderr: str
+    return_code: int
+    command: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.return_code == 0
+
+
+@register_provider("simulated")
+class SimulatedProvider(Provider):
+    """Provider whose VMs are local directories (see module docstring)."""
+
+    def __init__(self, settings: dict[str, str] | None = None):
+        if settings is None:
+            from ..config import CONFIG
+
+            settings = CONFIG.providers.get("simulated", {})
+        merged = {**DEFAULTS, **settings}
+        self.root = Path(merged.get("root") or Path(tempfile.gettempdir()) / "ocaptain-sim")
+        self.time_scale = float(merged["time_scale"])
+        self.latency = {
+            op: Latency.parse(merged[f"{op}_latency"])
+            for op in ("create", "destroy", "list", "exec")
+        }
+        self.create_failure_rate = float(merged["create_failure_rate"])
+        self.exec_failure_rate = float(merged["exec_failure_rate"])
+        seed = merged.get("seed")
+        self.rng = random.Random(int(seed) if seed else None)  # nosec: B311
+        self._rng_lock = threading.Lock()
+        self._install_shims()
+
+    @property
+    def vms_dir(self) -> Path:
+        return self.root / "vms"
+
+    @property
+    def bin_dir(self) -> Path:
+        return self.root / "bin"
+
+    def _install_shims(self) -> None:
+        self.bin_dir.mkdir(parents=True, exist_ok=True)
+        shims = dict.fromkeys(_NOOP_SHIMS, "#!/bin/sh\nexit 0\n")
+        shims["tailscale"] = _TAILSCALE_SHIM
+        for name, script in shims.items():
+            path = self.bin_dir / name
+            if not path.exists():
+                tmp = path.with_name(f".{name}.{os.getpid()}.{threading.get_ident()}")
+                tmp.write_text(script)
+                tmp.chmod(0o755)
+                os.replace(tmp, path)
+
+    @contextmanager
+    def _operation(self, op: str, failure_rate: float = 0.0) -> Iterator[None]:
+        """Account for an operation, sleep its sampled latency and maybe fail it."""
+        with self._rng_lock:
+            delay = self.latency[op].sample(self.rng) * self.time_scale
+            fail = self.rng.random() < failure_rate
+        with _stats_lock:
+            s = _stats.setdefault(op, _OpStats())
+            s.calls += 1
+            s.in_flight += 1
+            s.peak = max(s.peak, s.in_flight)
+            s.seconds += delay
+        try:
+            time.sleep(delay)
+            if fail:
+                with _stats_lock:
+                    s.failures += 1
+                raise RuntimeError(f"Simulated {op} failure")
+            yield
+        finally:
+            with _stats_lock:
+                s.in_flight -= 1
+
+    def _vm_dir(self, vm_id: str) -> Path:
+        return self.vms_dir / vm_id
+
+    def _load(self, vm_dir: Path) -> VM | None:
+        try:
+            data = json.loads((vm_dir / "vm.json").read_text())
+        except (OSError, ValueError):
+            return None
+        return VM(
+            id=data["id"],
+            name=data["name"],
+            ssh_dest=f"sim://{data['name']}",
+            status=VMStatus(data["status"]),
+        )
+
+    def create(self, name: str, *, wait: bool = True) -> VM:
+        with self._operation("create", self.create_failure_rate):
+            vm_id = f"sim-{uuid.uuid4().hex[:12]}"
+            home = self._vm_dir(vm_id) / "home"
+            home.mkdir(parents=True)
+            number = int(vm_id[4:10], 16)
+            ip = f"100.{100 + number % 28}.{number >> 8 & 255}.{number & 255}"
+            (home / ".sim_tailscale_ip").write_text(ip + "\n")
+            record = {"id": vm_id, "name": name, "status": VMStatus.RUNNING.value}
+            (self._vm_dir(vm_id) / "vm.json").write_text(json.dumps(record))
+        vm = VM(id=vm_id, name=name, ssh_dest=f"sim://{name}", status=VMStatus.RUNNING)
+        if wait:
+            self.wait_ready(vm)
+        return vm
+
+    def destroy(self, vm_id: str) -> None:
+        with self._operation("destroy"):
+            vm_dir = self._vm_dir(vm_id)
+            if not vm_dir.exists():
+                raise RuntimeError(f"Simulated VM not found: {vm_id}")
+            shutil.rmtree(vm_dir)
+
+    def get(self, vm_id: str) -> VM | None:
+        return self._load(self._vm_dir(vm_id))
+
+    def list(self, prefix: str | None = None) -> list[VM]:
+        with self._operation("list"):
+            if not self.vms_dir.exists():
+                return []
+            vms = [vm for d in sorted(self.vms_dir.iterdir()) if (vm := self._load(d))]
+        return [vm for vm in vms if not prefix or vm.name.startswith(prefix)]
+
+    def wait_ready(self, vm: VM, timeout: int = 300) -> bool:
+        return self._vm_dir(vm.id).exists()
+
+    def get_connection(self, vm: VM) -> "SimulatedConnection":
+        return SimulatedConnection(self, vm)
+
+
+class SimulatedConnection:
+    """Fabric-like connection that runs commands in a simulated VM's home."""
+
+    def __init__(self, provider: SimulatedProvider, vm: VM):
+        self.provider = provider
+        self.vm = vm
+        self.home = provider._vm_dir(vm.id) / "home"
+
+    def __enter__(self) -> "SimulatedConnection":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def run(
+        self,
+        cmd: str,
+        *,
+        hide: bool = False,
+        warn: bool = False,
+        timeout: int | None = None,
+        pty: bool = False,
+    ) -> SimResult:
+        """Run cmd with bash in the VM's home, with VM-only programs shimmed."""
+        with (
+            provider_stats.timed("simulated", "exec", len(cmd.encode())) as obs,
+            self.provider._operation("exec", self.provider.exec_failure_rate),
+        ):
+            if not self.home.exists():
+                raise RuntimeError(f"Simulated VM is gone: {self.vm.name}")
+            env = {
+                **os.environ,
+                "HOME": str(self.home),
+                "PATH": f"{self.provider.bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            }
+            result = subprocess.run(  # nosec: B603, B607
+                ["bash", "-c", cmd],
+                cwd=self.home,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
+            obs.status = str(result.returncode)
+            obs.bytes_received = len(result.stdout.encode())
+        sim_result = SimResult(result.stdout, result.stderr, result.returncode, cmd)
+        if not sim_result.ok and not warn:
+            raise RuntimeError(
+                f"Command failed on {self.vm.name}: {cmd}\nstderr: {sim_result.stderr}"
+            )
+        return sim_result
+
+    def put(self, local: BytesIO | BinaryIO | Path, remote: str) -> None:
+        """Copy a file into the VM; remote must be under its home."""
+        if remote.startswith("~/"):
+            remote = str(self.home / remote[2:])
+        target = Path(remote)
+        if not target.is_absolute():
+            target = self.home / target
+        if not target.resolve().is_relative_to(self.home.resolve()):
+            raise ValueError(f"Remote path outside simulated home: {remote}")
+        data = local.read_bytes() if isinstance(local, Path) else local.read()
+        with (
+            provider_stats.timed("simulated", "put", len(data)),
+            self.provider._operation("exec", self.provider.exec_failure_rate),
+        ):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
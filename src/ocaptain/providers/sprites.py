@@ -15,6 +15,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
+from .. import provider_stats
 from ..config import CONFIG, get_ssh_keypair
 from ..provider import VM, Provider, VMStatus, register_provider
 
@@ -34,7 +35,10 @@ def _get_sprites_org() -> str:
 def _run_sprite(*args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
     """Run a sprite CLI command."""
     cmd = ["sprite", *args]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)  # nosec: B603, B607
+    with provider_stats.timed("sprites", f"cli {args[0]}") as obs:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)  # nosec: B603, B607
+        obs.status = str(result.returncode)
+        obs.bytes_received = len(result.stdout.encode())
     if result.returncode != 0 and check:
         import sys
 
@@ -86,23 +90,26 @@ class SpriteConnection:
         Returns:
             SpriteResult with stdout, stderr, and return_code
         """
-        result = subprocess.run(  # nosec: B603, B607
-            [
-                "sprite",
-                "exec",
-                "-o",
-                self.org,
-                "-s",
-                self.sprite,
-                "bash",
-                "-c",
-                cmd,
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=timeout,
-        )
+        with provider_stats.timed("sprites", "exec", len(cmd.encode())) as obs:
+            result = subprocess.run(  # nosec: B603, B607
+                [
+                    "sprite",
+                    "exec",
+                    "-o",
+                    self.org,
+                    "-s",
+                    self.sprite,
+                    "bash",
+                    "-c",
+                    cmd,
+                ],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=timeout,
+            )
+            obs.status = str(result.returncode)
+            obs.bytes_received = len(result.stdout.encode())
 
         sprite_result = SpriteResult(
             stdout=result.stdout,
@@ -144,22 +151,25 @@ class SpriteConnection:
                 local_path = tmp.name
 
         try:
-            result = subprocess.run(  # nosec: B603, B607
-                [
-                    "sprite",
-                    "exec",
-                    "-o",
-                    self.org,
-                    "-s",
-                    self.sprite,
-                    "-file",
-                    f"{local_path}:{remote}",
-                    "true",  # No-op command, file transfer is the goal
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            size = provider_stats.payload_size(Path(local_path))
+            with provider_stats.timed("sprites", "put", size) as obs:
+                result = subprocess.run(  # nosec: B603, B607
+                    [
+                        "sprite",
+                        "exec",
+                        "-o",
+                        self.org,
+                        "-s",
+                        self.sprite,
+                        "-file",
+                        f"{local_path}:{remote}",
+                        "true",  # No-op command, file transfer is the goal
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                obs.status = str(result.returncode)
 
             if result.returncode != 0:
                 raise RuntimeError(
@@ -289,12 +299,15 @@ class SpritesProvider(Provider):
                 )
                 if result.returncode == 0 and "ready" in result.stdout:
                     return True
+                provider_stats.retried()
             except KeyboardInterrupt:
                 raise
             except subprocess.TimeoutExpired:
                 logger.debug("Sprite %s exec timed out, retrying...", vm.name)
+                provider_stats.retried()
             except Exception as e:
                 logger.debug("Sprite %s exec failed: %s, retrying...", vm.name, e)
+                provider_stats.retried()
 
             time.sleep(5)
 
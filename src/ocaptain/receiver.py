@@ -0,0 +1,371 @@
+"""Built-in OTLP/HTTP receiver: an alternative to the otlp2parquet binary.
+
+Accepts OTLP logs and metrics (http/protobuf or JSON, optionally gzipped)
+on /v1/logs and /v1/metrics, buffers rows in memory per signal and service,
+and writes each batch as Parquet under the telemetry directory in the
+layout telemetry.py reads:
+
+    logs/<service>/year=YYYY/month=MM/day=DD/hour=HH/<millis>-<id>.parquet
+    metrics/<service>/year=.../hour=HH/<millis>-<id>.parquet
+
+A batch is written once it reaches max_rows or max_bytes, or max_age
+seconds after its first row. Sizes are the estimated memory held by the
+decoded rows (row_size), several times their size on the wire. Buffered and
+in-flight rows are capped by memory_limit: past it, exports get 429 with Retry-After (which OTLP
+exporters retry with backoff) until the writer catches up, so a burst from
+a large fleet slows senders down instead of growing the receiver. If
+writing fails, exports get 503 until a write succeeds again.
+
+Run with: python -m ocaptain.receiver --port 4318 --dir ~/voyages/telemetry
+(ocaptain telemetry-start --builtin does this in the background).
+"""
+
+import argparse
+import gzip
+import io
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from .otlp import decode_request
+from .telemetry import partition_name, require_pyarrow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ROWS = 10_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 30.0
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024
+# Largest export accepted (after decompression)
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+# Seconds senders are asked to wait when the receiver is saturated
+RETRY_AFTER = 5
+
+_PATHS = {"/v1/logs": "logs", "/v1/metrics": "metrics"}
+
+
+def _schema(signal_name: str) -> Any:
+    import pyarrow as pa
+
+    attributes = pa.map_(pa.string(), pa.string())
+    timestamp = pa.timestamp("ns", tz="UTC")
+    if signal_name == "logs":
+        return pa.schema(
+            [
+                ("Timestamp", timestamp),
+                ("ServiceName", pa.string()),
+                ("SeverityText", pa.string()),
+                ("SeverityNumber", pa.int32()),
+                ("Body", pa.string()),
+                ("ResourceAttributes", attributes),
+                ("ScopeName", pa.string()),
+                ("LogAttributes", attributes),
+            ]
+        )
+    return pa.schema(
+        [
+            ("Timestamp", timestamp),
+            ("StartTimestamp", timestamp),
+            ("ServiceName", pa.string()),
+            ("MetricName", pa.string()),
+            ("MetricUnit", pa.string()),
+            ("MetricType", pa.string()),
+            ("Value", pa.float64()),
+            ("Count", pa.int64()),
+            ("IsMonotonic", pa.bool_()),
+            ("AggregationTemporality", pa.int32()),
+            ("ResourceAttributes", attributes),
+            ("ScopeName", pa.string()),
+            ("Attributes", attributes),
+        ]
+    )
+
+
+def row_size(value: Any) -> int:
+    """Estimated bytes of memory held by a decoded row (dicts, lists, scalars).
+
+    Strings shared between rows are counted for each, so this errs high.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(row_size(k) + row_size(v) for k, v in value.items())
+    elif isinstance(value, list | tuple):
+        size += sum(row_size(v) for v in value)
+    return size
+
+
+@dataclass
+class _Buffer:
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    size: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+
+class BatchWriter:
+    """Buffers decoded rows and writes them as Parquet batches."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    ) -> None:
+        require_pyarrow()
+        self.root = root
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.memory_limit = memory_limit
+        self.healthy = True
+        self._buffers: dict[tuple[str, str], _Buffer] = {}
+        self._held = 0  # estimated bytes of rows buffered or being written
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def saturated(self) -> bool:
+        return self._held >= self.memory_limit
+
+    def add(self, signal_name: str, rows: list[dict[str, Any]]) -> bool:
+        """Buffer decoded rows. False if they would exceed the memory limit."""
+        if not rows:
+            return True
+        sizes = [row_size(row) for row in rows]
+        with self._lock:
+            if self._held + sum(sizes) > self.memory_limit:
+                return False
+            self._held += sum(sizes)
+            for row, size in zip(rows, sizes, strict=True):
+                buffer = self._buffers.setdefault(
+                    (signal_name, row.get("ServiceName") or "unknown"), _Buffer()
+                )
+                buffer.rows.append(row)
+                buffer.size += size
+                if len(buffer.rows) >= self.max_rows or buffer.size >= self.max_bytes:
+                    self._wake.set()
+        return True
+
+    def _take(self, force: bool) -> list[tuple[tuple[str, str], _Buffer]]:
+        """Remove and return the buffers that are full, old enough, or all if force."""
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                key
+                for key, buffer in self._buffers.items()
+                if force
+                or len(buffer.rows) >= self.max_rows
+                or buffer.size >= self.max_bytes
+                or now - buffer.started >= self.max_age
+            ]
+            return [(key, self._buffers.pop(key)) for key in due]
+
+    def flush(self, force: bool = False) -> int:
+        """Write due buffers (every buffer if force). Returns rows written."""
+        written = 0
+        for (signal_name, service), buffer in self._take(force):
+            try:
+                self._write(signal_name, service, buffer.rows)
+                written += len(buffer.rows)
+                self.healthy = True
+            except Exception:
+                logger.exception(
+                    "Writing %d %s rows failed; dropping them", len(buffer.rows), signal_name
+                )
+                self.healthy = False
+            finally:
+                with self._lock:
+                    self._held -= buffer.size
+        return written
+
+    def _write(self, signal_name: str, service: str, rows: list[dict[str, Any]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # One file per hour of row timestamps, so hour partitions stay exact
+        by_hour: dict[datetime, list[dict[str, Any]]] = {}
+        for row in rows:
+            hour = datetime.fromtimestamp(row["Timestamp"] / 1e9, UTC).replace(
+                minute=0, second=0, microsecond=0
+            )
+            by_hour.setdefault(hour, []).append(row)
+
+        schema = _schema(signal_name)
+        for hour, hour_rows in by_hour.items():
+            directory = (
+                self.root
+                / signal_name
+                / partition_name(service)
+                / f"year={hour:%Y}"
+                / f"month={hour:%m}"
+                / f"day={hour:%d}"
+                / f"hour={hour:%H}"
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}.parquet"
+            # Readers and compaction only pick up *.parquet, so never see a partial file
+            tmp = path.with_name(f"{path.name}.tmp")
+            pq.write_table(pa.Table.from_pylist(hour_rows, schema=schema), tmp, compression="zstd")
+            os.replace(tmp, path)
+
+    def start(self) -> None:
+        """Flush in a background thread as buffers fill or age."""
+
+        def loop() -> None:
+            while not self._stop.is_set():
+                self._wake.wait(timeout=1.0)
+                self._wake.clear()
+                self.flush()
+
+        self._thread = threading.Thread(target=loop, name="otlp-flush", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the flush thread and write everything still buffered."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+        self.flush(force=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: exporters reuse connections
+    server: "OTLPReceiver"
+
+    def _reply(
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _refuse(self, status: int) -> None:
+        # Body is left unread, so the connection can't be reused
+        self.close_connection = True
+        self._reply(status, headers={"Retry-After": str(RETRY_AFTER), "Connection": "close"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        signal_name = _PATHS.get(self.path.split("?", 1)[0])
+        writer = self.server.writer
+        length = int(self.headers.get("Content-Length") or 0)
+        if signal_name is None:
+            self.close_connection = True
+            self._reply(404)
+            return
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self._reply(413)
+            return
+        if writer.saturated():
+            self._refuse(429)
+            return
+        if not writer.healthy:
+            self._refuse(503)
+            return
+
+        body = self.rfile.read(length)
+        json_encoded = "json" in self.headers.get("Content-Type", "")
+        try:
+            if self.headers.get("Content-Encoding", "").lower() == "gzip":
+                body = _gunzip(body)
+            rows = decode_request(signal_name, body, json_encoded)
+        except (ValueError, OSError, EOFError) as e:
+            self._reply(400, str(e).encode(), "text/plain")
+            return
+
+        if not writer.add(signal_name, rows):
+            self._reply(429, headers={"Retry-After": str(RETRY_AFTER)})
+            return
+        # An empty Export*ServiceResponse means every record was accepted
+        if json_encoded:
+            self._reply(200, b"{}", "application/json")
+        else:
+            self._reply(200, b"", "application/x-protobuf")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def _gunzip(body: bytes) -> bytes:
+    """Decompress a gzip body, refusing ones that expand past MAX_REQUEST_BYTES."""
+    with gzip.GzipFile(fileobj=io.BytesIO(body)) as f:
+        data = f.read(MAX_REQUEST_BYTES + 1)
+    if len(data) > MAX_REQUEST_BYTES:
+        raise ValueError("decompressed request too large")
+    return data
+
+
+class OTLPReceiver(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], writer: BatchWriter) -> None:
+        super().__init__(address, _Handler)
+        self.writer = writer
+
+
+def serve(root: Path, host: str = "127.0.0.1", port: int = 4318, **limits: Any) -> None:
+    """Receive OTLP until interrupted or terminated, then flush buffered rows."""
+    writer = BatchWriter(root, **limits)
+    server = OTLPReceiver((host, port), writer)
+    writer.start()
+
+    def terminate(*_: object) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, terminate)
+    logger.info("Receiving OTLP on http://%s:%d, writing to %s", host, port, root)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        writer.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Built-in OTLP/HTTP receiver for ocaptain")
+    parser.add_argument("--dir", required=True, type=Path, help="Telemetry directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--max-rows", type=int, default=DEFAULT_MAX_ROWS)
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    parser.add_argument("--max-age", type=float, default=DEFAULT_MAX_AGE)
+    parser.add_argument("--memory-limit", type=int, default=DEFAULT_MEMORY_LIMIT)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    serve(
+        args.dir.expanduser(),
+        args.host,
+        args.port,
+        max_rows=args.max_rows,
+        max_bytes=args.max_bytes,
+        max_age=args.max_age,
+        memory_limit=args.memory_limit,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@ set -e
 
 CONFIG_DIR="$HOME/.config/ocaptain"
 VOYAGES_DIR="$HOME/voyages"
+PORT="${OCAPTAIN_OTLP_PORT:-4318}"
+# Set by `ocaptain telemetry-start --builtin`: run the built-in receiver with this python
+RECEIVER_PYTHON="${OCAPTAIN_RECEIVER_PYTHON:-}"
 
 # Find tailscale binary (handles macOS app bundle)
 find_tailscale() {
@@ -25,7 +28,7 @@ mkdir -p "$CONFIG_DIR" "$VOYAGES_DIR/telemetry"
 # Write otlp2parquet config
 cat > "$CONFIG_DIR/otlp2parquet.toml" << EOF
 [server]
-listen_addr = "127.0.0.1:4318"
+listen_addr = "127.0.0.1:$PORT"
 log_level = "info"
 log_format = "text"
 
@@ -45,24 +48,30 @@ EOF
 # Check if already running
 if [ -f "$CONFIG_DIR/otlp2parquet.pid" ]; then
     if kill -0 "$(cat "$CONFIG_DIR/otlp2parquet.pid")" 2>/dev/null; then
-        echo "otlp2parquet already running"
+        echo "Telemetry collector already running"
         exit 0
     fi
 fi
 
-# Start otlp2parquet
-echo "Starting otlp2parquet on 127.0.0.1:4318..."
-nohup otlp2parquet --config "$CONFIG_DIR/otlp2parquet.toml" \
-    > "$VOYAGES_DIR/telemetry/collector.log" 2>&1 &
+if [ -n "$RECEIVER_PYTHON" ]; then
+    echo "Starting built-in OTLP receiver on 127.0.0.1:$PORT..."
+    nohup "$RECEIVER_PYTHON" -m ocaptain.receiver --port "$PORT" --dir "$VOYAGES_DIR/telemetry" \
+        > "$VOYAGES_DIR/telemetry/collector.log" 2>&1 &
+else
+    echo "Starting otlp2parquet on 127.0.0.1:$PORT..."
+    nohup otlp2parquet --config "$CONFIG_DIR/otlp2parquet.toml" \
+        > "$VOYAGES_DIR/telemetry/collector.log" 2>&1 &
+fi
+# Same pid file for either collector, so stop-telemetry.sh stops both
 echo $! > "$CONFIG_DIR/otlp2parquet.pid"
 
 # Expose via Tailscale
 echo "Exposing OTLP via Tailscale..."
-$TAILSCALE serve --bg --tcp 4318 tcp://127.0.0.1:4318
+$TAILSCALE serve --bg --tcp "$PORT" "tcp://127.0.0.1:$PORT"
 
 # Get tailscale IP
 TAILSCALE_IP=$($TAILSCALE ip -4)
 echo ""
 echo "=== Telemetry collector ready ==="
-echo "OTLP endpoint: http://$TAILSCALE_IP:4318"
+echo "OTLP endpoint: http://$TAILSCALE_IP:$PORT"
 echo ""
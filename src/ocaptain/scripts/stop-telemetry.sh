@@ -2,6 +2,7 @@
 set -e
 
 CONFIG_DIR="$HOME/.config/ocaptain"
+PORT="${OCAPTAIN_OTLP_PORT:-4318}"
 
 # Find tailscale binary (handles macOS app bundle)
 find_tailscale() {
@@ -18,9 +19,9 @@ TAILSCALE=$(find_tailscale)
 echo "Stopping ocaptain telemetry collector..."
 
 # Stop tailscale serve
-$TAILSCALE serve --tcp 4318 off 2>/dev/null || true
+$TAILSCALE serve --tcp "$PORT" off 2>/dev/null || true
 
-# Stop otlp2parquet
+# Stop the collector (otlp2parquet or the built-in receiver)
 if [ -f "$CONFIG_DIR/otlp2parquet.pid" ]; then
     kill "$(cat "$CONFIG_DIR/otlp2parquet.pid")" 2>/dev/null || true
     rm "$CONFIG_DIR/otlp2parquet.pid"
@@ -3,7 +3,7 @@
 import os
 import subprocess  # nosec B404
 
-from .config import CONFIG  # Ensures .env files are loaded
+from .config import get_config
 
 
 def load_tokens() -> dict[str, str]:
@@ -14,7 +14,7 @@ def load_tokens() -> dict[str, str]:
     GH_TOKEN is optional.
     """
     # Force config load to ensure .env files are processed
-    _ = CONFIG
+    get_config()
 
     tokens: dict[str, str] = {}
 
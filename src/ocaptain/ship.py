@@ -48,7 +48,11 @@ def _bootstrap_tailscale(c: Connection, ship_name: str, oauth_secret: str, ship_
         hide=True,
     )
 
-    # Get assigned IP
+    # Get assigned IP from our own peer map, falling back to asking the ship
+    from .tailscale import peer_ip
+
+    if ip := peer_ip(ship_name):
+        return ip
     result = c.run("tailscale ip -4", hide=True)
     return str(result.stdout.strip())
 
@@ -64,7 +68,7 @@ def bootstrap_ship(
     Ships are tagged with tag:ocaptain-ship for ACL isolation.
     Returns (ship_vm, ship_tailscale_ip).
     """
-    from .config import CONFIG
+    from .config import CONFIG, tailscale_ip
 
     if tokens is None:
         tokens = {}
@@ -76,7 +80,7 @@ def bootstrap_ship(
     # Verify tailscale config
     if not CONFIG.tailscale.oauth_secret:
         raise ValueError("Tailscale OAuth secret required. Set OCAPTAIN_TAILSCALE_OAUTH_SECRET")
-    if not CONFIG.tailscale.ip:
+    if not (local_ip := tailscale_ip()):
         raise ValueError("Tailscale IP not detected. Is Tailscale running?")
 
     # 1. Create ship VM
@@ -104,6 +108,10 @@ def bootstrap_ship(
         c.put(BytesIO(expect_script.encode()), f"{home}/.ocaptain/run-claude.exp")
         c.run("chmod +x ~/.ocaptain/run-claude.exp")
 
+        # Install log writer (rotates and compresses ship logs)
+        log_rotate = files("ocaptain.templates").joinpath("log_rotate.py").read_text()
+        c.put(BytesIO(log_rotate.encode()), f"{home}/.ocaptain/log-rotate.py")
+
         # 6. Configure Claude
         c.run("mkdir -p ~/.claude")
         c.run("echo '{\"hasCompletedOnboarding\":true}' > ~/.claude.json")
@@ -119,7 +127,7 @@ def bootstrap_ship(
                     "OTEL_METRICS_EXPORTER": "otlp",
                     "OTEL_LOGS_EXPORTER": "otlp",
                     "OTEL_EXPORTER_OTLP_PROTOCOL": "http/protobuf",
-                    "OTEL_EXPORTER_OTLP_ENDPOINT": f"http://{CONFIG.tailscale.ip}:{CONFIG.local.otlp_port}",
+                    "OTEL_EXPORTER_OTLP_ENDPOINT": f"http://{local_ip}:{CONFIG.local.otlp_port}",
                     "OTEL_RESOURCE_ATTRIBUTES": f"voyage.id={voyage.id},ship.id={ship_id}",
                 }
             )
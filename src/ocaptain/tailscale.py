@@ -0,0 +1,179 @@
+"""Cached Tailscale state of this machine and its peers.
+
+`tailscale status --json` is parsed once and cached in
+~/.config/ocaptain/tailscale.json for CACHE_TTL seconds, so config
+loading, doctor, the sail preflight and ship IP lookups share one call
+instead of each shelling out. A failed query removes the cache, so the
+next caller asks tailscale again rather than trusting stale state.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess  # nosec: B404
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = "tailscale.json"
+CACHE_TTL = 30.0
+STATUS_TIMEOUT = 5
+
+
+@dataclass
+class Peer:
+    """A tailnet node as seen from this machine."""
+
+    ip: str | None
+    online: bool
+    cur_addr: str = ""  # direct endpoint, empty when traffic goes via DERP
+    relay: str = ""  # home DERP region
+
+    @property
+    def direct(self) -> bool:
+        return bool(self.cur_addr)
+
+
+@dataclass
+class TailscaleStatus:
+    """This machine's Tailscale IP, online state, tags and peers (by hostname)."""
+
+    ip: str | None
+    online: bool
+    tags: list[str] = field(default_factory=list)
+    peers: dict[str, Peer] = field(default_factory=dict)
+    checked_at: float = 0.0
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.checked_at
+
+
+def cache_path() -> Path:
+    return Path.home() / ".config" / "ocaptain" / CACHE_FILE
+
+
+# Where the macOS app (and its optional CLI symlink) install tailscale off PATH
+_FALLBACK_PATHS = (
+    "/Applications/Tailscale.app/Contents/MacOS/Tailscale",
+    "/usr/local/bin/tailscale",
+)
+
+
+def find_tailscale() -> str | None:
+    """Find tailscale binary, including macOS app bundle."""
+    if path := shutil.which("tailscale"):
+        return path
+
+    for fallback in _FALLBACK_PATHS:
+        if Path(fallback).exists():
+            return fallback
+
+    return None
+
+
+def _ipv4(ips: list[str] | None) -> str | None:
+    return next((ip for ip in ips or [] if "." in ip), None)
+
+
+def parse_status(data: dict[str, Any], checked_at: float | None = None) -> TailscaleStatus:
+    """Build a TailscaleStatus from `tailscale status --json` output.
+
+    When several nodes share a hostname (a ship recreated before its old node
+    expired), an online one is kept over offline ones.
+    """
+    me = data.get("Self") or {}
+    peers: dict[str, Peer] = {}
+    for node in (data.get("Peer") or {}).values():
+        if not (name := node.get("HostName")):
+            continue
+        peer = Peer(
+            ip=_ipv4(node.get("TailscaleIPs")),
+            online=bool(node.get("Online")),
+            cur_addr=node.get("CurAddr") or "",
+            relay=node.get("Relay") or "",
+        )
+        if peer.online or not (name in peers and peers[name].online):
+            peers[name] = peer
+    return TailscaleStatus(
+        ip=_ipv4(me.get("TailscaleIPs")),
+        online=bool(me.get("Online")) and data.get("BackendState", "Running") == "Running",
+        tags=list(me.get("Tags") or []),
+        peers=peers,
+        checked_at=time.time() if checked_at is None else checked_at,
+    )
+
+
+def _read_cache() -> TailscaleStatus | None:
+    try:
+        data = json.loads(cache_path().read_text())
+        data["peers"] = {name: Peer(**peer) for name, peer in data.get("peers", {}).items()}
+        return TailscaleStatus(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_cache(status: TailscaleStatus) -> None:
+    path = cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(asdict(status)))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Could not write Tailscale cache: %s", e)
+
+
+def invalidate() -> None:
+    """Forget cached state, e.g. after a connection over the tailnet failed."""
+    cache_path().unlink(missing_ok=True)
+
+
+def _query() -> TailscaleStatus | None:
+    tailscale = find_tailscale()
+    if not tailscale:
+        return None
+    try:
+        result = subprocess.run(  # nosec: B603
+            [tailscale, "status", "--json"],
+            capture_output=True,
+            text=True,
+            timeout=STATUS_TIMEOUT,
+            check=False,
+        )
+        if result.returncode != 0:
+            return None
+        return parse_status(json.loads(result.stdout))
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        return None
+
+
+def status(max_age: float = CACHE_TTL, refresh: bool = False) -> TailscaleStatus | None:
+    """Current Tailscale state, from the cache if younger than max_age.
+
+    Returns None (and drops the cache) when tailscale is missing, stopped
+    or not answering.
+    """
+    if not refresh and (cached := _read_cache()) and 0 <= cached.age < max_age:
+        return cached
+    current = _query()
+    if current is None:
+        invalidate()
+    else:
+        _write_cache(current)
+    return current
+
+
+def peer_ip(hostname: str) -> str | None:
+    """An online peer's Tailscale IPv4, re-querying once if the cached map has none."""
+    for refresh in (False, True):
+        current = status(refresh=refresh)
+        if current is None:
+            return None
+        if (peer := current.peers.get(hostname)) and peer.online and peer.ip:
+            return peer.ip
+    return None
@@ -2,7 +2,14 @@
 
 import json
 import logging
-from dataclasses import dataclass
+import os
+import shlex
+import sys
+import tempfile
+import time
+from collections import Counter, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -10,8 +17,6 @@ from pathlib import Path
 # Forward reference for Voyage to avoid circular import
 from typing import TYPE_CHECKING, Any
 
-from fabric import Connection
-
 from .config import CONFIG
 from .provider import VM
 
@@ -30,6 +35,20 @@ def _parse_datetime(value: str) -> datetime:
     return dt
 
 
+def _lazy_datetime(task: "Task", value: str, field_name: str) -> datetime | None:
+    """Parse a timestamp kept as a string; a malformed one reads as missing.
+
+    Timestamps are parsed on first access rather than in from_json, so a bad
+    value must not raise here: status, watch and reclaim would fail for the
+    whole voyage instead of one task.
+    """
+    try:
+        return _parse_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning("Task %s has an invalid %s timestamp: %r", task.id, field_name, value)
+        return None
+
+
 class TaskStatus(str, Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -50,9 +69,46 @@ class VoyageState(str, Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+# Status lookup for from_json: one dict hit instead of Enum value resolution
+_STATUS_BY_VALUE: dict[str, TaskStatus] = {s.value: s for s in TaskStatus}
+
+_TASK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "blocked_by",
+    "blocks",
+    "created",
+    "updated",
+    "assignee",
+    "claimed_at",
+    "completed_by",
+    "completed_at",
+)
+
+
 class Task:
-    """A task from the task list."""
+    """A task from the task list.
+
+    Tasks are slotted to keep large plans small in memory. Timestamps are kept
+    as the ISO strings from the task JSON and parsed on first access.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "blocked_by",
+        "blocks",
+        "assignee",
+        "completed_by",
+        "_created",
+        "_updated",
+        "_claimed_at",
+        "_completed_at",
+    )
 
     id: str
     title: str
@@ -60,51 +116,126 @@ class Task:
     status: TaskStatus
     blocked_by: list[str]
     blocks: list[str]
-    created: datetime
-    updated: datetime
-    assignee: str | None = None
-    claimed_at: datetime | None = None
-    completed_by: str | None = None
-    completed_at: datetime | None = None
+    assignee: str | None
+    completed_by: str | None
+    _created: datetime | str | None
+    _updated: datetime | str | None
+    _claimed_at: datetime | str | None
+    _completed_at: datetime | str | None
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        description: str,
+        status: TaskStatus,
+        blocked_by: list[str],
+        blocks: list[str],
+        created: datetime | str | None = None,
+        updated: datetime | str | None = None,
+        assignee: str | None = None,
+        claimed_at: datetime | str | None = None,
+        completed_by: str | None = None,
+        completed_at: datetime | str | None = None,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.blocked_by = blocked_by
+        self.blocks = blocks
+        self.assignee = assignee
+        self.completed_by = completed_by
+        self._created = created or None
+        self._updated = updated or None
+        self._claimed_at = claimed_at or None
+        self._completed_at = completed_at or None
 
     @classmethod
     def from_json(cls, data: dict[str, Any]) -> "Task":
-        metadata = data.get("metadata", {})
+        metadata = data.get("metadata") or {}
         # Claude Code uses "subject" but our pre-created tasks use "title"
         title = data.get("title") or data.get("subject", "")
-        # Handle missing timestamps (Claude-created tasks may not have them)
-        now = datetime.now(UTC)
-        created = _parse_datetime(data["created"]) if "created" in data else now
-        updated = _parse_datetime(data["updated"]) if "updated" in data else now
+        status = _STATUS_BY_VALUE.get(data["status"])
+        if status is None:
+            raise ValueError(f"{data['status']!r} is not a valid TaskStatus")
+        assignee = data.get("owner") or metadata.get("assignee") or metadata.get("ship")
+        completed_by = metadata.get("completed_by")
+        # Claude-created tasks may not have created/updated; those stay None
         return cls(
             id=data["id"],
             title=title,
             description=data.get("description", ""),
-            status=TaskStatus(data["status"]),
-            blocked_by=data.get("blockedBy", []),
-            blocks=data.get("blocks", []),
-            created=created,
-            updated=updated,
-            assignee=data.get("owner") or metadata.get("assignee") or metadata.get("ship"),
-            claimed_at=(
-                _parse_datetime(metadata["claimed_at"]) if metadata.get("claimed_at") else None
-            ),
-            completed_by=metadata.get("completed_by"),
-            completed_at=(
-                _parse_datetime(metadata["completed_at"]) if metadata.get("completed_at") else None
-            ),
+            status=status,
+            blocked_by=data.get("blockedBy") or [],
+            blocks=data.get("blocks") or [],
+            created=data.get("created"),
+            updated=data.get("updated"),
+            # Ship IDs repeat across thousands of tasks; share one string each
+            assignee=sys.intern(assignee) if assignee else None,
+            claimed_at=metadata.get("claimed_at"),
+            completed_by=sys.intern(completed_by) if completed_by else None,
+            completed_at=metadata.get("completed_at"),
         )
 
-    def is_stale(self, threshold_minutes: int | None = None) -> bool:
-        """Check if an in-progress task is stale."""
+    @property
+    def created(self) -> datetime | None:
+        if isinstance(self._created, str):
+            self._created = _lazy_datetime(self, self._created, "created")
+        return self._created
+
+    @property
+    def updated(self) -> datetime | None:
+        if isinstance(self._updated, str):
+            self._updated = _lazy_datetime(self, self._updated, "updated")
+        return self._updated
+
+    @property
+    def claimed_at(self) -> datetime | None:
+        if isinstance(self._claimed_at, str):
+            self._claimed_at = _lazy_datetime(self, self._claimed_at, "claimed_at")
+        return self._claimed_at
+
+    @property
+    def completed_at(self) -> datetime | None:
+        if isinstance(self._completed_at, str):
+            self._completed_at = _lazy_datetime(self, self._completed_at, "completed_at")
+        return self._completed_at
+
+    def __repr__(self) -> str:
+        return f"Task(id={self.id!r}, status={self.status.value!r}, assignee={self.assignee!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _TASK_FIELDS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def is_stale(self, threshold_minutes: int | None = None, now: datetime | None = None) -> bool:
+        """Check if an in-progress task is stale (as of `now`, default: current time)."""
         if self.status != TaskStatus.IN_PROGRESS or not self.claimed_at:
             return False
 
         threshold = threshold_minutes or CONFIG.stale_threshold_minutes
-        age = datetime.now(UTC) - self.claimed_at
+        age = (now or datetime.now(UTC)) - self.claimed_at
         return age.total_seconds() > threshold * 60
 
 
+def ready_tasks(tasks: list[Task]) -> list[Task]:
+    """Return pending tasks whose blockers are all completed.
+
+    Blockers missing from the list count as satisfied, since ships may
+    delete tasks once they are done.
+    """
+    open_ids = {t.id for t in tasks if t.status != TaskStatus.COMPLETED}
+    return [
+        t
+        for t in tasks
+        if t.status == TaskStatus.PENDING and not any(b in open_ids for b in t.blocked_by)
+    ]
+
+
 @dataclass(frozen=True)
 class ShipStatus:
     """Derived status for a ship."""
@@ -130,195 +261,474 @@ class VoyageStatus:
     tasks_total: int
 
 
-def list_tasks(storage: VM, voyage: "Voyage") -> list[Task]:
-    """Read all tasks from storage VM."""
-    with Connection(storage.ssh_dest) as c:
-        # List task files
-        result = c.run(
-            f"ls ~/.claude/tasks/{voyage.task_list_id}/*.json 2>/dev/null || echo ''",
-            hide=True,
-        )
+@dataclass
+class StatusAggregator:
+    """Single-pass reducer from tasks to voyage status.
 
-        if not result.stdout.strip():
-            return []
+    Feed tasks with add() (and remove() for incremental updates), then call
+    status(). Counts and per-ship tallies are maintained as tasks arrive; stale
+    checks run once per in-progress task against a single captured `now`.
+    Shared by the remote, local and cached status paths.
+    """
 
-        # Read all task files
-        result = c.run(
-            f"cat ~/.claude/tasks/{voyage.task_list_id}/*.json",
-            hide=True,
-        )
+    by_status: Counter[TaskStatus] = field(default_factory=Counter)
+    ship_tasks: Counter[str] = field(default_factory=Counter)
+    ship_completed: Counter[str] = field(default_factory=Counter)
+    # In-progress tasks (overall and per ship), keyed by task ID
+    in_progress: dict[str, Task] = field(default_factory=dict)
+    ship_claims: dict[str, dict[str, Task]] = field(default_factory=dict)
 
-        # Parse JSON objects (one per file, concatenated)
-        tasks = []
-        decoder = json.JSONDecoder()
-        content = result.stdout.strip()
-        pos = 0
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "StatusAggregator":
+        """Aggregate any task iterator in one pass."""
+        aggregator = cls()
+        for task in tasks:
+            aggregator.add(task)
+        return aggregator
+
+    @property
+    def total(self) -> int:
+        """Number of tasks currently aggregated."""
+        return sum(self.by_status.values())
+
+    def add(self, task: Task) -> None:
+        """Account for one task."""
+        self.by_status[task.status] += 1
+        if task.status == TaskStatus.IN_PROGRESS:
+            self.in_progress[task.id] = task
+        if not task.assignee:
+            return
+        self.ship_tasks[task.assignee] += 1
+        if task.status == TaskStatus.COMPLETED:
+            self.ship_completed[task.assignee] += 1
+        elif task.status == TaskStatus.IN_PROGRESS:
+            self.ship_claims.setdefault(task.assignee, {})[task.id] = task
 
-        while pos < len(content):
-            try:
-                obj, end = decoder.raw_decode(content, pos)
-                tasks.append(Task.from_json(obj))
-                pos = end
-                # Skip whitespace between objects
-                while pos < len(content) and content[pos].isspace():
-                    pos += 1
-            except json.JSONDecodeError as e:
-                logger.error(
-                    "Failed to parse task JSON for voyage %s at position %d, "
-                    "returning %d of potentially more tasks: %s",
-                    voyage.task_list_id,
-                    pos,
-                    len(tasks),
-                    e,
+    def remove(self, task: Task) -> None:
+        """Undo a previous add() of the same task."""
+        self.by_status[task.status] -= 1
+        if task.status == TaskStatus.IN_PROGRESS:
+            self.in_progress.pop(task.id, None)
+        if not task.assignee:
+            return
+        self.ship_tasks[task.assignee] -= 1
+        if not self.ship_tasks[task.assignee]:
+            del self.ship_tasks[task.assignee]
+        if task.status == TaskStatus.COMPLETED:
+            self.ship_completed[task.assignee] -= 1
+        elif task.status == TaskStatus.IN_PROGRESS:
+            claims = self.ship_claims.get(task.assignee, {})
+            claims.pop(task.id, None)
+            if not claims:
+                self.ship_claims.pop(task.assignee, None)
+
+    def status(
+        self,
+        voyage: "Voyage",
+        threshold_minutes: int | None = None,
+        now: datetime | None = None,
+    ) -> VoyageStatus:
+        """Build the voyage status from the current tallies."""
+        now = now or datetime.now(UTC)
+        threshold = threshold_minutes or CONFIG.stale_threshold_minutes
+        stale_ids = {t.id for t in self.in_progress.values() if t.is_stale(threshold, now)}
+
+        ships = []
+        for ship_id in sorted(self.ship_tasks):
+            claims = self.ship_claims.get(ship_id)
+            current = claims[max(claims)] if claims else None
+            if current is not None:
+                state = ShipState.STALE if current.id in stale_ids else ShipState.WORKING
+            elif self.ship_completed[ship_id] > 0:
+                state = ShipState.IDLE
+            else:
+                state = ShipState.UNKNOWN
+            ships.append(
+                ShipStatus(
+                    id=ship_id,
+                    state=state,
+                    current_task=current.id if current else None,
+                    claimed_at=current.claimed_at if current else None,
+                    completed_count=self.ship_completed[ship_id],
                 )
-                break
+            )
 
-        return tasks
+        complete = self.by_status[TaskStatus.COMPLETED]
+        in_progress_count = self.by_status[TaskStatus.IN_PROGRESS]
+        pending = self.by_status[TaskStatus.PENDING]
+        total = complete + in_progress_count + pending
+        stale = len(stale_ids)
+
+        voyage_state: VoyageState
+        if complete == total:
+            voyage_state = VoyageState.COMPLETE
+        elif in_progress_count == 0 and pending:
+            voyage_state = VoyageState.PLANNING
+        elif stale == in_progress_count and in_progress_count > 0 and pending:
+            voyage_state = VoyageState.STALLED
+        else:
+            voyage_state = VoyageState.RUNNING
 
+        return VoyageStatus(
+            voyage=voyage,
+            state=voyage_state,
+            ships=tuple(ships),
+            tasks_complete=complete,
+            tasks_in_progress=in_progress_count,
+            tasks_pending=pending,
+            tasks_stale=stale,
+            tasks_total=total,
+        )
 
-def _check_voyage_artifacts(storage: VM) -> tuple[bool, bool]:
-    """Check voyage artifacts for status indicators.
 
-    Returns:
-        Tuple of (has_completion_marker, has_progress_file)
-    """
+@dataclass
+class ProgressTracker:
+    """Completion throughput and ETA from status snapshots taken over time."""
+
+    window_seconds: float = 900.0
+    _samples: deque[tuple[float, int, dict[str, int]]] = field(default_factory=deque)
+
+    def record(self, voyage_status: VoyageStatus, at: float | None = None) -> None:
+        """Add a snapshot, dropping samples that fell out of the window."""
+        at = time.monotonic() if at is None else at
+        per_ship = {s.id: s.completed_count for s in voyage_status.ships}
+        self._samples.append((at, voyage_status.tasks_complete, per_ship))
+        while len(self._samples) > 2 and at - self._samples[1][0] >= self.window_seconds:
+            self._samples.popleft()
+
+    def rate(self, ship_id: str | None = None) -> float | None:
+        """Completed tasks per hour over the window (None until measurable)."""
+        if len(self._samples) < 2:
+            return None
+        start_at, start_complete, start_ships = self._samples[0]
+        end_at, end_complete, end_ships = self._samples[-1]
+        elapsed = end_at - start_at
+        if elapsed <= 0:
+            return None
+        if ship_id is None:
+            done = end_complete - start_complete
+        else:
+            done = end_ships.get(ship_id, 0) - start_ships.get(ship_id, 0)
+        return max(done, 0) * 3600 / elapsed
+
+
+# Runs on the storage VM: prints one JSON record per task file (NDJSON), then a
+# trailer with every current file name and the artifact markers. Files with an
+# mtime at or before the cursor (argv[2]) are listed in the trailer only.
+_REMOTE_FETCH_SCRIPT = """
+import glob, json, os, sys
+task_dir, since = os.path.expanduser(sys.argv[1]), float(sys.argv[2])
+names = []
+for path in sorted(glob.glob(os.path.join(task_dir, "*.json"))):
+    name = os.path.basename(path)
+    names.append(name)
     try:
-        with Connection(storage.ssh_dest) as c:
-            check_cmd = (
-                "test -f ~/voyage/artifacts/voyage-complete.marker "
-                "&& echo marker:yes || echo marker:no; "
-                "test -f ~/voyage/artifacts/progress.txt "
-                "&& echo progress:yes || echo progress:no"
-            )
-            result = c.run(check_cmd, hide=True)
-            output = result.stdout.strip()
-            has_marker = "marker:yes" in output
-            has_progress = "progress:yes" in output
-            return has_marker, has_progress
-    except Exception as e:
-        logger.warning(
-            "Failed to check voyage artifacts on storage %s: %s",
-            storage.ssh_dest,
-            e,
-        )
-        return False, False
+        mtime = os.stat(path).st_mtime
+        if mtime <= since:
+            continue
+        with open(path, encoding="utf-8", errors="replace") as f:
+            record = {"file": name, "mtime": mtime, "body": f.read()}
+    except OSError as e:
+        record = {"file": name, "error": str(e)}
+    print(json.dumps(record))
+artifacts = os.path.expanduser("~/voyage/artifacts")
+print(json.dumps({
+    "files": names,
+    "marker": os.path.exists(os.path.join(artifacts, "voyage-complete.marker")),
+    "progress": os.path.exists(os.path.join(artifacts, "progress.txt")),
+}))
+"""
 
 
-def derive_status(voyage: "Voyage", storage: VM) -> VoyageStatus:
-    """Derive full voyage status from task list."""
-    tasks = list_tasks(storage, voyage)
-
-    if not tasks:
-        # No tasks - check artifacts for status
-        has_marker, has_progress = _check_voyage_artifacts(storage)
-        if has_marker:
-            inferred_state = VoyageState.COMPLETE
-        elif has_progress:
-            inferred_state = VoyageState.RUNNING
-        else:
-            inferred_state = VoyageState.PLANNING
+@dataclass
+class TaskFetch:
+    """Result of one remote task fetch.
 
-        return VoyageStatus(
-            voyage=voyage,
-            state=inferred_state,
-            ships=(),
-            tasks_complete=0,
-            tasks_in_progress=0,
-            tasks_pending=0,
-            tasks_stale=0,
-            tasks_total=0,
-        )
+    For incremental fetches (since > 0), `tasks` holds only files changed after
+    the cursor; `files` always lists every task file present, so callers can
+    drop deleted tasks from what they already hold.
+    """
 
-    # Count task states
-    complete = [t for t in tasks if t.status == TaskStatus.COMPLETED]
-    in_progress = [t for t in tasks if t.status == TaskStatus.IN_PROGRESS]
-    pending = [t for t in tasks if t.status == TaskStatus.PENDING]
-    stale = [t for t in in_progress if t.is_stale()]
+    tasks: dict[str, Task] = field(default_factory=dict)  # keyed by file name
+    errors: dict[str, str] = field(default_factory=dict)  # file name -> error
+    files: list[str] = field(default_factory=list)
+    cursor: float = 0.0  # newest mtime seen; pass as `since` to fetch only changes
+    has_marker: bool = False
+    has_progress: bool = False
 
-    # Derive ship states from task metadata using mutable intermediate state
-    ship_data: dict[str, dict[str, Any]] = {}
 
-    for task in tasks:
-        if not task.assignee:
+def parse_task_ndjson(output: str, since: float = 0.0) -> TaskFetch:
+    """Parse remote fetch output. Bad records fail alone, never the whole fetch."""
+    fetch = TaskFetch(cursor=since)
+
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.error("Skipping malformed fetch record: %s", e)
             continue
 
-        if task.assignee not in ship_data:
-            ship_data[task.assignee] = {
-                "state": ShipState.UNKNOWN,
-                "current_task": None,
-                "claimed_at": None,
-                "completed_count": 0,
-            }
+        if "file" not in record:
+            fetch.files = record.get("files", [])
+            fetch.has_marker = bool(record.get("marker"))
+            fetch.has_progress = bool(record.get("progress"))
+            continue
 
-        data = ship_data[task.assignee]
-        if task.status == TaskStatus.COMPLETED:
-            data["completed_count"] += 1
-        elif task.status == TaskStatus.IN_PROGRESS:
-            data["state"] = ShipState.STALE if task.is_stale() else ShipState.WORKING
-            data["current_task"] = task.id
-            data["claimed_at"] = task.claimed_at
-
-    # Ships with no in-progress task but completed tasks are idle
-    for data in ship_data.values():
-        if data["state"] == ShipState.UNKNOWN and data["completed_count"] > 0:
-            data["state"] = ShipState.IDLE
-
-    # Convert to frozen ShipStatus objects
-    ships = tuple(
-        sorted(
-            (
-                ShipStatus(
-                    id=ship_id,
-                    state=data["state"],
-                    current_task=data["current_task"],
-                    claimed_at=data["claimed_at"],
-                    completed_count=data["completed_count"],
-                )
-                for ship_id, data in ship_data.items()
-            ),
-            key=lambda s: s.id,
-        )
-    )
+        name = record["file"]
+        if "error" in record:
+            fetch.errors[name] = record["error"]
+            continue
+
+        fetch.cursor = max(fetch.cursor, record.get("mtime", 0.0))
+        try:
+            fetch.tasks[name] = Task.from_json(json.loads(record["body"]))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            fetch.errors[name] = str(e)
+
+    return fetch
 
-    # Derive voyage state
-    voyage_state: VoyageState
-    if len(complete) == len(tasks):
-        voyage_state = VoyageState.COMPLETE
-    elif len(in_progress) == 0 and pending:
-        voyage_state = VoyageState.PLANNING
-    elif len(stale) == len(in_progress) and len(in_progress) > 0 and pending:
-        voyage_state = VoyageState.STALLED
+
+def fetch_tasks(storage: VM, voyage: "Voyage", since: float = 0.0) -> TaskFetch:
+    """Fetch task files (changed after `since`) and artifact markers in one SSH command."""
+    task_dir = f"~/.claude/tasks/{voyage.task_list_id}"
+    cmd = f"python3 -c {shlex.quote(_REMOTE_FETCH_SCRIPT)} {shlex.quote(task_dir)} {since!r}"
+
+    from fabric import Connection
+
+    with Connection(storage.ssh_dest) as c:
+        result = c.run(cmd, hide=True)
+
+    fetch = parse_task_ndjson(result.stdout, since)
+    for name, error in fetch.errors.items():
+        logger.error("Failed to parse task file %s for voyage %s: %s", name, voyage.id, error)
+    return fetch
+
+
+def list_tasks(storage: VM, voyage: "Voyage") -> list[Task]:
+    """Read all tasks from storage VM."""
+    fetch = fetch_tasks(storage, voyage)
+    return [fetch.tasks[name] for name in sorted(fetch.tasks)]
+
+
+def _inferred_status(voyage: "Voyage", has_marker: bool, has_progress: bool) -> VoyageStatus:
+    """Status for a voyage without tasks, inferred from its artifacts."""
+    if has_marker:
+        inferred_state = VoyageState.COMPLETE
+    elif has_progress:
+        inferred_state = VoyageState.RUNNING
     else:
-        voyage_state = VoyageState.RUNNING
+        inferred_state = VoyageState.PLANNING
 
     return VoyageStatus(
         voyage=voyage,
-        state=voyage_state,
-        ships=ships,
-        tasks_complete=len(complete),
-        tasks_in_progress=len(in_progress),
-        tasks_pending=len(pending),
-        tasks_stale=len(stale),
-        tasks_total=len(tasks),
+        state=inferred_state,
+        ships=(),
+        tasks_complete=0,
+        tasks_in_progress=0,
+        tasks_pending=0,
+        tasks_stale=0,
+        tasks_total=0,
     )
 
 
-def list_tasks_local(voyage_dir: Path, voyage: "Voyage") -> list[Task]:
-    """Read all tasks from local voyage directory."""
-    task_dir = voyage_dir / ".claude" / "tasks" / voyage.task_list_id
+def derive_status(voyage: "Voyage", storage: VM) -> VoyageStatus:
+    """Derive full voyage status from task list."""
+    fetch = fetch_tasks(storage, voyage)
+    aggregator = StatusAggregator.from_tasks(fetch.tasks.values())
+    if not aggregator.total:
+        # No tasks - status inferred from the artifact markers in the same fetch
+        return _inferred_status(voyage, fetch.has_marker, fetch.has_progress)
+
+    return aggregator.status(voyage)
+
+
+# Persisted task cache file (inside the local voyage directory)
+TASK_CACHE_FILE = ".task-cache.json"
+_TASK_CACHE_VERSION = 2
+_TIMESTAMP_SLOTS = ("_created", "_updated", "_claimed_at", "_completed_at")
+
+
+def _task_record(task: Task) -> list[Any]:
+    """A task's fields as a JSON list, in Task() argument order (_TASK_FIELDS)."""
+    created, updated, claimed_at, completed_at = (
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in (getattr(task, slot) for slot in _TIMESTAMP_SLOTS)
+    )
+    return [
+        task.id,
+        task.title,
+        task.description,
+        task.status.value,
+        task.blocked_by,
+        task.blocks,
+        created,
+        updated,
+        task.assignee,
+        claimed_at,
+        task.completed_by,
+        completed_at,
+    ]
+
+
+def _task_from_record(record: list[Any]) -> Task:
+    fields = dict(zip(_TASK_FIELDS, record, strict=True))
+    fields["status"] = _STATUS_BY_VALUE[fields["status"]]
+    for name in ("assignee", "completed_by"):
+        if fields[name]:
+            fields[name] = sys.intern(fields[name])
+    return Task(**fields)
+
+
+@dataclass
+class _CacheEntry:
+    mtime_ns: int
+    size: int
+    task: Task | None  # None if the file failed to parse
+
+
+class TaskCache:
+    """Parsed task list for a local voyage, keyed by file name, mtime and size.
+
+    refresh() re-reads only task files whose mtime or size changed and updates
+    the status tallies incrementally. The cache is persisted in the voyage
+    directory, holding each task's fields rather than its raw JSON, so later
+    processes only re-parse files changed since.
+    """
+
+    def __init__(self, voyage_dir: Path, voyage: "Voyage") -> None:
+        self.voyage = voyage
+        self.task_dir = voyage_dir / ".claude" / "tasks" / voyage.task_list_id
+        self.path = voyage_dir / TASK_CACHE_FILE
+        self._entries: dict[str, _CacheEntry] = {}
+        self._counters = StatusAggregator()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load persisted entries; they are validated against the files on refresh()."""
+        try:
+            saved = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        if saved.get("version") != _TASK_CACHE_VERSION:
+            return
+        if saved.get("task_list_id") != self.voyage.task_list_id:
+            return
+
+        for name, entry in saved.get("entries", {}).items():
+            try:
+                record = entry["task"]
+                task = _task_from_record(record) if record is not None else None
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._entries[name] = _CacheEntry(entry["mtime_ns"], entry["size"], task)
+            if task is not None:
+                self._counters.add(task)
+
+    def refresh(self) -> bool:
+        """Re-parse changed task files. Returns True if anything changed."""
+        seen: set[str] = set()
+        changed = False
+
+        try:
+            dir_entries = list(os.scandir(self.task_dir))
+        except OSError:
+            dir_entries = []
+
+        for dir_entry in dir_entries:
+            name = dir_entry.name
+            if not name.endswith(".json") or name.startswith("."):
+                continue
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+            seen.add(name)
+
+            old = self._entries.get(name)
+            if old and old.mtime_ns == stat.st_mtime_ns and old.size == stat.st_size:
+                continue
 
-    if not task_dir.exists():
-        return []
+            self._replace(name, self._parse(Path(dir_entry.path), stat.st_mtime_ns, stat.st_size))
+            changed = True
 
-    tasks = []
-    for task_file in sorted(task_dir.glob("*.json")):
+        for name in self._entries.keys() - seen:
+            self._replace(name, None)
+            changed = True
+
+        self._dirty |= changed
+        return changed
+
+    def _parse(self, path: Path, mtime_ns: int, size: int) -> _CacheEntry:
         try:
-            data = json.loads(task_file.read_text())
-            tasks.append(Task.from_json(data))
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.error("Failed to parse task file %s: %s", task_file, e)
+            return _CacheEntry(mtime_ns, size, Task.from_json(json.loads(path.read_text())))
+        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.error("Failed to parse task file %s: %s", path, e)
+            return _CacheEntry(mtime_ns, size, None)
+
+    def _replace(self, name: str, entry: _CacheEntry | None) -> None:
+        old = self._entries.pop(name, None)
+        if old and old.task is not None:
+            self._counters.remove(old.task)
+        if entry is not None:
+            self._entries[name] = entry
+            if entry.task is not None:
+                self._counters.add(entry.task)
+
+    def tasks(self) -> list[Task]:
+        """All parsed tasks, in file name order."""
+        return [entry.task for _, entry in sorted(self._entries.items()) if entry.task is not None]
+
+    def last_modified(self) -> float | None:
+        """Most recent task file modification time (epoch seconds), if any."""
+        if not self._entries:
+            return None
+        return max(e.mtime_ns for e in self._entries.values()) / 1e9
+
+    def status(self, threshold_minutes: int | None = None) -> VoyageStatus:
+        """Voyage status from the cached tallies (stale flags evaluated now)."""
+        return self._counters.status(self.voyage, threshold_minutes)
+
+    def save(self) -> None:
+        """Persist the cache if it changed since it was loaded or last saved."""
+        if not self._dirty:
+            return
+        payload = {
+            "version": _TASK_CACHE_VERSION,
+            "task_list_id": self.voyage.task_list_id,
+            "entries": {
+                name: {
+                    "mtime_ns": e.mtime_ns,
+                    "size": e.size,
+                    "task": _task_record(e.task) if e.task is not None else None,
+                }
+                for name, e in self._entries.items()
+            },
+        }
+        tmp_name = None
+        try:
+            # A temp file per process: status and watch may save at the same time
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=f"{self.path.name}.", delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                tmp.write(json.dumps(payload, separators=(",", ":")))
+            os.replace(tmp_name, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("Failed to save task cache %s: %s", self.path, e)
+            if tmp_name:
+                Path(tmp_name).unlink(missing_ok=True)
 
-    return tasks
+
+def list_tasks_local(voyage_dir: Path, voyage: "Voyage") -> list[Task]:
+    """Read all tasks from local voyage directory (via the persisted TaskCache)."""
+    cache = TaskCache(voyage_dir, voyage)
+    cache.refresh()
+    cache.save()
+    return cache.tasks()
 
 
 def _check_voyage_artifacts_local(voyage_dir: Path) -> tuple[bool, bool]:
@@ -333,100 +743,22 @@ def _check_voyage_artifacts_local(voyage_dir: Path) -> tuple[bool, bool]:
     return has_marker, has_progress
 
 
-def derive_status_local(voyage: "Voyage", voyage_dir: Path) -> VoyageStatus:
-    """Derive full voyage status from local task list."""
-    tasks = list_tasks_local(voyage_dir, voyage)
-
-    if not tasks:
-        # No tasks - check artifacts for status
-        has_marker, has_progress = _check_voyage_artifacts_local(voyage_dir)
-        if has_marker:
-            inferred_state = VoyageState.COMPLETE
-        elif has_progress:
-            inferred_state = VoyageState.RUNNING
-        else:
-            inferred_state = VoyageState.PLANNING
-
-        return VoyageStatus(
-            voyage=voyage,
-            state=inferred_state,
-            ships=(),
-            tasks_complete=0,
-            tasks_in_progress=0,
-            tasks_pending=0,
-            tasks_stale=0,
-            tasks_total=0,
-        )
-
-    # Count task states
-    complete = [t for t in tasks if t.status == TaskStatus.COMPLETED]
-    in_progress = [t for t in tasks if t.status == TaskStatus.IN_PROGRESS]
-    pending = [t for t in tasks if t.status == TaskStatus.PENDING]
-    stale = [t for t in in_progress if t.is_stale()]
-
-    # Derive ship states from task metadata using mutable intermediate state
-    ship_data: dict[str, dict[str, Any]] = {}
-
-    for task in tasks:
-        if not task.assignee:
-            continue
-
-        if task.assignee not in ship_data:
-            ship_data[task.assignee] = {
-                "state": ShipState.UNKNOWN,
-                "current_task": None,
-                "claimed_at": None,
-                "completed_count": 0,
-            }
+def derive_status_local(
+    voyage: "Voyage", voyage_dir: Path, cache: TaskCache | None = None
+) -> VoyageStatus:
+    """Derive full voyage status from local task list.
 
-        data = ship_data[task.assignee]
-        if task.status == TaskStatus.COMPLETED:
-            data["completed_count"] += 1
-        elif task.status == TaskStatus.IN_PROGRESS:
-            data["state"] = ShipState.STALE if task.is_stale() else ShipState.WORKING
-            data["current_task"] = task.id
-            data["claimed_at"] = task.claimed_at
-
-    # Ships with no in-progress task but completed tasks are idle
-    for data in ship_data.values():
-        if data["state"] == ShipState.UNKNOWN and data["completed_count"] > 0:
-            data["state"] = ShipState.IDLE
-
-    # Convert to frozen ShipStatus objects
-    ships = tuple(
-        sorted(
-            (
-                ShipStatus(
-                    id=ship_id,
-                    state=data["state"],
-                    current_task=data["current_task"],
-                    claimed_at=data["claimed_at"],
-                    completed_count=data["completed_count"],
-                )
-                for ship_id, data in ship_data.items()
-            ),
-            key=lambda s: s.id,
-        )
-    )
+    Pass a long-lived TaskCache to make repeated calls incremental; otherwise
+    the persisted cache in the voyage directory is loaded and refreshed.
+    """
+    if cache is None:
+        cache = TaskCache(voyage_dir, voyage)
+    cache.refresh()
+    cache.save()
 
-    # Derive voyage state
-    voyage_state: VoyageState
-    if len(complete) == len(tasks):
-        voyage_state = VoyageState.COMPLETE
-    elif len(in_progress) == 0 and pending:
-        voyage_state = VoyageState.PLANNING
-    elif len(stale) == len(in_progress) and len(in_progress) > 0 and pending:
-        voyage_state = VoyageState.STALLED
-    else:
-        voyage_state = VoyageState.RUNNING
+    voyage_status = cache.status()
+    if voyage_status.tasks_total:
+        return voyage_status
 
-    return VoyageStatus(
-        voyage=voyage,
-        state=voyage_state,
-        ships=ships,
-        tasks_complete=len(complete),
-        tasks_in_progress=len(in_progress),
-        tasks_pending=len(pending),
-        tasks_stale=len(stale),
-        tasks_total=len(tasks),
-    )
+    # No tasks - check artifacts for status
+    return _inferred_status(voyage, *_check_voyage_artifacts_local(voyage_dir))
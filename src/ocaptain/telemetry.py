@@ -0,0 +1,554 @@
+"""Query the Claude Code telemetry written by the local OTLP collector.
+
+start-telemetry.sh runs otlp2parquet, which stores the OTLP logs and metrics
+ships send as Parquet files under ~/voyages/telemetry. Ships tag everything
+with voyage.id and ship.id resource attributes (see ship.py). This module
+reads Claude Code's api_request and tool_result events back out of those
+files for per-ship token, cost, latency and tool-call reports.
+
+Scans read only the columns they need, skip row groups whose Timestamp
+statistics fall outside the requested time range, and check the resource
+attributes of a row group before reading anything else from it.
+
+otlp2parquet flushes every 30 seconds, so a long voyage leaves thousands
+of small files. compact() rewrites them into sorted, large-row-group files
+under telemetry/compacted/, partitioned by voyage, ship and date, and lists
+each partition's time range in a manifest so queries open only the
+partitions they need.
+
+Reading Parquet needs pyarrow, installed with the telemetry extra:
+pip install 'ocaptain[telemetry]'.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_DIR = "telemetry"
+COMPACTED_DIR = "compacted"
+MANIFEST_FILE = "manifest.json"
+# Written by scripts/start-telemetry.sh for either collector
+COLLECTOR_PID_FILE = "otlp2parquet.pid"
+
+# otlp2parquet log columns (ClickHouse OpenTelemetry exporter naming)
+TIMESTAMP = "Timestamp"
+BODY = "Body"
+RESOURCE_ATTRIBUTES = "ResourceAttributes"
+LOG_ATTRIBUTES = "LogAttributes"
+
+API_REQUEST = "api_request"
+TOOL_RESULT = "tool_result"
+
+# Hive-style partition directories otlp2parquet writes, e.g. year=2026/month=01/...
+_PARTITION = re.compile(r"^(year|month|day|hour)=(\d+)$")
+
+
+def telemetry_dir() -> Path:
+    from .config import CONFIG
+
+    return Path(CONFIG.local.workspace_dir).expanduser() / TELEMETRY_DIR
+
+
+def collector_running() -> bool:
+    """Whether the local OTLP collector started by telemetry-start is alive."""
+    pid_file = Path.home() / ".config" / "ocaptain" / COLLECTOR_PID_FILE
+    try:
+        os.kill(int(pid_file.read_text().strip()), 0)
+    except PermissionError:
+        return True  # alive, but owned by another user
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def require_pyarrow() -> Any:
+    """Import pyarrow.parquet, or explain how to install it."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError(
+            "Reading telemetry needs pyarrow: pip install 'ocaptain[telemetry]'"
+        ) from None
+    return pq
+
+
+def _scalar(value: Any) -> Any:
+    # OTLP AnyValue encoded as {"stringValue": "..."} and friends
+    if isinstance(value, dict) and len(value) == 1:
+        key, inner = next(iter(value.items()))
+        if key.endswith("Value"):
+            return inner
+    return value
+
+
+def attributes(value: Any) -> dict[str, Any]:
+    """Normalize an attribute column value to a dict.
+
+    Accepts a Parquet map (read as (key, value) pairs), a list of OTLP
+    {"key", "value"} objects, a dict, or any of those encoded as JSON.
+    """
+    if value is None:
+        return {}
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return {}
+    if isinstance(value, dict):
+        return {k: _scalar(v) for k, v in value.items()}
+    result: dict[str, Any] = {}
+    for item in value:
+        if isinstance(item, dict):
+            result[item.get("key", "")] = _scalar(item.get("value"))
+        else:
+            key, inner = item
+            result[key] = _scalar(inner)
+    return result
+
+
+def _to_epoch(value: Any) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=UTC)).timestamp()
+    if isinstance(value, int | float):
+        return value / 1e9  # nanoseconds since the epoch
+    return None
+
+
+def _partition_span(path: Path) -> tuple[float, float] | None:
+    """Time span covered by a file's year=/month=/day=/hour= directories, if any."""
+    parts: dict[str, int] = {}
+    for name in path.parent.parts:
+        if match := _PARTITION.match(name):
+            parts[match.group(1)] = int(match.group(2))
+    if "year" not in parts:
+        return None
+    start = datetime(
+        parts["year"], parts.get("month", 1), parts.get("day", 1), parts.get("hour", 0), tzinfo=UTC
+    )
+    span = 3600 if "hour" in parts else 86400 if "day" in parts else 31 * 86400
+    return start.timestamp(), start.timestamp() + span
+
+
+def _overlaps(span: tuple[float, float] | None, since: float | None, until: float | None) -> bool:
+    if span is None:
+        return True
+    low, high = span
+    return not ((since is not None and high < since) or (until is not None and low > until))
+
+
+def _row_group_span(row_group: Any) -> tuple[float, float] | None:
+    """Timestamp min/max of a row group from its column statistics."""
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        if column.path_in_schema == TIMESTAMP and column.is_stats_set:
+            stats = column.statistics
+            if stats.has_min_max:
+                low, high = _to_epoch(stats.min), _to_epoch(stats.max)
+                if low is not None and high is not None:
+                    return low, high
+    return None
+
+
+def _resource_ids(column: Any) -> tuple[list[Any], list[Any]]:
+    """(voyage.id, ship.id) of every row of a ResourceAttributes column."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_map(column.type) and pa.types.is_string(column.type.item_type):
+        return (
+            pc.map_lookup(column, pa.scalar("voyage.id"), "first").to_pylist(),
+            pc.map_lookup(column, pa.scalar("ship.id"), "first").to_pylist(),
+        )
+    rows = [attributes(value) for value in column.to_pylist()]
+    return [r.get("voyage.id") for r in rows], [r.get("ship.id") for r in rows]
+
+
+def load_manifest(root: Path) -> dict[str, Any]:
+    """The compaction manifest.
+
+    Lists every compacted partition with its time range, plus the batch being
+    committed: partition files still to move into place and the raw sources
+    they replace.
+    """
+    manifest: dict[str, Any]
+    try:
+        manifest = json.loads((root / COMPACTED_DIR / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("partitions", [])
+    manifest.setdefault("pending", [])
+    manifest.setdefault("sources", [])
+    return manifest
+
+
+def _save_manifest(root: Path, manifest: dict[str, Any]) -> None:
+    path = root / COMPACTED_DIR / MANIFEST_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{MANIFEST_FILE}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, path)
+
+
+def _raw_files(root: Path) -> list[Path]:
+    """Parquet files as the collector wrote them (not yet compacted)."""
+    compacted = root / COMPACTED_DIR
+    return sorted(p for p in root.rglob("*.parquet") if compacted not in p.parents)
+
+
+def _query_files(
+    root: Path, voyage_id: str, ship_id: str | None, since: float | None, until: float | None
+) -> list[Path]:
+    """Files that can hold matching events: manifest-pruned partitions, then raw files."""
+    files = [
+        root / COMPACTED_DIR / partition["file"]
+        for partition in load_manifest(root)["partitions"]
+        if partition["voyage"] == voyage_id
+        and (ship_id is None or partition["ship"] == ship_id)
+        and _overlaps((partition["min_ts"], partition["max_ts"]), since, until)
+    ]
+    files.extend(p for p in _raw_files(root) if _overlaps(_partition_span(p), since, until))
+    return files
+
+
+@dataclass(frozen=True)
+class TelemetryEvent:
+    ts: float
+    ship: str
+    name: str  # event name without the claude_code. prefix, e.g. "api_request"
+    attributes: dict[str, Any]
+
+
+def scan_events(
+    root: Path,
+    voyage_id: str,
+    ship_id: str | None = None,
+    since: float | None = None,
+    until: float | None = None,
+) -> Iterator[TelemetryEvent]:
+    """Log events a voyage's ships sent, compacted partitions first.
+
+    Files that are not OTLP log tables (metrics, files still being written)
+    are skipped.
+    """
+    pq = require_pyarrow()
+    for path in _query_files(root, voyage_id, ship_id, since, until):
+        try:
+            parquet = pq.ParquetFile(path)
+        except (OSError, ValueError) as e:
+            logger.debug("Skipping unreadable telemetry file %s: %s", path, e)
+            continue
+        names = set(parquet.schema_arrow.names)
+        if not {TIMESTAMP, RESOURCE_ATTRIBUTES, LOG_ATTRIBUTES} <= names:
+            continue
+        columns = [c for c in (TIMESTAMP, BODY, LOG_ATTRIBUTES) if c in names]
+
+        for i in range(parquet.num_row_groups):
+            if not _overlaps(_row_group_span(parquet.metadata.row_group(i)), since, until):
+                continue
+            resources = parquet.read_row_group(i, columns=[RESOURCE_ATTRIBUTES]).column(0)
+            voyages, ships = _resource_ids(resources)
+            rows = [
+                j
+                for j, (voyage, ship) in enumerate(zip(voyages, ships, strict=True))
+                if voyage == voyage_id and ship and (ship_id is None or ship == ship_id)
+            ]
+            if not rows:
+                continue
+
+            table = parquet.read_row_group(i, columns=columns).take(rows).to_pydict()
+            bodies = table.get(BODY) or [None] * len(rows)
+            for row, ts_value, body, attrs_value in zip(
+                rows, table[TIMESTAMP], bodies, table[LOG_ATTRIBUTES], strict=True
+            ):
+                ts = _to_epoch(ts_value)
+                if ts is None or (since is not None and ts < since):
+                    continue
+                if until is not None and ts > until:
+                    continue
+                attrs = attributes(attrs_value)
+                name = str(attrs.get("event.name") or _scalar(body) or "")
+                yield TelemetryEvent(ts, ships[row], name.removeprefix("claude_code."), attrs)
+
+
+def _number(attrs: dict[str, Any], key: str) -> float:
+    try:
+        return float(attrs.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _percentile(values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of values (q in 0..1)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+_TOKEN_KEYS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_creation_tokens")
+
+
+@dataclass
+class ShipMetrics:
+    ship: str
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cost_usd: float = 0.0
+    tool_calls: int = 0
+    tool_failures: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+    tools: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def tokens(self) -> int:
+        return (
+            self.input_tokens
+            + self.output_tokens
+            + self.cache_read_tokens
+            + self.cache_creation_tokens
+        )
+
+    @property
+    def latency_p50(self) -> float | None:
+        return _percentile(self.latencies_ms, 0.5)
+
+    @property
+    def latency_p95(self) -> float | None:
+        return _percentile(self.latencies_ms, 0.95)
+
+    def add_api_request(self, attrs: dict[str, Any]) -> None:
+        self.requests += 1
+        for key in _TOKEN_KEYS:
+            setattr(self, key, getattr(self, key) + int(_number(attrs, key)))
+        self.cost_usd += _number(attrs, "cost_usd")
+        if "duration_ms" in attrs:
+            self.latencies_ms.append(_number(attrs, "duration_ms"))
+
+    def add_tool_result(self, attrs: dict[str, Any]) -> None:
+        self.tool_calls += 1
+        self.tools[str(attrs.get("tool_name") or "unknown")] += 1
+        if str(attrs.get("success", "true")).lower() == "false":
+            self.tool_failures += 1
+
+
+@dataclass
+class TimeBucket:
+    start: float
+    requests: int = 0
+    tokens: int = 0
+    cost_usd: float = 0.0
+    tool_calls: int = 0
+
+
+@dataclass(frozen=True)
+class MetricsReport:
+    ships: list[ShipMetrics]
+    buckets: list[TimeBucket]
+    total: ShipMetrics
+
+
+def build_metrics(events: Iterable[TelemetryEvent], bucket_seconds: float = 3600) -> MetricsReport:
+    """Aggregate api_request and tool_result events per ship and per time bucket."""
+    ships: dict[str, ShipMetrics] = {}
+    buckets: dict[float, TimeBucket] = {}
+    total = ShipMetrics("total")
+
+    for event in events:
+        if event.name not in (API_REQUEST, TOOL_RESULT):
+            continue
+        ship = ships.setdefault(event.ship, ShipMetrics(event.ship))
+        start = event.ts - event.ts % bucket_seconds
+        bucket = buckets.setdefault(start, TimeBucket(start))
+        attrs = event.attributes
+
+        if event.name == API_REQUEST:
+            ship.add_api_request(attrs)
+            total.add_api_request(attrs)
+            bucket.requests += 1
+            bucket.tokens += sum(int(_number(attrs, key)) for key in _TOKEN_KEYS)
+            bucket.cost_usd += _number(attrs, "cost_usd")
+        else:
+            ship.add_tool_result(attrs)
+            total.add_tool_result(attrs)
+            bucket.tool_calls += 1
+
+    return MetricsReport(
+        ships=sorted(ships.values(), key=lambda m: (len(m.ship), m.ship)),
+        buckets=[buckets[start] for start in sorted(buckets)],
+        total=total,
+    )
+
+
+# --- Compaction ---
+
+# Rows per row group in compacted files (sorted by Timestamp, so row group
+# statistics let scans skip most of a file for narrow time ranges)
+_ROW_GROUP_ROWS = 64 * 1024
+# Raw files merged per pass, bounding memory on long voyages
+_COMPACT_BATCH_FILES = 500
+# Raw files younger than this may still be in flight
+DEFAULT_MIN_AGE = 60.0
+_UNKNOWN = "_unknown"
+
+
+def _signal(root: Path, path: Path) -> str:
+    """The table a raw file belongs to: its directories above any key=value partition."""
+    parts: list[str] = []
+    for name in path.relative_to(root).parent.parts:
+        if "=" in name:
+            break
+        parts.append(name)
+    return "/".join(parts) or "root"
+
+
+def partition_name(value: str | None) -> str:
+    """A value made safe to use as a directory name."""
+    if not value:
+        return _UNKNOWN
+    name = re.sub(r"[^A-Za-z0-9._-]", "_", value)
+    # "." and ".." would point outside the partition's parent
+    return name if name.strip(".") else name.replace(".", "_")
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    files: int  # raw files compacted
+    rows: int
+    partitions: int  # partitions written
+
+
+def compact(root: Path, min_age: float = DEFAULT_MIN_AGE) -> CompactionResult:
+    """Merge raw collector files into voyage/ship/date partitions.
+
+    New rows are merged with the partition's existing file and sorted by
+    Timestamp. Each batch is saved in the manifest (new partitions and the
+    sources they replace) before any file is moved or deleted, so an
+    interrupted compaction neither loses rows nor counts them twice.
+    """
+    pq = require_pyarrow()
+    manifest = load_manifest(root)
+    _commit(root, manifest)
+    # Partition files from a batch that never reached the manifest
+    for stray in (root / COMPACTED_DIR).rglob("*.parquet.tmp"):
+        stray.unlink()
+
+    cutoff = time.time() - min_age
+    by_signal: dict[str, list[Path]] = {}
+    for path in _raw_files(root):
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+        except OSError:
+            continue
+        by_signal.setdefault(_signal(root, path), []).append(path)
+
+    files = rows = 0
+    written: set[str] = set()
+    for signal, paths in sorted(by_signal.items()):
+        for start in range(0, len(paths), _COMPACT_BATCH_FILES):
+            tables, sources = [], []
+            for path in paths[start : start + _COMPACT_BATCH_FILES]:
+                try:
+                    table = pq.read_table(path)
+                except (OSError, ValueError) as e:
+                    logger.warning("Skipping unreadable telemetry file %s: %s", path, e)
+                    continue
+                if not {TIMESTAMP, RESOURCE_ATTRIBUTES} <= set(table.column_names):
+                    continue
+                tables.append(table)
+                sources.append(str(path.relative_to(root)))
+            if not tables:
+                continue
+            batch = _merge_batch(root, manifest, signal, tables)
+            written |= batch
+            manifest["pending"] = sorted(batch)
+            manifest["sources"] = sources
+            _save_manifest(root, manifest)
+            _commit(root, manifest)
+            files += len(sources)
+            rows += sum(t.num_rows for t in tables)
+    return CompactionResult(files=files, rows=rows, partitions=len(written))
+
+
+def _commit(root: Path, manifest: dict[str, Any]) -> None:
+    """Finish a saved batch: move new partition files into place, delete its sources.
+
+    Both steps are idempotent, so a batch interrupted part way is finished
+    by the next compaction.
+    """
+    if not manifest["pending"] and not manifest["sources"]:
+        return
+    compacted = root / COMPACTED_DIR
+    for name in manifest["pending"]:
+        tmp = compacted / f"{name}.tmp"
+        if tmp.exists():
+            os.replace(tmp, compacted / name)
+    for name in manifest["sources"]:
+        with contextlib.suppress(FileNotFoundError):
+            (root / name).unlink()
+    manifest["pending"] = []
+    manifest["sources"] = []
+    _save_manifest(root, manifest)
+
+
+def _merge_batch(root: Path, manifest: dict[str, Any], signal: str, tables: list[Any]) -> set[str]:
+    """Split rows by partition and write each merged partition to a .tmp file."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.concat_tables(tables, promote_options="permissive")
+    voyages, ships = _resource_ids(table.column(RESOURCE_ATTRIBUTES))
+    rows_by_key: dict[tuple[str, str, str], list[int]] = {}
+    for i, (voyage, ship, ts) in enumerate(
+        zip(voyages, ships, table.column(TIMESTAMP).to_pylist(), strict=True)
+    ):
+        epoch = _to_epoch(ts) or 0.0
+        date = datetime.fromtimestamp(epoch, UTC).date().isoformat()
+        key = (partition_name(voyage), partition_name(ship), date)
+        rows_by_key.setdefault(key, []).append(i)
+
+    partitions = {p["file"]: p for p in manifest["partitions"]}
+    written: set[str] = set()
+    for (voyage, ship, date), indices in sorted(rows_by_key.items()):
+        name = f"{signal}/voyage={voyage}/ship={ship}/date={date}/data.parquet"
+        path = root / COMPACTED_DIR / name
+        rows = table.take(indices)
+        if path.exists():
+            rows = pa.concat_tables([pq.read_table(path), rows], promote_options="permissive")
+        rows = rows.sort_by(TIMESTAMP)
+
+        # Written beside the live file; _commit() moves it into place
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp")
+        pq.write_table(rows, tmp, row_group_size=_ROW_GROUP_ROWS, compression="zstd")
+
+        timestamps = rows.column(TIMESTAMP)
+        partitions[name] = {
+            "file": name,
+            "signal": signal,
+            "voyage": voyage,
+            "ship": ship,
+            "date": date,
+            "rows": rows.num_rows,
+            "min_ts": _to_epoch(timestamps[0].as_py()),
+            "max_ts": _to_epoch(timestamps[-1].as_py()),
+        }
+        written.add(name)
+    manifest["partitions"] = sorted(partitions.values(), key=lambda p: p["file"])
+    return written
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Ship-side log writer: tee stdin to stdout and a log file, rotating the log.
+
+Installed on ships as ~/.ocaptain/log-rotate.py. Claude's output is piped
+through it instead of `tee -a`:
+
+    ... | python3 ~/.ocaptain/log-rotate.py ~/voyage/logs/ship-0.log
+
+Each line in the log is prefixed with TIME_MARK, an OSC escape carrying
+the epoch time its first byte was read, which terminals ignore and the
+laptop's log index reads as the line's timestamp.
+
+Once the log reaches --max-bytes, or has been written to for --max-age
+seconds, it is renamed to LOG.<UTC stamp>, compressed (zstd when installed,
+else gzip) and recorded in LOG.manifest.json. Only the newest --keep segments
+are kept.
+
+    log-rotate.py --read-segment LOG INODE OFFSET LIMIT
+
+prints the decompressed size of the segment that was LOG while it had inode
+INODE, then base64 of up to LIMIT bytes from OFFSET. The laptop's log
+collector uses it to drain output written just before a rotation.
+
+    log-rotate.py --last-line LOG PATTERN
+
+prints the last line of LOG matching the regex PATTERN, or if LOG has none,
+the last match in the newest rotated segment. The watchdog uses it to find
+Claude's latest "Starting"/"Exit" line after a rotation.
+
+Runs on the ship's python3, so it sticks to the standard library and to
+syntax older Pythons accept.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+import gzip
+import json
+import os
+import re
+import shutil
+import subprocess  # nosec B404
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+MANIFEST_SUFFIX = ".manifest.json"
+TIME_MARK = b"\x1b]ocaptain;ts=%.3f\x07"
+_READ_SIZE = 64 * 1024
+
+
+def _now_iso() -> str:
+    # timezone.utc rather than datetime.UTC: ships may run Python < 3.11
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")  # noqa: UP017
+
+
+def load_manifest(log_path: str) -> dict[str, Any]:
+    manifest: dict[str, Any]
+    try:
+        with open(log_path + MANIFEST_SUFFIX) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("segments", [])
+    return manifest
+
+
+def _write_manifest(log_path: str, manifest: dict[str, Any]) -> None:
+    path = log_path + MANIFEST_SUFFIX
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def compress(path: str) -> str:
+    """Compress a segment in place, returning the compressed file's path."""
+    if shutil.which("zstd"):
+        result = subprocess.run(  # nosec B603, B607
+            ["zstd", "-q", "--rm", "-f", path], stdout=subprocess.DEVNULL, check=False
+        )
+        if result.returncode == 0:
+            return path + ".zst"
+    with open(path, "rb") as src, gzip.open(path + ".gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.unlink(path)
+    return path + ".gz"
+
+
+def open_segment(path: str):  # type: ignore[no-untyped-def]
+    """Open a (possibly compressed) segment for reading decompressed bytes."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        proc = subprocess.Popen(  # nosec B603, B607
+            ["zstd", "-dcq", path], stdout=subprocess.PIPE
+        )
+        return proc.stdout
+    return open(path, "rb")
+
+
+class RotatingLog:
+    """Append-only log file that rotates by size and age."""
+
+    def __init__(self, path: str, max_bytes: int, max_age: float, keep: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+        self._open()
+
+    def _open(self) -> None:
+        self.file = open(self.path, "ab", buffering=0)  # noqa: SIM115 - held until rotation
+        stat = os.fstat(self.file.fileno())
+        self.size = stat.st_size
+        self.inode = stat.st_ino
+        self.opened_at = time.monotonic()
+        self.started = _now_iso()
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+        self.size += len(data)
+        too_old = self.max_age and time.monotonic() - self.opened_at >= self.max_age
+        if self.size >= self.max_bytes or (too_old and self.size):
+            self.rotate()
+
+    def rotate(self, background: bool = True) -> None:
+        self.file.close()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")  # noqa: UP017
+        segment = f"{self.path}.{stamp}"
+        os.rename(self.path, segment)
+        entry = {
+            "file": os.path.basename(segment),
+            "inode": self.inode,
+            "bytes": self.size,
+            "start": self.started,
+            "end": _now_iso(),
+        }
+        self._open()
+
+        # Record the segment before compressing so readers can always find it
+        with self._lock:
+            manifest = load_manifest(self.path)
+            manifest["segments"].append(entry)
+            _write_manifest(self.path, manifest)
+
+        if background:
+            worker = threading.Thread(target=self._finish, args=(segment,))
+            worker.start()
+            self._workers = [w for w in self._workers if w.is_alive()] + [worker]
+        else:
+            self._finish(segment)
+
+    def _finish(self, segment: str) -> None:
+        """Compress a rotated segment and drop segments beyond `keep`."""
+        try:
+            compressed = os.path.basename(compress(segment))
+        except OSError:
+            return  # pruned (or unreadable) before it could be compressed
+        with self._lock:
+            manifest = load_manifest(self.path)
+            directory = os.path.dirname(self.path)
+            entry = next(
+                (e for e in manifest["segments"] if e["file"] == os.path.basename(segment)), None
+            )
+            if entry is None:
+                # Pruned by a later rotation while this one was compressing
+                with contextlib.suppress(OSError):
+                    os.unlink(os.path.join(directory, compressed))
+                return
+            entry["file"] = compressed
+            while len(manifest["segments"]) > self.keep:
+                old = manifest["segments"].pop(0)
+                with contextlib.suppress(OSError):
+                    os.unlink(os.path.join(directory, old["file"]))
+            _write_manifest(self.path, manifest)
+
+    def close(self) -> None:
+        """Close the log once pending compressions have finished."""
+        self.file.close()
+        for worker in self._workers:
+            worker.join()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+class LineStamper:
+    """Inserts TIME_MARK at the start of every line of a byte stream."""
+
+    def __init__(self) -> None:
+        self.line_start = True
+
+    def stamp(self, data: bytes, now: float | None = None) -> bytes:
+        mark = TIME_MARK % (time.time() if now is None else now)
+        stamped = data.replace(b"\n", b"\n" + mark)
+        if data.endswith(b"\n"):
+            # The next line starts with the next read, and gets that read's time
+            stamped = stamped[: -len(mark)]
+        if self.line_start:
+            stamped = mark + stamped
+        self.line_start = data.endswith(b"\n")
+        return stamped
+
+
+def run(log: RotatingLog, timestamps: bool = True) -> None:
+    stdin, stdout = sys.stdin.fileno(), sys.stdout.fileno()
+    stamper = LineStamper() if timestamps else None
+    passthrough = True
+    while True:
+        data = os.read(stdin, _READ_SIZE)
+        if not data:
+            break
+        if passthrough:
+            try:
+                _write_all(stdout, data)
+            except OSError:
+                # Terminal went away; keep logging like tee -p would
+                passthrough = False
+        log.write(stamper.stamp(data) if stamper else data)
+    log.close()
+
+
+def read_segment(log_path: str, inode: int, offset: int, limit: int) -> int:
+    """Print a segment's size and base64 of its bytes from offset.
+
+    Exits 1 if no segment has that inode (it was pruned), 3 if it is being
+    compressed right now and should be retried.
+    """
+    for _ in range(2):
+        segment = next(
+            (s for s in load_manifest(log_path)["segments"] if s.get("inode") == inode), None
+        )
+        if segment is None:
+            return 1
+        path = os.path.join(os.path.dirname(log_path), segment["file"])
+        try:
+            f = open_segment(path)
+        except OSError:
+            # Compression replaced the file between reading the manifest and opening it
+            time.sleep(0.5)
+            continue
+        with f:
+            skip = offset
+            while skip > 0:
+                chunk = f.read(min(skip, _READ_SIZE))
+                if not chunk:
+                    break
+                skip -= len(chunk)
+            data = f.read(limit)
+        sys.stdout.write(f"{segment['bytes']}\n")
+        sys.stdout.write(base64.b64encode(data).decode())
+        return 0
+    return 3
+
+
+def last_line(log_path: str, pattern: str) -> int:
+    """Print the last line matching pattern in the log, else in its newest segment.
+
+    Exits 1 if neither has a match.
+    """
+    regex = re.compile(pattern.encode())
+    paths = [log_path] + [
+        os.path.join(os.path.dirname(log_path), s["file"])
+        for s in load_manifest(log_path)["segments"][-1:]
+    ]
+    for path in paths:
+        try:
+            f = open_segment(path)
+        except OSError:
+            continue  # missing, or renamed by compression just now
+        last = None
+        with f:
+            for line in f:
+                if regex.search(line):
+                    last = line
+        if last is not None:
+            sys.stdout.write(last.decode("utf-8", "replace").rstrip("\n") + "\n")
+            return 0
+    return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = argv if argv is not None else sys.argv[1:]
+    if args and args[0] == "--read-segment":
+        log_path, inode, offset, limit = args[1], int(args[2]), int(args[3]), int(args[4])
+        return read_segment(log_path, inode, offset, limit)
+    if args and args[0] == "--last-line":
+        return last_line(args[1], args[2])
+
+    parser = argparse.ArgumentParser(description="Tee stdin to a rotating log file")
+    parser.add_argument("log")
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024 * 1024)
+    parser.add_argument("--max-age", type=float, default=6 * 3600)
+    parser.add_argument("--keep", type=int, default=20)
+    parser.add_argument(
+        "--no-timestamps", action="store_true", help="Don't prefix lines with TIME_MARK"
+    )
+    opts = parser.parse_args(args)
+    run(RotatingLog(opts.log, opts.max_bytes, opts.max_age, opts.keep), not opts.no_timestamps)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,19 @@ def _build_ship_command(ship: VM, ship_id: str, voyage: Voyage, oauth_token: str
         return _build_ssh_ship_command(ship, ship_id, voyage, oauth_token)
 
 
+def _log_writer(ship_id: str) -> str:
+    """Pipe target that tees Claude's output into the ship log.
+
+    Uses the rotating writer installed at bootstrap, falling back to tee on
+    ships bootstrapped before it existed (or if it stops unexpectedly).
+    """
+    log = f"~/voyage/logs/{ship_id}.log"
+    return (
+        f"{{ test -f ~/.ocaptain/log-rotate.py && python3 ~/.ocaptain/log-rotate.py {log} "
+        f"|| tee -a {log}; }}"
+    )
+
+
 def _build_claude_command(ship_id: str, voyage: Voyage, oauth_token: str) -> str:
     """Build the command that runs Claude (executed inside tmux on ship)."""
     return (
@@ -36,7 +49,7 @@ def _build_claude_command(ship_id: str, voyage: Voyage, oauth_token: str) -> str
         f"claude --dangerously-skip-permissions "
         f"--append-system-prompt-file $HOME/voyage/prompt.md "
         f"'Execute STEP 1 now.' "
-        f"2>&1 | tee -a ~/voyage/logs/{ship_id}.log ; "
+        f"2>&1 | {_log_writer(ship_id)} ; "
         f"EXIT_CODE=$? && "
         f"echo '' >> ~/voyage/logs/{ship_id}.log && "
         f'echo "[{ship_id}] Exit $EXIT_CODE at $(date -Iseconds)" '
@@ -81,6 +94,33 @@ def start_claude_on_ship(ship: VM, ship_id: str, voyage: Voyage, oauth_token: st
     )
 
 
+def relaunch_claude(ship: VM, ship_id: str, voyage: Voyage, oauth_token: str) -> None:
+    """Replace a ship's finished tmux session with a fresh autonomous Claude run."""
+    kill_cmd = "tmux kill-session -t claude 2>/dev/null; true"
+
+    if is_sprite_vm(ship):
+        org = _get_sprites_org()
+        subprocess.run(  # nosec B603 B607
+            ["sprite", "exec", "-o", org, "-s", ship.name, "bash", "-c", kill_cmd],
+            check=True,
+        )
+        start_claude_on_sprite(ship, ship_id, voyage, oauth_token)
+    else:
+        subprocess.run(  # nosec B603 B607
+            [
+                "ssh",
+                "-o",
+                "StrictHostKeyChecking=no",
+                "-o",
+                "UserKnownHostsFile=/dev/null",
+                ship.ssh_dest,
+                kill_cmd,
+            ],
+            check=True,
+        )
+        start_claude_on_ship(ship, ship_id, voyage, oauth_token)
+
+
 def _build_ssh_ship_command(ship: VM, ship_id: str, voyage: Voyage, oauth_token: str) -> str:
     """Build command to attach to ship's tmux session (for local observation)."""
     ssh_opts = (
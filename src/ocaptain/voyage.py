@@ -2,13 +2,22 @@
 
 import json
 import secrets
-from dataclasses import asdict, dataclass
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field, replace
 from datetime import UTC, datetime
 from importlib.resources import files
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from .catalog import catalog_session
 from .provider import VM, Provider, get_connection, get_provider, is_sprite_vm
 
+if TYPE_CHECKING:
+    from .tasks import Task
+
+# Seconds between task list polls while waiting for draining ships
+_DRAIN_POLL_SECONDS = 15
+
 
 def _get_remote_user(ship_vm: VM) -> str:
     """Get the SSH user for a ship VM."""
@@ -116,12 +125,9 @@ def sail(
     5. Launch local tmux session
     """
     import subprocess  # nosec: B404
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    from .config import CONFIG
+    from .config import CONFIG, tailscale_ip
     from .local_storage import setup_local_voyage
-    from .mutagen import create_sync
-    from .ship import bootstrap_ship
 
     if tokens is None:
         tokens = {}
@@ -129,7 +135,7 @@ def sail(
     voyage = Voyage.create(prompt, repo, ships)
 
     # Verify tailscale is ready
-    if not CONFIG.tailscale.ip:
+    if not tailscale_ip():
         raise RuntimeError("Tailscale IP not detected. Is Tailscale running?")
     if not CONFIG.tailscale.oauth_secret:
         raise RuntimeError("OCAPTAIN_TAILSCALE_OAUTH_SECRET not set")
@@ -149,6 +155,9 @@ def sail(
 
     # 3. Write voyage.json locally
     (voyage_dir / "voyage.json").write_text(voyage.to_json())
+    with catalog_session() as catalog:
+        if catalog:
+            catalog.record_voyage(voyage, voyage_dir)
 
     # 4. Write prompt.md locally
     prompt_content = render_ship_prompt(voyage)
@@ -181,22 +190,7 @@ def sail(
 
     logger = logging.getLogger(__name__)
 
-    successful_ships: list[tuple[VM, str]] = []  # (vm, tailscale_ip)
-    failed_ships: list[tuple[int, Exception]] = []
-
-    with ThreadPoolExecutor(max_workers=ships) as executor:
-        futures = {
-            executor.submit(bootstrap_ship, voyage, i, tokens, telemetry): i for i in range(ships)
-        }
-
-        for future in as_completed(futures):
-            ship_idx = futures[future]
-            try:
-                ship_vm, ship_ts_ip = future.result()
-                successful_ships.append((ship_vm, ship_ts_ip))
-            except Exception as e:
-                logger.warning("Ship-%d bootstrap failed: %s", ship_idx, e)
-                failed_ships.append((ship_idx, e))
+    successful_ships, failed_ships = bootstrap_fleet(voyage, range(ships), tokens, telemetry)
 
     if len(failed_ships) == ships:
         first_idx, first_error = failed_ships[0]
@@ -216,56 +210,125 @@ def sail(
     # 9. Start Mutagen sync sessions and copy files
     provider = get_provider()
     for ship_vm, ship_ts_ip in successful_ships:
-        ship_idx = int(ship_vm.name.split("ship")[-1])
-        session_name = f"{voyage.id}-ship-{ship_idx}"
-        remote_user = _get_remote_user(ship_vm)
-        remote_home = _get_remote_home(ship_vm)
-
-        # Sync workspace
-        create_sync(
-            local_path=voyage_dir / "workspace",
-            remote_user=remote_user,
-            remote_host=ship_ts_ip,
-            remote_path=f"{remote_home}/voyage/workspace",
-            session_name=f"{session_name}-workspace",
-            extra_ignores=[".claude"],
-        )
-
-        # Sync tasks
-        create_sync(
-            local_path=voyage_dir / ".claude" / "tasks" / voyage.task_list_id,
-            remote_user=remote_user,
-            remote_host=ship_ts_ip,
-            remote_path=f"{remote_home}/.claude/tasks/{voyage.task_list_id}",
-            session_name=f"{session_name}-tasks",
-        )
-
-        # Copy prompt.md and on-stop.sh (one-time, not synced)
-        _copy_file_to_ship(
-            voyage_dir / "prompt.md",
-            f"{remote_home}/voyage/prompt.md",
-            ship_vm,
-            ship_ts_ip,
-            provider,
-        )
-        _copy_file_to_ship(
-            voyage_dir / "on-stop.sh",
-            f"{remote_home}/.ocaptain/hooks/on-stop.sh",
-            ship_vm,
-            ship_ts_ip,
-            provider,
-        )
+        _attach_ship(voyage, voyage_dir, ship_vm, ship_ts_ip, provider)
 
     # 10. Launch local tmux session
     from .tmux import launch_fleet
 
     ship_vms = [vm for vm, _ in successful_ships]
-    ship_vms.sort(key=lambda vm: int(vm.name.split("ship")[-1]))
+    ship_vms.sort(key=_ship_index)
     launch_fleet(voyage, ship_vms, tokens)
 
     return voyage
 
 
+def bootstrap_fleet(
+    voyage: Voyage,
+    indices: Iterable[int],
+    tokens: dict[str, str],
+    telemetry: bool = True,
+) -> tuple[list[tuple[VM, str]], list[tuple[int, Exception]]]:
+    """Bootstrap ships in parallel.
+
+    Returns (successful, failed) where successful holds (vm, tailscale_ip)
+    pairs and failed holds (index, error) pairs.
+    """
+    import logging
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from .ship import bootstrap_ship
+
+    logger = logging.getLogger(__name__)
+    indices = list(indices)
+
+    successful_ships: list[tuple[VM, str]] = []  # (vm, tailscale_ip)
+    failed_ships: list[tuple[int, Exception]] = []
+
+    if not indices:
+        return successful_ships, failed_ships
+
+    with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+        futures = {
+            executor.submit(bootstrap_ship, voyage, i, tokens, telemetry): i for i in indices
+        }
+
+        for future in as_completed(futures):
+            ship_idx = futures[future]
+            try:
+                ship_vm, ship_ts_ip = future.result()
+                successful_ships.append((ship_vm, ship_ts_ip))
+            except Exception as e:
+                logger.warning("Ship-%d bootstrap failed: %s", ship_idx, e)
+                failed_ships.append((ship_idx, e))
+
+    return successful_ships, failed_ships
+
+
+def _ship_index(ship_vm: VM) -> int:
+    """Parse the ship index from a ship VM name (<voyage-id>-ship<n>)."""
+    return int(ship_vm.name.split("ship")[-1])
+
+
+def _attach_ship(
+    voyage: Voyage,
+    voyage_dir: Path,
+    ship_vm: VM,
+    ship_ts_ip: str,
+    provider: Provider,
+) -> None:
+    """Start Mutagen sync sessions for a ship and copy one-time files to it."""
+    from .mutagen import create_sync
+
+    session_name = f"{voyage.id}-ship-{_ship_index(ship_vm)}"
+    remote_user = _get_remote_user(ship_vm)
+    remote_home = _get_remote_home(ship_vm)
+
+    # Sync workspace
+    create_sync(
+        local_path=voyage_dir / "workspace",
+        remote_user=remote_user,
+        remote_host=ship_ts_ip,
+        remote_path=f"{remote_home}/voyage/workspace",
+        session_name=f"{session_name}-workspace",
+        extra_ignores=[".claude"],
+    )
+
+    # Sync tasks
+    create_sync(
+        local_path=voyage_dir / ".claude" / "tasks" / voyage.task_list_id,
+        remote_user=remote_user,
+        remote_host=ship_ts_ip,
+        remote_path=f"{remote_home}/.claude/tasks/{voyage.task_list_id}",
+        session_name=f"{session_name}-tasks",
+    )
+
+    with catalog_session() as catalog:
+        if catalog:
+            catalog.record_ship(
+                voyage.id,
+                f"ship-{_ship_index(ship_vm)}",
+                ship_vm,
+                ship_ts_ip,
+                [f"{session_name}-workspace", f"{session_name}-tasks"],
+            )
+
+    # Copy prompt.md and on-stop.sh (one-time, not synced)
+    _copy_file_to_ship(
+        voyage_dir / "prompt.md",
+        f"{remote_home}/voyage/prompt.md",
+        ship_vm,
+        ship_ts_ip,
+        provider,
+    )
+    _copy_file_to_ship(
+        voyage_dir / "on-stop.sh",
+        f"{remote_home}/.ocaptain/hooks/on-stop.sh",
+        ship_vm,
+        ship_ts_ip,
+        provider,
+    )
+
+
 def sail_empty(
     repo: str | None = None,
     tokens: dict[str, str] | None = None,
@@ -278,7 +341,7 @@ def sail_empty(
     3. Clone repository on ship (if repo provided)
     4. Launch Claude interactively in tmux
     """
-    from .config import CONFIG
+    from .config import CONFIG, tailscale_ip
     from .local_storage import setup_local_voyage
     from .ship import bootstrap_ship
     from .tmux import launch_interactive_ship
@@ -291,7 +354,7 @@ def sail_empty(
     voyage = Voyage.create(prompt, repo or "local", ships=1)
 
     # Verify tailscale is ready
-    if not CONFIG.tailscale.ip:
+    if not tailscale_ip():
         raise RuntimeError("Tailscale IP not detected. Is Tailscale running?")
     if not CONFIG.tailscale.oauth_secret:
         raise RuntimeError("OCAPTAIN_TAILSCALE_OAUTH_SECRET not set")
@@ -305,6 +368,11 @@ def sail_empty(
     # 3. Bootstrap single ship
     ship_vm, ship_ts_ip = bootstrap_ship(voyage, 0, tokens, telemetry)
 
+    with catalog_session() as catalog:
+        if catalog:
+            catalog.record_voyage(voyage, voyage_dir)
+            catalog.record_ship(voyage.id, "ship-0", ship_vm, ship_ts_ip)
+
     # 4. Write and copy stop hook to ship
     hook_content = render_stop_hook()
     (voyage_dir / "on-stop.sh").write_text(hook_content)
@@ -372,15 +440,43 @@ def _tailscale_logout(vm: VM, provider: Provider) -> None:
 
 
 def sink(voyage_id: str) -> int:
-    """Destroy all VMs for a voyage."""
+    """Destroy all VMs for a voyage.
+
+    Ships recorded in the local catalog are destroyed first; provider.list()
+    then sweeps up any the catalog missed (e.g. ships whose bootstrap failed).
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
     provider = get_provider()
 
-    vms = provider.list(prefix=voyage_id)
+    vms: list[VM] = []
+    with catalog_session() as catalog:
+        if catalog:
+            vms = catalog.ships(voyage_id)
+
+    destroyed: set[str] = set()
     for vm in vms:
+        _tailscale_logout(vm, provider)
+        try:
+            provider.destroy(vm.id)
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            # Stale catalog entry; the provider sweep below settles it
+            logger.debug("Destroying catalogued %s failed: %s", vm.name, e)
+            continue
+        destroyed.add(vm.id)
+
+    strays = [vm for vm in provider.list(prefix=voyage_id) if vm.id not in destroyed]
+    for vm in strays:
         _tailscale_logout(vm, provider)
         provider.destroy(vm.id)
 
-    return len(vms)
+    with catalog_session() as catalog:
+        if catalog:
+            catalog.mark_sunk(voyage_id)
+    return len(destroyed) + len(strays)
 
 
 def sink_all() -> int:
@@ -392,9 +488,245 @@ def sink_all() -> int:
         _tailscale_logout(vm, provider)
         provider.destroy(vm.id)
 
+    with catalog_session() as catalog:
+        if catalog:
+            for voyage_id in {vm.name.rsplit("-ship", 1)[0] for vm in vms}:
+                catalog.mark_sunk(voyage_id)
     return len(vms)
 
 
+def list_ships(voyage: Voyage, provider: Provider) -> list[VM]:
+    """List a voyage's ship VMs ordered by ship index."""
+    prefix = f"{voyage.id}-ship"
+    vms = [vm for vm in provider.list(prefix=prefix) if vm.name[len(prefix) :].isdigit()]
+    return sorted(vms, key=_ship_index)
+
+
+def known_ships(voyage: Voyage, provider: Provider) -> list[VM]:
+    """A voyage's ship VMs from the local catalog, falling back to list_ships()."""
+    vms: list[VM] = []
+    with catalog_session() as catalog:
+        if catalog:
+            vms = catalog.ships(voyage.id)
+    return sorted(vms, key=_ship_index) if vms else list_ships(voyage, provider)
+
+
+def autoscale_target(tasks: "list[Task]", min_ships: int, max_ships: int) -> int:
+    """Fleet size matching current demand (ready pending tasks plus active claims)."""
+    from .tasks import TaskStatus, ready_tasks
+
+    in_progress = sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS)
+    demand = len(ready_tasks(tasks)) + in_progress
+    return max(min_ships, min(max_ships, demand))
+
+
+def _pick_ships_to_drain(vms: list[VM], busy: set[str], count: int) -> list[VM]:
+    """Choose which ships to remove: idle ships first, then highest index."""
+    ranked = sorted(vms, key=lambda vm: (f"ship-{_ship_index(vm)}" in busy, -_ship_index(vm)))
+    return ranked[:count]
+
+
+def _busy_ships(voyage: Voyage, voyage_dir: Path) -> set[str]:
+    """Ship IDs currently holding an in-progress task."""
+    from .tasks import TaskStatus, list_tasks_local
+
+    return {
+        t.assignee
+        for t in list_tasks_local(voyage_dir, voyage)
+        if t.status == TaskStatus.IN_PROGRESS and t.assignee
+    }
+
+
+def _request_drain(vm: VM, provider: Provider) -> None:
+    """Tell a ship to stop claiming new tasks (see ship_prompt.md)."""
+    import logging
+
+    logger = logging.getLogger(__name__)
+    try:
+        with get_connection(vm, provider) as c:
+            c.run("touch ~/.ocaptain/drain", hide=True, warn=True, timeout=10)
+    except KeyboardInterrupt:
+        raise
+    except Exception as e:
+        logger.debug("Drain request failed for %s: %s (VM may be unreachable)", vm.name, e)
+
+
+def _remove_ship(voyage: Voyage, vm: VM, provider: Provider) -> None:
+    """Stop Claude, tear down sync sessions and destroy a ship VM."""
+    import logging
+
+    from .mutagen import terminate_sync
+
+    logger = logging.getLogger(__name__)
+    try:
+        with get_connection(vm, provider) as c:
+            c.run("tmux kill-session -t claude", hide=True, warn=True, timeout=10)
+    except KeyboardInterrupt:
+        raise
+    except Exception as e:
+        logger.debug("Stopping Claude failed for %s: %s (VM may be unreachable)", vm.name, e)
+
+    session_name = f"{voyage.id}-ship-{_ship_index(vm)}"
+    terminate_sync(f"{session_name}-workspace")
+    terminate_sync(f"{session_name}-tasks")
+
+    _tailscale_logout(vm, provider)
+    provider.destroy(vm.id)
+
+    with catalog_session() as catalog:
+        if catalog:
+            catalog.remove_ship(voyage.id, f"ship-{_ship_index(vm)}")
+
+
+@dataclass
+class Drainer:
+    """Ships told to stop claiming tasks, removed once they go idle.
+
+    request() returns immediately; each poll() destroys the draining ships
+    that no longer hold an in-progress task, or that have been draining for
+    longer than `timeout` seconds (their claims go stale and can be
+    reclaimed). The autoscaler polls between demand checks, so a slow drain
+    never holds up scaling back up.
+    """
+
+    voyage: Voyage
+    voyage_dir: Path
+    provider: Provider
+    timeout: float = 1800
+    draining: dict[str, tuple[VM, float]] = field(default_factory=dict)  # ship -> (vm, deadline)
+
+    def request(self, vms: list[VM]) -> None:
+        import time
+
+        deadline = time.monotonic() + self.timeout
+        for vm in vms:
+            _request_drain(vm, self.provider)
+            self.draining[f"ship-{_ship_index(vm)}"] = (vm, deadline)
+
+    def poll(self) -> list[str]:
+        """Remove draining ships that are idle or out of time. Returns their IDs."""
+        import logging
+        import time
+
+        logger = logging.getLogger(__name__)
+        if not self.draining:
+            return []
+
+        busy = _busy_ships(self.voyage, self.voyage_dir)
+        now = time.monotonic()
+        removed = []
+        for ship_id, (vm, deadline) in list(self.draining.items()):
+            if ship_id in busy and now < deadline:
+                continue
+            if ship_id in busy:
+                logger.warning("Drain timed out for %s, removing it mid-task", ship_id)
+            try:
+                _remove_ship(self.voyage, vm, self.provider)
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                logger.warning("Removing %s failed, retrying on the next poll: %s", ship_id, e)
+                continue
+            del self.draining[ship_id]
+            removed.append(ship_id)
+        return removed
+
+    def active(self, vms: list[VM]) -> list[VM]:
+        """The ships in vms that are not draining."""
+        return [vm for vm in vms if f"ship-{_ship_index(vm)}" not in self.draining]
+
+
+def drain_ships(
+    voyage: Voyage,
+    voyage_dir: Path,
+    vms: list[VM],
+    provider: Provider,
+    timeout: int = 1800,
+) -> None:
+    """Gracefully remove ships from a running voyage, waiting until they are gone.
+
+    See Drainer for when each ship is removed.
+    """
+    import time
+
+    drainer = Drainer(voyage, voyage_dir, provider, timeout)
+    drainer.request(vms)
+    while True:
+        drainer.poll()
+        if not drainer.draining:
+            return
+        time.sleep(_DRAIN_POLL_SECONDS)
+
+
+def scale(
+    voyage_id: str,
+    ships: int,
+    tokens: dict[str, str],
+    telemetry: bool = True,
+    drain_timeout: int = 1800,
+    drainer: Drainer | None = None,
+) -> Voyage:
+    """Grow or shrink a running voyage's fleet to `ships` ships.
+
+    New ships are bootstrapped, synced and launched exactly as at sail time,
+    using indices after the highest existing ship. Removed ships are drained:
+    with a drainer the drain is only requested and ships already draining
+    don't count toward the fleet; without one this waits for them (see
+    drain_ships). Returns the voyage with its updated ship count.
+    """
+    import logging
+
+    from .local_storage import get_voyage_dir
+    from .tmux import launch_fleet
+
+    logger = logging.getLogger(__name__)
+
+    if ships < 1:
+        raise ValueError("A voyage needs at least one ship")
+
+    voyage = load_voyage(voyage_id)
+    voyage_dir = get_voyage_dir(voyage_id)
+    provider = get_provider()
+    existing = list_ships(voyage, provider)
+    current = drainer.active(existing) if drainer else existing
+    fleet_size = len(current)
+
+    if ships > fleet_size:
+        start = _ship_index(existing[-1]) + 1 if existing else 0
+        indices = range(start, start + ships - fleet_size)
+        successful_ships, failed_ships = bootstrap_fleet(voyage, indices, tokens, telemetry)
+
+        if failed_ships:
+            logger.warning(
+                "Added %d of %d ships (%d failed)",
+                len(successful_ships),
+                len(indices),
+                len(failed_ships),
+            )
+
+        for ship_vm, ship_ts_ip in successful_ships:
+            _attach_ship(voyage, voyage_dir, ship_vm, ship_ts_ip, provider)
+
+        launch_fleet(voyage, sorted((vm for vm, _ in successful_ships), key=_ship_index), tokens)
+        fleet_size += len(successful_ships)
+    elif ships < fleet_size:
+        to_remove = _pick_ships_to_drain(
+            current, _busy_ships(voyage, voyage_dir), fleet_size - ships
+        )
+        if drainer:
+            drainer.request(to_remove)
+        else:
+            drain_ships(voyage, voyage_dir, to_remove, provider, timeout=drain_timeout)
+        fleet_size -= len(to_remove)
+
+    voyage = replace(voyage, ship_count=fleet_size)
+    (voyage_dir / "voyage.json").write_text(voyage.to_json())
+    with catalog_session() as catalog:
+        if catalog:
+            catalog.record_voyage(voyage, voyage_dir)
+    return voyage
+
+
 def render_ship_prompt(voyage: Voyage) -> str:
     """Render the ship prompt template."""
     template = files("ocaptain.templates").joinpath("ship_prompt.md").read_text()
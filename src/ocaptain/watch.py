@@ -0,0 +1,271 @@
+"""Voyage supervision: stale task reclamation and ship crash watchdog."""
+
+import json
+import logging
+import os
+import re
+import shlex
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .provider import VM, Provider
+from .tasks import Task, TaskStatus, ready_tasks
+
+if TYPE_CHECKING:
+    from .voyage import Voyage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Reclaim:
+    """A task claim that was released back to pending."""
+
+    task_id: str
+    ship: str | None
+    reason: str  # "stale" or "ship-lost"
+
+
+def _write_task_file(path: Path, data: dict[str, Any]) -> None:
+    """Atomically replace a task file so ships never see a partial write."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
+
+
+def _claim_is_stale(task: Task, mtime: float, threshold_minutes: int, now: datetime) -> bool:
+    """Check claim age, falling back to file mtime when the claim has no timestamp."""
+    if task.claimed_at is not None:
+        return task.is_stale(threshold_minutes, now)
+    age = now.timestamp() - mtime
+    return age > threshold_minutes * 60
+
+
+def reset_task(data: dict[str, Any], reason: str, now: datetime) -> dict[str, Any]:
+    """Return task JSON released back to pending, with the reclaim recorded in metadata."""
+    metadata = dict(data.get("metadata") or {})
+    previous_owner = data.get("owner") or metadata.get("assignee") or metadata.get("ship")
+
+    for key in ("assignee", "ship", "claimed_at"):
+        metadata.pop(key, None)
+    metadata["reclaimed"] = [
+        *metadata.get("reclaimed", []),
+        {"ship": previous_owner, "reason": reason, "at": now.isoformat()},
+    ]
+
+    released = {k: v for k, v in data.items() if k != "owner"}
+    released["status"] = TaskStatus.PENDING.value
+    released["metadata"] = metadata
+    return released
+
+
+def reclaim_stale_tasks(
+    voyage: "Voyage",
+    voyage_dir: Path,
+    threshold_minutes: int | None = None,
+    live_ships: set[str] | None = None,
+) -> list[Reclaim]:
+    """Release in-progress tasks whose owner is gone or whose claim went stale.
+
+    Args:
+        voyage: The voyage whose task list to scan
+        voyage_dir: Local voyage directory (synced to ships by Mutagen)
+        threshold_minutes: Claim age after which a task is stale
+            (defaults to CONFIG.stale_threshold_minutes)
+        live_ships: Ship IDs whose VMs still exist. Claims held by any other
+            ship are released immediately; claims with no owner recorded are
+            left to the staleness rule. None means liveness is unknown.
+
+    Returns:
+        The reclaims performed
+    """
+    from .config import CONFIG
+
+    threshold = threshold_minutes or CONFIG.stale_threshold_minutes
+    task_dir = voyage_dir / ".claude" / "tasks" / voyage.task_list_id
+    if not task_dir.exists():
+        return []
+
+    now = datetime.now(UTC)
+    reclaims: list[Reclaim] = []
+
+    for task_file in sorted(task_dir.glob("*.json")):
+        try:
+            data = json.loads(task_file.read_text())
+            task = Task.from_json(data)
+            mtime = task_file.stat().st_mtime
+        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.error("Failed to read task file %s: %s", task_file, e)
+            continue
+
+        if task.status != TaskStatus.IN_PROGRESS:
+            continue
+
+        if live_ships is not None and task.assignee and task.assignee not in live_ships:
+            reason = "ship-lost"
+        elif _claim_is_stale(task, mtime, threshold, now):
+            reason = "stale"
+        else:
+            continue
+
+        _write_task_file(task_file, reset_task(data, reason, now))
+        logger.info("Reclaimed task %s from %s (%s)", task.id, task.assignee, reason)
+        reclaims.append(Reclaim(task_id=task.id, ship=task.assignee, reason=reason))
+
+    return reclaims
+
+
+def fleet_vms(voyage: "Voyage", provider: Provider) -> list[VM] | None:
+    """List the voyage's ship VMs, or None if the provider can't be reached."""
+    from .voyage import list_ships
+
+    try:
+        return list_ships(voyage, provider)
+    except KeyboardInterrupt:
+        raise
+    except Exception as e:
+        logger.warning("Ship liveness unavailable, using staleness only: %s", e)
+        return None
+
+
+def ship_id_for(vm: VM) -> str:
+    """Ship ID (ship-<n>) for a ship VM."""
+    from .voyage import _ship_index
+
+    return f"ship-{_ship_index(vm)}"
+
+
+# Last "[ship-N] Exit <code>" line written by tmux._build_claude_command
+_EXIT_LINE = re.compile(r"\] Exit (-?\d+) at ")
+
+
+@dataclass(frozen=True)
+class SessionState:
+    """Observed state of Claude's tmux session on a ship."""
+
+    session: bool  # tmux session "claude" exists
+    running: bool  # run-claude.exp is still alive
+    draining: bool  # ship was asked to stop claiming tasks
+    exit_code: int | None  # exit code of the last finished run, if any
+
+
+def _session_check_command(ship_id: str) -> str:
+    log = f"~/voyage/logs/{ship_id}.log"
+    pattern = shlex.quote(f"^\\[{ship_id}\\] (Starting|Exit)")
+    # log-rotate.py also looks in the newest rotated segment; plain grep covers
+    # ships without it
+    return (
+        "tmux has-session -t claude 2>/dev/null && echo session:yes || echo session:no; "
+        "pgrep -f '[r]un-claude.exp' >/dev/null && echo running:yes || echo running:no; "
+        "test -f ~/.ocaptain/drain && echo drain:yes || echo drain:no; "
+        f"python3 ~/.ocaptain/log-rotate.py --last-line {log} {pattern} 2>/dev/null "
+        f"|| grep -aE {pattern} {log} 2>/dev/null | tail -n 1"
+    )
+
+
+def parse_session_state(output: str) -> SessionState:
+    """Parse the output of the session check command."""
+    last_line = output.strip().splitlines()[-1] if output.strip() else ""
+    match = _EXIT_LINE.search(last_line)
+    return SessionState(
+        session="session:yes" in output,
+        running="running:yes" in output,
+        draining="drain:yes" in output,
+        exit_code=int(match.group(1)) if match else None,
+    )
+
+
+def check_session(vm: VM, ship_id: str, provider: Provider) -> SessionState | None:
+    """Check Claude's session on a ship. Returns None if the ship is unreachable."""
+    from .provider import get_connection
+
+    try:
+        with get_connection(vm, provider) as c:
+            result = c.run(_session_check_command(ship_id), hide=True, warn=True, timeout=20)
+            return parse_session_state(str(result.stdout))
+    except KeyboardInterrupt:
+        raise
+    except Exception as e:
+        logger.debug("Session check failed for %s: %s", vm.name, e)
+        return None
+
+
+@dataclass(frozen=True)
+class Relaunch:
+    """A Claude relaunch performed (or abandoned) by the watchdog."""
+
+    ship: str
+    attempt: int
+    exit_code: int | None
+    gave_up: bool = False
+    error: str | None = None  # why the relaunch attempt failed, if it did
+
+
+@dataclass
+class _RestartState:
+    restarts: int = 0
+    next_attempt: float = 0.0
+    gave_up: bool = False
+
+
+@dataclass
+class ShipWatchdog:
+    """Relaunch Claude on ships whose session finished while claimable work remains.
+
+    Relaunches back off exponentially per ship (backoff_seconds doubling up to
+    max_backoff_seconds) and stop after max_restarts. A relaunch that fails
+    still counts as an attempt, so an unreachable ship is not retried forever.
+    """
+
+    voyage: "Voyage"
+    oauth_token: str
+    max_restarts: int = 5
+    backoff_seconds: float = 60.0
+    max_backoff_seconds: float = 1800.0
+    _state: dict[str, _RestartState] = field(default_factory=dict)
+
+    def check(self, vms: list[VM], tasks: list[Task], provider: Provider) -> list[Relaunch]:
+        """Inspect each ship and relaunch Claude where it has stopped."""
+        from .tmux import relaunch_claude
+
+        has_ready_work = bool(ready_tasks(tasks))
+        owners = {t.assignee for t in tasks if t.status == TaskStatus.IN_PROGRESS}
+        events: list[Relaunch] = []
+        now = time.monotonic()
+
+        for vm in vms:
+            ship_id = ship_id_for(vm)
+            state = self._state.setdefault(ship_id, _RestartState())
+            if state.gave_up or now < state.next_attempt:
+                continue
+            if not has_ready_work and ship_id not in owners:
+                continue
+
+            session = check_session(vm, ship_id, provider)
+            if session is None or session.running or session.draining:
+                continue
+
+            if state.restarts >= self.max_restarts:
+                state.gave_up = True
+                logger.warning("Giving up on %s after %d relaunches", ship_id, state.restarts)
+                events.append(Relaunch(ship_id, state.restarts, session.exit_code, gave_up=True))
+                continue
+
+            error = None
+            try:
+                relaunch_claude(vm, ship_id, self.voyage, self.oauth_token)
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                logger.warning("Relaunch failed for %s: %s", ship_id, e)
+                error = str(e) or type(e).__name__
+
+            delay = min(self.max_backoff_seconds, self.backoff_seconds * 2**state.restarts)
+            state.restarts += 1
+            state.next_attempt = now + delay
+            events.append(Relaunch(ship_id, state.restarts, session.exit_code, error=error))
+
+        return events
@@ -0,0 +1,63 @@
+"""Tests for the local voyage catalog."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from ocaptain.catalog import Catalog
+from ocaptain.provider import VM, VMStatus
+from ocaptain.tasks import VoyageState, VoyageStatus
+from ocaptain.voyage import Voyage, sink
+
+
+def _vm(name: str) -> VM:
+    return VM(id=f"id-{name}", name=name, ssh_dest=f"user@{name}", status=VMStatus.RUNNING)
+
+
+def test_catalog_tracks_voyage_ships_and_summary(tmp_path: Path) -> None:
+    """Voyages, ships, sync sessions and task summaries round-trip."""
+    catalog = Catalog(tmp_path / "catalog.db")
+    voyage = Voyage.create("Build it", "owner/repo", 2)
+    catalog.record_voyage(voyage, tmp_path / voyage.id)
+    catalog.record_ship(voyage.id, "ship-0", _vm(voyage.ship_name(0)), "100.64.0.1", ["a", "b"])
+    catalog.record_ship(voyage.id, "ship-1", _vm(voyage.ship_name(1)), "100.64.0.2", ["c"])
+    catalog.record_status(VoyageStatus(voyage, VoyageState.RUNNING, (), 3, 1, 6, 0, 10))
+
+    [entry] = catalog.voyages()
+    assert (entry.id, entry.ship_count, entry.sunk) == (voyage.id, 2, False)
+    assert (entry.state, entry.tasks_complete, entry.tasks_total) == ("running", 3, 10)
+
+    ship = catalog.ship(voyage.id, "ship-1")
+    assert ship is not None
+    assert (ship.id, ship.ssh_dest) == (f"id-{voyage.id}-ship1", f"user@{voyage.id}-ship1")
+    assert catalog.sync_sessions(voyage.id) == ["a", "b", "c"]
+    assert catalog.ship_ips(voyage.id) == {"ship-0": "100.64.0.1", "ship-1": "100.64.0.2"}
+
+    catalog.remove_ship(voyage.id, "ship-1")
+    assert [vm.name for vm in catalog.ships(voyage.id)] == [voyage.ship_name(0)]
+    assert catalog.sync_sessions(voyage.id) == ["a", "b"]
+
+    catalog.mark_sunk(voyage.id)
+    assert catalog.ships(voyage.id) == []
+    assert catalog.voyages()[0].sunk
+
+
+def test_sink_uses_catalog_and_sweeps_strays(tmp_path: Path, mocker: MockerFixture) -> None:
+    """sink destroys catalogued ships, then any the catalog missed."""
+    voyage = Voyage.create("Build it", "owner/repo", 2)
+    catalog = Catalog(tmp_path / "catalog.db")
+    catalog.record_voyage(voyage, tmp_path / voyage.id)
+    catalog.record_ship(voyage.id, "ship-0", _vm(voyage.ship_name(0)), None)
+    catalog.close()
+
+    provider = MagicMock()
+    provider.list.return_value = [_vm(voyage.ship_name(1))]
+    mocker.patch("ocaptain.voyage.get_provider", return_value=provider)
+    mocker.patch("ocaptain.voyage._tailscale_logout")
+    mocker.patch("ocaptain.catalog.catalog_path", return_value=tmp_path / "catalog.db")
+
+    assert sink(voyage.id) == 2
+    destroyed = [c.args[0] for c in provider.destroy.call_args_list]
+    assert destroyed == [f"id-{voyage.ship_name(0)}", f"id-{voyage.ship_name(1)}"]
+    assert Catalog(tmp_path / "catalog.db").voyages()[0].sunk
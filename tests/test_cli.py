@@ -0,0 +1,36 @@
+"""Tests for CLI startup cost."""
+
+import os
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+
+# Generous enough for a cold CI runner; fabric alone used to take longer
+MAX_IMPORT_SECONDS = 1.0
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import ocaptain.cli
+elapsed = time.perf_counter() - start
+ocaptain.cli.app.info.help  # touch the app like `ocaptain --help` does
+print(elapsed)
+print(",".join(m for m in ("fabric", "paramiko", "invoke") if m in sys.modules))
+"""
+
+
+def test_cli_import_is_cheap(tmp_path: Path) -> None:
+    """Importing the CLI loads no SSH stack and never runs tailscale."""
+    marker = tmp_path / "tailscale-ran"
+    fake = tmp_path / "tailscale"
+    fake.write_text(f"#!/bin/sh\ntouch {marker}\necho 100.64.0.1\n")
+    fake.chmod(0o755)
+    env = {**os.environ, "PATH": f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}"}
+
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, env=env, check=True
+    )
+    elapsed, heavy = result.stdout.splitlines()
+    assert heavy == ""
+    assert not marker.exists()
+    assert float(elapsed) < MAX_IMPORT_SECONDS
@@ -0,0 +1,46 @@
+"""Tests for doctor checks."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from ocaptain.doctor import FAIL, OK, WARN, Check, check_disk, check_env, run_checks
+
+
+def test_run_checks_concurrently_in_order() -> None:
+    """Checks overlap, keep their order, and report latency and exceptions."""
+
+    def slow() -> tuple[str, str]:
+        time.sleep(0.2)
+        return OK, "slow"
+
+    def broken() -> tuple[str, str]:
+        raise ConnectionError("refused")
+
+    start = time.perf_counter()
+    results = run_checks(
+        [Check("a", "one", slow), Check("a", "two", slow), Check("b", "x", broken)]
+    )
+    assert time.perf_counter() - start < 0.35
+    assert [(r.name, r.status) for r in results] == [("one", OK), ("two", OK), ("x", FAIL)]
+    assert results[0].seconds >= 0.2
+    assert results[2].detail == "ConnectionError: refused"
+
+
+def test_check_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Set variables are masked; missing ones fail only when required."""
+    monkeypatch.setenv("OCAPTAIN_TEST_TOKEN", "sk-ant-oat01-abcdefghijkl")
+    monkeypatch.delenv("OCAPTAIN_TEST_MISSING", raising=False)
+    assert check_env("OCAPTAIN_TEST_TOKEN", True) == (OK, "sk-ant-oat01...")
+    assert check_env("OCAPTAIN_TEST_MISSING", True)[0] == FAIL
+    assert check_env("OCAPTAIN_TEST_MISSING", False)[0] == WARN
+
+
+def test_check_disk_cleans_up(tmp_path: Path) -> None:
+    """The disk probe reports write throughput only and leaves no file behind."""
+    status, detail = check_disk(tmp_path / "voyages", size=2 * 1024 * 1024)
+    assert status == OK
+    assert "write" in detail and "MB/s" in detail
+    assert "read" not in detail.rsplit(": ", 1)[1]
+    assert list((tmp_path / "voyages").iterdir()) == []
@@ -0,0 +1,98 @@
+"""Tests for the task transition journal and voyage report."""
+
+from pathlib import Path
+
+from ocaptain.journal import TaskJournal, build_report, dag_layers
+from ocaptain.tasks import Task
+
+
+def _task(task_id: str, status: str, owner: str | None = None, **extra: object) -> Task:
+    data: dict[str, object] = {"id": task_id, "title": task_id, "status": status, **extra}
+    if owner:
+        data["owner"] = owner
+    return Task.from_json(data)
+
+
+def test_record_appends_only_changes(tmp_path: Path) -> None:
+    """Repeated polls record each transition once."""
+    journal = TaskJournal(tmp_path)
+    assert journal.record([_task("1", "pending"), _task("2", "pending")], now=100) == 2
+    assert journal.record([_task("1", "pending"), _task("2", "pending")], now=110) == 0
+    assert (
+        journal.record([_task("1", "in_progress", "ship-0"), _task("2", "pending")], now=120) == 1
+    )
+    assert journal.record([_task("1", "in_progress", "ship-1")], now=130) == 2
+
+    kinds = [(t.task_id, t.kind) for t in journal.transitions()]
+    assert kinds == [
+        ("1", "appeared"),
+        ("2", "appeared"),
+        ("1", "status"),
+        ("1", "owner"),
+        ("2", "disappeared"),
+    ]
+    status_row = journal.transitions()[2]
+    assert (status_row.old_status, status_row.new_status) == ("pending", "in_progress")
+    assert (status_row.old_owner, status_row.new_owner) == (None, "ship-0")
+
+
+def test_record_resumes_from_persisted_state(tmp_path: Path) -> None:
+    """A new journal instance diffs against what earlier processes recorded."""
+    TaskJournal(tmp_path).record([_task("1", "pending")], now=100)
+    journal = TaskJournal(tmp_path)
+    assert journal.record([_task("1", "pending")], now=200) == 0
+    assert journal.record([_task("1", "completed", "ship-0")], now=300) == 1
+
+
+def test_dag_layers() -> None:
+    """Layer is the longest blocker chain; unknown blockers and cycles are ignored."""
+    blockers = {"a": [], "b": ["a"], "c": ["a", "b"], "d": ["gone"], "x": ["y"], "y": ["x"]}
+    layers = dag_layers(blockers)
+    assert layers["a"] == 0
+    assert layers["b"] == 1
+    assert layers["c"] == 2
+    assert layers["d"] == 0
+    assert {layers["x"], layers["y"]} == {0, 1}
+
+
+def test_build_report(tmp_path: Path) -> None:
+    """Cycle time, queue wait, per-ship and per-layer throughput and rework."""
+    journal = TaskJournal(tmp_path)
+    journal.record([_task("1", "pending"), _task("2", "pending", blockedBy=["1"])], now=0)
+    journal.record(
+        [_task("1", "in_progress", "ship-0"), _task("2", "pending", blockedBy=["1"])], now=60
+    )
+    journal.record([_task("1", "pending"), _task("2", "pending", blockedBy=["1"])], now=120)
+    journal.record(
+        [_task("1", "in_progress", "ship-1"), _task("2", "pending", blockedBy=["1"])], now=180
+    )
+    journal.record(
+        [_task("1", "completed", "ship-1"), _task("2", "pending", blockedBy=["1"])], now=780
+    )
+    journal.record(
+        [_task("1", "completed", "ship-1"), _task("2", "in_progress", "ship-0", blockedBy=["1"])],
+        now=900,
+    )
+    journal.record(
+        [_task("1", "completed", "ship-1"), _task("2", "completed", "ship-0", blockedBy=["1"])],
+        now=1200,
+    )
+
+    report = build_report(journal)
+
+    assert report.completed == 2
+    assert report.rework == 1
+    assert report.reworked_tasks == 1
+    # Task 1: claimed at 180 (after rework), done at 780; task 2: 900 -> 1200
+    assert report.cycle_time == (600 + 300) / 2
+    # Task 1 waited 60s for its first claim; task 2 became ready at 780, claimed at 900
+    assert report.queue_wait == (60 + 120) / 2
+    assert [(s.ship, s.completed, s.cycle_time) for s in report.ships] == [
+        ("ship-0", 1, 300),
+        ("ship-1", 1, 600),
+    ]
+    assert [(layer.layer, layer.tasks, layer.completed) for layer in report.layers] == [
+        (0, 1, 1),
+        (1, 1, 1),
+    ]
+    assert report.layers[1].queue_wait == 120
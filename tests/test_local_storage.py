@@ -39,3 +39,42 @@ def test_setup_local_voyage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
     assert (voyage_dir / "artifacts").exists()
     assert (voyage_dir / "logs").exists()
     assert (voyage_dir / ".claude" / "tasks" / "task-list-id").exists()
+
+
+def test_wait_for_change_detects_new_file(tmp_path: Path) -> None:
+    """wait_for_change should return True once a watched directory changes."""
+    import threading
+
+    from ocaptain.local_storage import wait_for_change
+
+    timer = threading.Timer(0.1, lambda: (tmp_path / "1.json").write_text("{}"))
+    timer.start()
+    try:
+        assert wait_for_change([tmp_path], timeout=5, poll_interval=0.02)
+    finally:
+        timer.cancel()
+
+
+def test_wait_for_change_times_out(tmp_path: Path) -> None:
+    """wait_for_change should return False when nothing changes."""
+    from ocaptain.local_storage import wait_for_change
+
+    assert not wait_for_change([tmp_path, tmp_path / "missing"], timeout=0.1, poll_interval=0.02)
+
+
+def test_list_voyage_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """list_voyage_dirs should only return voyage dirs with a voyage.json."""
+    from ocaptain import config
+    from ocaptain.local_storage import list_voyage_dirs
+
+    monkeypatch.setattr(
+        config,
+        "CONFIG",
+        config.OcaptainConfig(local=config.LocalStorageConfig(workspace_dir=str(tmp_path))),
+    )
+    for name in ("voyage-b", "voyage-a", "voyage-empty", "telemetry"):
+        (tmp_path / name).mkdir()
+    for name in ("voyage-b", "voyage-a", "telemetry"):
+        (tmp_path / name / "voyage.json").write_text("{}")
+
+    assert list_voyage_dirs() == [tmp_path / "voyage-a", tmp_path / "voyage-b"]
@@ -0,0 +1,125 @@
+"""Tests for the log search index."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from ocaptain.log_index import LogIndex, clean_line, parse_time
+
+
+def test_clean_line_strips_ansi_and_redraws() -> None:
+    """Escape sequences go, and only the last carriage-return overwrite remains."""
+    assert clean_line("\x1b[2K\x1b[1;32m✓ done\x1b[0m  ") == "✓ done"
+    assert clean_line("Loading 10%\rLoading 50%\rLoaded") == "Loaded"
+    assert clean_line("\x1b]0;title\x07prompt> ") == "prompt>"
+    assert clean_line("line\r") == "line"
+
+
+def test_parse_time() -> None:
+    """Relative ages count back from now; naive ISO times are local."""
+    now = datetime(2026, 1, 24, 12, 0, tzinfo=UTC)
+    assert parse_time("30m", now) == datetime(2026, 1, 24, 11, 30, tzinfo=UTC)
+    assert parse_time("1d", now) == datetime(2026, 1, 23, 12, 0, tzinfo=UTC)
+    assert parse_time("2026-01-24T10:00:00+00:00") == datetime(2026, 1, 24, 10, tzinfo=UTC)
+    with pytest.raises(ValueError):
+        parse_time("yesterday")
+
+
+def test_ingest_dedupes_redraws_and_resumes(tmp_path: Path) -> None:
+    """Complete lines are indexed once; only repeated TUI redraws are dropped."""
+    log = tmp_path / "ship-0.log"
+    log.write_bytes(b"\x1b[2Ascreen\r\n\x1b[2Ascreen\r\nplain\nplain\npart")
+    index = LogIndex(tmp_path)
+    assert index.ingest(now=2e9) == 3
+
+    with log.open("ab") as f:
+        f.write(b"ial\n\x1b[2Ascreen\r\n\x1b[31mERROR boom\x1b[0m\n")
+    assert index.ingest(now=2e9 + 60) == 2
+    assert index.ingest(now=2e9 + 120) == 0
+
+    records = list(index.search())
+    assert [r.text for r in records] == ["screen", "plain", "plain", "partial", "ERROR boom"]
+    assert [r.ts for r in records] == [2e9, 2e9, 2e9, 2e9 + 60, 2e9 + 60]
+
+
+def test_ingest_uses_line_time_marks(tmp_path: Path) -> None:
+    """Marked lines take their own time; anchors only date themselves."""
+    (tmp_path / "ship-0.log").write_bytes(
+        b"[ship-0] Starting at 2026-01-24T10:00:00+00:00\n"
+        b"unmarked\n"
+        b"\x1b]ocaptain;ts=1769250000.500\x07first\n"
+        b"echoed\n"
+        b"\x1b]ocaptain;ts=1769250060.000\x07\x1b[1msecond\x1b[0m\n"
+    )
+    index = LogIndex(tmp_path)
+    index.ingest(now=2e9)
+
+    start = datetime(2026, 1, 24, 10, tzinfo=UTC).timestamp()
+    assert [(r.ts, r.text) for r in index.search()] == [
+        (start, "[ship-0] Starting at 2026-01-24T10:00:00+00:00"),
+        (1769250000.5, "first"),
+        (1769250000.5, "echoed"),
+        (1769250060.0, "second"),
+        (2e9, "unmarked"),
+    ]
+
+
+def test_ingest_follows_rotation(tmp_path: Path) -> None:
+    """Lines written before the collector rotated the log are still indexed."""
+    log = tmp_path / "ship-0.log"
+    log.write_bytes(b"one\n")
+    index = LogIndex(tmp_path)
+    index.ingest(now=100)
+
+    with log.open("ab") as f:
+        f.write(b"two\n")
+    os.replace(log, tmp_path / "ship-0.log.1")
+    log.write_bytes(b"three\n")
+
+    assert index.ingest(now=200) == 2
+    assert [r.text for r in index.search()] == ["one", "two", "three"]
+
+
+def test_ingest_prunes_records_of_deleted_files(tmp_path: Path) -> None:
+    """Once rotation deletes a local file, its records leave the index too."""
+    log = tmp_path / "ship-0.log"
+    index = LogIndex(tmp_path)
+    for name in ("one", "two", "three"):
+        if log.exists():
+            os.replace(log, tmp_path / "ship-0.log.1")  # keeps a single backup
+        log.write_text(f"{name}\n")
+        index.ingest(now=100)
+
+    assert [r.text for r in index.search()] == ["two", "three"]
+
+
+def test_concurrent_ingest_indexes_once(tmp_path: Path) -> None:
+    """Two indexes ingesting the same log at once never insert a range twice."""
+    (tmp_path / "ship-0.log").write_text("".join(f"line {i}\n" for i in range(2000)))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        added = list(pool.map(lambda _: LogIndex(tmp_path).ingest(now=100), range(2)))
+
+    assert sorted(added) == [0, 2000]
+    assert len(list(LogIndex(tmp_path).search())) == 2000
+
+
+def test_search_filters(tmp_path: Path) -> None:
+    """Ship, time range, regex and limit filters combine."""
+    index = LogIndex(tmp_path)
+    (tmp_path / "ship-0.log").write_text("error: a\ninfo\n")
+    (tmp_path / "ship-1.log").write_text("error: b\n")
+    index.ingest(now=100)
+    (tmp_path / "ship-0.log").write_text("error: a\ninfo\nerror: c\n")
+    index.ingest(now=200)
+
+    def texts(**kwargs: object) -> list[str]:
+        return [r.text for r in index.search(**kwargs)]  # type: ignore[arg-type]
+
+    assert texts(pattern=r"^error") == ["error: a", "error: b", "error: c"]
+    assert texts(pattern=r"^error", ships=["ship-0"]) == ["error: a", "error: c"]
+    assert texts(since=150) == ["error: c"]
+    assert texts(until=150, pattern="info") == ["info"]
+    assert texts(pattern="error", limit=2) == ["error: b", "error: c"]
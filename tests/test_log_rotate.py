@@ -0,0 +1,91 @@
+"""Tests for the ship-side rotating log writer."""
+
+import base64
+import gzip
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ocaptain.templates import log_rotate
+
+SCRIPT = Path(log_rotate.__file__)
+
+
+def test_tees_stdin_to_log(tmp_path: Path) -> None:
+    """Input is passed through to stdout and appended to the log."""
+    log = tmp_path / "ship-0.log"
+    log.write_bytes(b"earlier\n")
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), str(log)], input=b"out\n", capture_output=True, check=True
+    )
+    assert result.stdout == b"out\n"
+    earlier, out = log.read_bytes().split(b"\n", 1)
+    assert earlier == b"earlier"
+    assert re.fullmatch(rb"\x1b\]ocaptain;ts=[\d.]+\x07out\n", out)
+
+
+def test_line_stamper_marks_line_starts() -> None:
+    """Every line starts with a time mark, even across chunk boundaries."""
+    stamper = log_rotate.LineStamper()
+    mark = log_rotate.TIME_MARK % 5.0
+    assert stamper.stamp(b"one\ntw", now=5.0) == mark + b"one\n" + mark + b"tw"
+    assert stamper.stamp(b"o\n", now=5.0) == b"o\n"
+    assert stamper.stamp(b"\nthree\n", now=5.0) == mark + b"\n" + mark + b"three\n"
+
+
+def test_rotates_by_size_and_prunes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Full segments are gzipped and listed in the manifest; only `keep` are kept."""
+    monkeypatch.setattr(log_rotate.shutil, "which", lambda _: None)  # gzip fallback
+    path = tmp_path / "ship-0.log"
+    log = log_rotate.RotatingLog(str(path), max_bytes=10, max_age=0, keep=2)
+    for i in range(4):
+        log.write(f"segment {i}\n".encode())
+    log.write(b"tail\n")
+    log.close()
+
+    segments = log_rotate.load_manifest(str(path))["segments"]
+    assert [s["bytes"] for s in segments] == [10, 10]
+    assert sorted(p.name for p in tmp_path.glob("ship-0.log.*.gz")) == [s["file"] for s in segments]
+    kept = [gzip.decompress((tmp_path / s["file"]).read_bytes()) for s in segments]
+    assert kept == [b"segment 2\n", b"segment 3\n"]
+    assert path.read_bytes() == b"tail\n"
+
+
+def test_read_segment(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Segments are found by the inode the log had, and read from an offset."""
+    path = str(tmp_path / "ship-0.log")
+    log = log_rotate.RotatingLog(path, max_bytes=1 << 20, max_age=0, keep=5)
+    log.write(b"hello world\n")
+    inode = log.inode
+    log.rotate(background=False)
+    log.close()
+
+    assert log_rotate.main(["--read-segment", path, str(inode), "6", "5"]) == 0
+    size, payload = capsys.readouterr().out.split("\n")
+    assert (int(size), base64.b64decode(payload)) == (12, b"world")
+    assert log_rotate.main(["--read-segment", path, str(inode + 1), "0", "5"]) == 1
+
+
+def test_last_line_falls_back_to_newest_segment(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The current log is searched first, then the newest rotated segment."""
+    monkeypatch.setattr(log_rotate.shutil, "which", lambda _: None)  # gzip fallback
+    path = str(tmp_path / "ship-0.log")
+    log = log_rotate.RotatingLog(path, max_bytes=1 << 20, max_age=0, keep=5)
+    log.write(b"[ship-0] Starting at a\n[ship-0] Exit 1 at b\nmore\n")
+    log.rotate(background=False)
+    log.write(b"no match here\n")
+    pattern = r"^\[ship-0\] (Starting|Exit)"
+
+    assert log_rotate.main(["--last-line", path, pattern]) == 0
+    assert capsys.readouterr().out == "[ship-0] Exit 1 at b\n"
+
+    log.write(b"[ship-0] Starting at c\n")
+    log.close()
+    assert log_rotate.main(["--last-line", path, pattern]) == 0
+    assert capsys.readouterr().out == "[ship-0] Starting at c\n"
+    assert log_rotate.main(["--last-line", path, "nothing"]) == 1
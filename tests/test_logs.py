@@ -1,6 +1,26 @@
 """Unit tests for log viewing."""
 
-from ocaptain.logs import _SHIP_ID_PATTERN
+import io
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from ocaptain.logs import (
+    _SHIP_ID_PATTERN,
+    LogCollector,
+    LogFollower,
+    parse_fetch_output,
+    rotate_log,
+    view_logs_local,
+)
+from ocaptain.provider import VM, VMStatus
+from ocaptain.templates import log_rotate
 
 
 def test_valid_ship_id_pattern() -> None:
@@ -26,3 +46,176 @@ def test_invalid_ship_id_pattern() -> None:
     assert not _SHIP_ID_PATTERN.match("ship-abc")
     assert not _SHIP_ID_PATTERN.match(" ship-0")
     assert not _SHIP_ID_PATTERN.match("ship-0 ")
+
+
+def _local_connection(home: Path) -> MagicMock:
+    """A stand-in connection that runs commands locally with HOME set to `home`."""
+
+    def run(cmd: str, **_: object) -> subprocess.CompletedProcess[str]:
+        result = subprocess.run(
+            ["bash", "-c", cmd],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "HOME": str(home)},
+        )
+        result.ok = result.returncode == 0  # type: ignore[attr-defined]
+        result.return_code = result.returncode  # type: ignore[attr-defined]
+        return result
+
+    conn = MagicMock()
+    conn.__enter__.return_value.run.side_effect = run
+    return conn
+
+
+def test_parse_fetch_output() -> None:
+    """Fetch output is the remote size and inode line followed by base64 data."""
+    assert parse_fetch_output("11 42\naGVsbG8gd29ybGQ=") == (11, 42, b"hello world")
+    assert parse_fetch_output("0 0\n") == (0, 0, b"")
+    assert parse_fetch_output("5\n") == (5, 0, b"")
+    with pytest.raises(ValueError):
+        parse_fetch_output("")
+
+
+def test_rotate_log(tmp_path: Path) -> None:
+    """Logs past max_bytes shift to .1, .2, ... keeping `backups` copies."""
+    log = tmp_path / "ship-0.log"
+    for content in ("first", "second", "third"):
+        log.write_text(content)
+        assert rotate_log(log, max_bytes=4, backups=2)
+    assert not log.exists()
+    assert (tmp_path / "ship-0.log.1").read_text() == "third"
+    assert (tmp_path / "ship-0.log.2").read_text() == "second"
+    log.write_text("abc")
+    assert not rotate_log(log, max_bytes=4, backups=2)
+
+
+def test_log_collector_resumes_from_offset(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Collection appends only new bytes, survives restarts and handles truncation."""
+    remote_home = tmp_path / "remote"
+    remote_log = remote_home / "voyage" / "logs" / "ship-0.log"
+    remote_log.parent.mkdir(parents=True)
+    voyage_dir = tmp_path / "voyage"
+    mocker.patch("ocaptain.provider.get_connection", return_value=_local_connection(remote_home))
+    vm = VM(id="1", name="voyage-x-ship0", ssh_dest="u@h", status=VMStatus.RUNNING)
+    local_log = voyage_dir / "logs" / "ship-0.log"
+
+    remote_log.write_bytes(b"line 1\n\x1b[2Kline 2\n")
+    assert LogCollector(voyage_dir).collect([vm], MagicMock()) == {"ship-0": 18}
+
+    with remote_log.open("ab") as f:
+        f.write(b"line 3\n")
+    # A fresh collector picks up the persisted offset
+    assert LogCollector(voyage_dir).collect([vm], MagicMock()) == {"ship-0": 7}
+    assert local_log.read_bytes() == b"line 1\n\x1b[2Kline 2\nline 3\n"
+
+    remote_log.write_bytes(b"new\n")
+    LogCollector(voyage_dir).collect([vm], MagicMock())
+    assert local_log.read_bytes().endswith(b"line 3\nnew\n")
+
+
+def test_concurrent_collectors_do_not_duplicate(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Two long-lived collectors on one voyage (watch and logs -f) append each byte once."""
+    remote_home = tmp_path / "remote"
+    remote_log = remote_home / "voyage" / "logs" / "ship-0.log"
+    remote_log.parent.mkdir(parents=True)
+    voyage_dir = tmp_path / "voyage"
+    mocker.patch("ocaptain.provider.get_connection", return_value=_local_connection(remote_home))
+    vm = VM(id="1", name="voyage-x-ship0", ssh_dest="u@h", status=VMStatus.RUNNING)
+    watch, follow = LogCollector(voyage_dir), LogCollector(voyage_dir)
+
+    expected = b""
+    for i in range(5):
+        line = f"line {i}\n".encode()
+        with remote_log.open("ab") as f:
+            f.write(line)
+        expected += line
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda c: c.collect([vm], MagicMock()), (watch, follow)))
+        follow.collect([vm], MagicMock())
+
+    assert (voyage_dir / "logs" / "ship-0.log").read_bytes() == expected
+
+
+def test_log_follower_prefixes_filters_and_discovers(tmp_path: Path) -> None:
+    """New lines from all ships are merged with prefixes; new ship logs are picked up."""
+    (tmp_path / "ship-0.log").write_text("old 1\nold 2\n")
+    out = io.StringIO()
+    follower = LogFollower(tmp_path, grep=r"^(old 2|new|\w+ error)", backlog=1, out=out)
+
+    follower.poll()
+    assert out.getvalue() == "[ship-0] old 2\n"
+
+    with (tmp_path / "ship-0.log").open("a") as f:
+        f.write("\x1b[1mnew\x1b[0m\nskipped\npartial ")
+    (tmp_path / "ship-1.log").write_text("ship1 error\n")
+    follower.poll()
+    with (tmp_path / "ship-0.log").open("a") as f:
+        f.write("error\n")
+    follower.poll()
+    follower.close()
+
+    assert out.getvalue().splitlines() == [
+        "[ship-0] old 2",
+        "[ship-0] new",
+        "[ship-1] ship1 error",
+        "[ship-0] partial error",
+    ]
+
+
+def test_log_follower_reopens_rotated_log(tmp_path: Path) -> None:
+    """After rotation the follower drains the old file and continues with the new one."""
+    log = tmp_path / "ship-0.log"
+    log.write_text("")
+    out = io.StringIO()
+    follower = LogFollower(tmp_path, out=out)
+    follower.poll()
+
+    with log.open("a") as f:
+        f.write("before\n")
+    os.replace(log, tmp_path / "ship-0.log.1")
+    log.write_text("after\n")
+    follower.poll()
+    follower.close()
+
+    assert out.getvalue().splitlines() == ["[ship-0] before", "[ship-0] after"]
+
+
+def test_log_collector_drains_rotated_segment(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Output written just before the ship rotated its log is not lost."""
+    remote_home = tmp_path / "remote"
+    remote_log = remote_home / "voyage" / "logs" / "ship-0.log"
+    remote_log.parent.mkdir(parents=True)
+    script = remote_home / ".ocaptain" / "log-rotate.py"
+    script.parent.mkdir()
+    shutil.copy(Path(log_rotate.__file__), script)
+    voyage_dir = tmp_path / "voyage"
+    mocker.patch("ocaptain.provider.get_connection", return_value=_local_connection(remote_home))
+    vm = VM(id="1", name="voyage-x-ship0", ssh_dest="u@h", status=VMStatus.RUNNING)
+
+    log = log_rotate.RotatingLog(str(remote_log), max_bytes=1 << 20, max_age=0, keep=5)
+    log.write(b"one\n")
+    LogCollector(voyage_dir).collect([vm], MagicMock())
+    log.write(b"two\n")
+    log.rotate(background=False)
+    log.write(b"three\n")
+    log.close()
+
+    assert LogCollector(voyage_dir).collect([vm], MagicMock()) == {"ship-0": 10}
+    assert (voyage_dir / "logs" / "ship-0.log").read_bytes() == b"one\ntwo\nthree\n"
+
+
+def test_view_logs_local_reads_across_backups(
+    tmp_path: Path, capsysbinary: pytest.CaptureFixture[bytes]
+) -> None:
+    """Viewing a log includes its rotated local backups, oldest first, without time marks."""
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    (logs_dir / "ship-0.log.2").write_bytes(b"a\nb")
+    (logs_dir / "ship-0.log.1").write_bytes(b"c\nerror d\n")
+    (logs_dir / "ship-0.log").write_bytes(b"\x1b]ocaptain;ts=1.000\x07error e\n")
+    voyage = MagicMock()
+
+    view_logs_local(tmp_path, voyage, ship_id="ship-0")
+    assert capsysbinary.readouterr().out == b"a\nbc\nerror d\nerror e\n"
+    view_logs_local(tmp_path, voyage, ship_id="ship-0", grep="^error", tail=1)
+    assert capsysbinary.readouterr().out == b"error e\n"
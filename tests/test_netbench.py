@@ -0,0 +1,61 @@
+"""Tests for the ship network benchmark."""
+
+import subprocess
+from unittest.mock import patch
+
+from ocaptain.netbench import NetResult, ShipTarget, flag_results, measure_ship, parse_ping
+
+
+def test_parse_ping_direct_and_relayed() -> None:
+    """The final pong decides the path; RTT is the median."""
+    direct = (
+        "pong from voyage-abc-ship0 (100.64.0.2) via DERP(nyc) in 90ms\n"
+        "pong from voyage-abc-ship0 (100.64.0.2) via 203.0.113.5:41641 in 20ms\n"
+        "pong from voyage-abc-ship0 (100.64.0.2) via 203.0.113.5:41641 in 22ms\n"
+    )
+    assert parse_ping(direct) == (22.0, "direct", "")
+    relayed = "pong from s (100.64.0.3) via DERP(fra) in 140ms\n" * 2
+    assert parse_ping(relayed) == (140.0, "relayed", "fra")
+    assert parse_ping("timeout waiting for ping reply\n") == (None, "unknown", "")
+
+
+def test_measure_ship_over_ssh() -> None:
+    """Throughput runs over port 2222 with the handshake subtracted."""
+    calls: list[list[str]] = []
+
+    def fake_run(cmd: list[str], stdin: bytes | None = None) -> subprocess.CompletedProcess[bytes]:
+        calls.append(cmd)
+        stdout = b""
+        if cmd[0].endswith("tailscale"):
+            stdout = b"pong from s (100.64.0.2) via 203.0.113.5:41641 in 12ms\n"
+        elif cmd[-1].startswith("head -c"):
+            stdout = bytes(1024 * 1024)
+        return subprocess.CompletedProcess(cmd, 0, stdout, b"")
+
+    with (
+        patch("ocaptain.netbench._run", side_effect=fake_run),
+        patch("ocaptain.tailscale.find_tailscale", return_value="/usr/bin/tailscale"),
+    ):
+        result = measure_ship(ShipTarget("ship-0", "100.64.0.2", "exedev"), size=1024 * 1024)
+
+    assert result.error is None
+    assert (result.rtt_ms, result.path) == (12.0, "direct")
+    assert result.upload_mb_s and result.download_mb_s
+    ssh = [c for c in calls if c[0] == "ssh"]
+    assert [c[-1] for c in ssh] == ["true", "cat > /dev/null", "head -c 1048576 /dev/zero"]
+    assert all(c[1:3] == ["-p", "2222"] and "exedev@100.64.0.2" in c for c in ssh)
+
+
+def test_flag_results() -> None:
+    """Unreachable, relayed and fleet-relative slow ships are flagged with an action."""
+    results = [
+        NetResult("ship-0", "a", 20, "direct", "", 50, 60),
+        NetResult("ship-1", "b", 25, "direct", "", 48, 55),
+        NetResult("ship-2", "c", 180, "relayed", "nyc", 40, 50),
+        NetResult("ship-3", "d", 22, "direct", "", 45, 12),
+        NetResult("ship-4", "e", error="ssh failed"),
+    ]
+    flag_results(results)
+    assert [r.action for r in results] == ["", "", "re-route", "replace", "replace"]
+    assert results[2].flags == ["relayed via DERP(nyc)", "RTT 180 ms"]
+    assert results[3].flags == ["download 12.0 MB/s vs fleet 52.5"]
@@ -0,0 +1,118 @@
+"""Tests for OTLP/HTTP request decoding."""
+
+import json
+import struct
+
+import pytest
+
+from ocaptain.otlp import decode_protobuf, decode_request
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte, value = value & 0x7F, value >> 7
+        out.append(byte | (0x80 if value else 0))
+        if not value:
+            return bytes(out)
+
+
+def _bytes(number: int, payload: bytes) -> bytes:
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+
+def _str(number: int, text: str) -> bytes:
+    return _bytes(number, text.encode())
+
+
+def _fixed64(number: int, value: int) -> bytes:
+    return _varint(number << 3 | 1) + struct.pack("<Q", value)
+
+
+def _double(number: int, value: float) -> bytes:
+    return _varint(number << 3 | 1) + struct.pack("<d", value)
+
+
+def _kv(key: str, value: bytes) -> bytes:
+    return _str(1, key) + _bytes(2, value)
+
+
+def logs_request(voyage: str, ship: str, ts: int, event: str, **attrs: str) -> bytes:
+    """An ExportLogsServiceRequest with one Claude Code style event."""
+    resource = b"".join(
+        _bytes(1, _kv(k, _str(1, v)))
+        for k, v in {"service.name": "claude-code", "voyage.id": voyage, "ship.id": ship}.items()
+    )
+    record = (
+        _fixed64(1, ts)
+        + _bytes(5, _str(1, f"claude_code.{event}"))
+        + _bytes(6, _kv("event.name", _str(1, event)))
+        + b"".join(_bytes(6, _kv(k, _str(1, v))) for k, v in attrs.items())
+        + _bytes(6, _kv("success", _varint(2 << 3) + _varint(1)))  # bool AnyValue
+        + _bytes(99, b"unknown field")
+    )
+    scope_logs = _bytes(1, _str(1, "com.anthropic.claude_code")) + _bytes(2, record)
+    return _bytes(1, _bytes(1, resource) + _bytes(2, scope_logs))
+
+
+def test_decode_protobuf_logs() -> None:
+    """Protobuf log exports become rows with string attribute maps."""
+    body = logs_request("voyage-a", "ship-3", 1_700_000_000 * 10**9, "api_request", model="m")
+    [row] = decode_request("logs", body, json_encoded=False)
+    assert row["Timestamp"] == 1_700_000_000 * 10**9
+    assert row["ServiceName"] == "claude-code"
+    assert row["Body"] == "claude_code.api_request"
+    assert row["ResourceAttributes"]["ship.id"] == "ship-3"
+    assert row["ScopeName"] == "com.anthropic.claude_code"
+    assert row["LogAttributes"] == {"event.name": "api_request", "model": "m", "success": "true"}
+
+
+def test_decode_protobuf_metrics() -> None:
+    """Sum data points carry their value, temporality and attributes."""
+    point = _fixed64(3, 5 * 10**9) + _double(4, 12.5) + _bytes(7, _kv("type", _str(1, "input")))
+    data_sum = _bytes(1, point) + _varint(2 << 3) + _varint(2) + _varint(3 << 3) + _varint(1)
+    metric = _str(1, "claude_code.token.usage") + _str(3, "tokens") + _bytes(7, data_sum)
+    body = _bytes(1, _bytes(2, _bytes(2, metric)))
+
+    [row] = decode_request("metrics", body, json_encoded=False)
+    assert (row["MetricName"], row["MetricType"], row["Value"]) == (
+        "claude_code.token.usage",
+        "sum",
+        12.5,
+    )
+    assert (row["IsMonotonic"], row["AggregationTemporality"]) == (True, 2)
+    assert row["Attributes"] == {"type": "input"}
+
+
+def test_decode_json_logs() -> None:
+    """OTLP JSON (string-encoded ints, enum names) decodes to the same rows."""
+    body = json.dumps(
+        {
+            "resourceLogs": [
+                {
+                    "resource": {"attributes": [{"key": "ship.id", "value": {"stringValue": "s"}}]},
+                    "scopeLogs": [
+                        {
+                            "logRecords": [
+                                {
+                                    "timeUnixNano": "1000",
+                                    "severityNumber": "SEVERITY_NUMBER_INFO",
+                                    "body": {"kvlistValue": {"values": []}},
+                                    "attributes": [{"key": "n", "value": {"intValue": "7"}}],
+                                }
+                            ]
+                        }
+                    ],
+                }
+            ]
+        }
+    ).encode()
+    [row] = decode_request("logs", body, json_encoded=True)
+    assert (row["Timestamp"], row["ServiceName"], row["Body"]) == (1000, "unknown", "{}")
+    assert row["LogAttributes"] == {"n": "7"}
+
+
+def test_decode_rejects_truncated_protobuf() -> None:
+    """A length prefix running past the end of the buffer is an error."""
+    with pytest.raises(ValueError):
+        decode_protobuf("ExportLogsServiceRequest", _bytes(1, b"\x0a\x05ab"))
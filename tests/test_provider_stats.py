@@ -0,0 +1,139 @@
+"""Tests for provider call instrumentation."""
+
+import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ocaptain import config, otlp, provider_stats, telemetry
+from ocaptain.config import OcaptainConfig
+from ocaptain.provider_stats import Histogram, Observation
+from ocaptain.providers.simulated import SimulatedProvider
+
+
+@pytest.fixture  # type: ignore[untyped-decorator]
+def collecting(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[list[dict[str, Any]]]:
+    """Collect into tmp_path and capture OTLP exports instead of sending them."""
+    exports: list[dict[str, Any]] = []
+    monkeypatch.setattr(provider_stats, "stats_path", lambda: tmp_path / "provider-stats.json")
+    monkeypatch.setattr(
+        provider_stats, "export_otlp", lambda request, port: exports.append(request)
+    )
+    monkeypatch.setattr(config, "get_config", lambda: OcaptainConfig())
+    monkeypatch.setattr(telemetry, "collector_running", lambda: True)
+    provider_stats.enable()
+    yield exports
+    provider_stats.reset()
+    provider_stats.flush()
+
+
+def test_histogram_quantiles_and_merge() -> None:
+    h = Histogram()
+    for seconds in (0.02, 0.03, 0.2, 0.4, 3.0):
+        h.observe(seconds, Observation())
+    h.observe(40.0, Observation(status="1", retries=2, bytes_sent=10))
+
+    assert (h.count, h.min, h.max, h.errors, h.retries) == (6, 0.02, 40.0, 1, 2)
+    # Estimates land inside the bucket holding the true value
+    assert 0.1 <= (h.quantile(0.5) or 0) <= 0.25
+    assert h.quantile(0.99) == pytest.approx(40.0, rel=0.1)
+    assert 0.02 <= (h.quantile(0.1) or 0) <= 0.05
+
+    other = Histogram()
+    other.observe(0.01, Observation(status="TimeoutError"))
+    h.merge(other)
+    assert (h.count, h.min, h.errors, h.bytes_sent) == (7, 0.01, 2, 10)
+
+
+def test_timed_records_exceptions_and_retries(collecting: list[dict[str, Any]]) -> None:
+    with pytest.raises(TimeoutError), provider_stats.timed("exedev", "wait_ready"):
+        provider_stats.retried()
+        provider_stats.retried()
+        raise TimeoutError
+
+    h = provider_stats.snapshot()[("exedev", "wait_ready")]
+    assert h.statuses == {"TimeoutError": 1}
+    assert h.retries == 2
+
+
+def test_registered_provider_and_connection_are_timed(
+    tmp_path: Path, collecting: list[dict[str, Any]]
+) -> None:
+    provider = SimulatedProvider({"root": str(tmp_path / "sim"), "time_scale": "0"})
+    vm = provider.create("voyage-abc-ship-0")
+    provider.list()
+    with provider.get_connection(vm) as c:
+        c.run("echo hello", hide=True)
+        c.run("exit 3", warn=True)
+        c.put(BytesIO(b"12345"), "~/file")
+
+    stats = provider_stats.snapshot()
+    assert stats[("simulated", "create")].count == 1
+    assert stats[("simulated", "wait_ready")].count == 1
+    assert stats[("simulated", "list")].count == 1
+    exec_stats = stats[("simulated", "exec")]
+    assert exec_stats.statuses == {"0": 1, "3": 1}
+    assert exec_stats.bytes_sent == len("echo hello") + len("exit 3")
+    assert exec_stats.bytes_received == len("hello\n")
+    assert stats[("simulated", "put")].bytes_sent == 5
+
+
+def test_flush_persists_and_exports(collecting: list[dict[str, Any]]) -> None:
+    for _ in range(2):
+        provider_stats.enable()
+        with provider_stats.timed("sprites", "cli list") as obs:
+            obs.status = "0"
+        provider_stats.flush()
+
+    assert provider_stats.load()[("sprites", "cli list")].count == 2
+    assert provider_stats.snapshot() == {}
+
+    # Each flush exports only its own observations, in a shape the receiver decodes
+    assert len(collecting) == 2
+    rows = otlp.decode_request("metrics", json.dumps(collecting[-1]).encode(), True)
+    duration = next(r for r in rows if r["MetricName"] == "ocaptain.provider.duration")
+    assert duration["Count"] == 1
+    assert duration["Attributes"] == {"provider": "sprites", "operation": "cli list"}
+    assert {r["MetricName"] for r in rows} >= {
+        "ocaptain.provider.retries",
+        "ocaptain.provider.errors",
+        "ocaptain.provider.payload",
+    }
+
+
+def test_no_export_without_running_collector(
+    collecting: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(telemetry, "collector_running", lambda: False)
+    with provider_stats.timed("exedev", "list"):
+        pass
+    provider_stats.flush()
+
+    assert collecting == []
+    assert provider_stats.load()[("exedev", "list")].count == 1
+
+
+def test_concurrent_persists_keep_every_observation(collecting: list[dict[str, Any]]) -> None:
+    """Commands flushing at once don't overwrite each other's merges."""
+    h = Histogram()
+    h.observe(0.1, Observation())
+
+    def persist_many(_: int) -> None:
+        for _ in range(10):
+            provider_stats.persist({("exedev", "list"): h})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(persist_many, range(4)))
+
+    assert provider_stats.load()[("exedev", "list")].count == 40
+
+
+def test_nothing_recorded_until_enabled(collecting: list[dict[str, Any]]) -> None:
+    provider_stats.flush()
+    with provider_stats.timed("exedev", "list"):
+        pass
+    assert provider_stats.snapshot() == {}
@@ -0,0 +1,88 @@
+"""Tests for the built-in OTLP/HTTP receiver."""
+
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from ocaptain.telemetry import build_metrics, scan_events
+from tests.test_otlp import logs_request
+
+pytest.importorskip("pyarrow")
+
+from ocaptain.otlp import decode_request  # noqa: E402
+from ocaptain.receiver import BatchWriter, OTLPReceiver, row_size  # noqa: E402
+
+T = 1_769_248_800 * 10**9  # 2026-01-24T10:00:00Z
+
+
+@pytest.fixture
+def receiver(tmp_path: Path) -> Iterator[OTLPReceiver]:
+    writer = BatchWriter(tmp_path, max_age=3600, memory_limit=8192)
+    server = OTLPReceiver(("127.0.0.1", 0), writer)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(server: OTLPReceiver, path: str, body: bytes) -> int:
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.server_address[1]}{path}",
+        data=body,
+        headers={"Content-Type": "application/x-protobuf"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return int(response.status)
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_receives_and_writes_parquet(receiver: OTLPReceiver, tmp_path: Path) -> None:
+    """Accepted exports are written in the layout metrics queries read."""
+    body = logs_request("voyage-a", "ship-0", T, "api_request", input_tokens="10")
+    assert _post(receiver, "/v1/logs", body) == 200
+    assert _post(receiver, "/v1/logs", b"\x0a\x05ab") == 400
+    assert _post(receiver, "/v1/traces", body) == 404
+
+    assert receiver.writer.flush(force=True) == 1
+    [path] = tmp_path.rglob("*.parquet")
+    assert path.relative_to(tmp_path).parts[:-1] == (
+        "logs",
+        "claude-code",
+        "year=2026",
+        "month=01",
+        "day=24",
+        "hour=10",
+    )
+    report = build_metrics(scan_events(tmp_path, "voyage-a"))
+    assert (report.total.requests, report.total.input_tokens) == (1, 10)
+
+
+def test_backpressure_when_memory_limit_reached(receiver: OTLPReceiver) -> None:
+    """Past the memory limit exports get 429 until buffered rows are written."""
+    body = logs_request("voyage-a", "ship-0", T, "tool_result", padding="x" * 1500)
+    statuses = [_post(receiver, "/v1/logs", body) for _ in range(4)]
+    assert statuses[:2] == [200, 200]
+    assert statuses[-1] == 429
+
+    receiver.writer.flush(force=True)
+    assert _post(receiver, "/v1/logs", body) == 200
+
+
+def test_memory_limit_counts_decoded_rows(tmp_path: Path) -> None:
+    """Rows are charged their in-memory size, which dwarfs the wire bytes."""
+    body = logs_request("voyage-a", "ship-0", T, "api_request", input_tokens="10")
+    rows = decode_request("logs", body, False)
+    assert row_size(rows[0]) > 4 * len(body)
+
+    writer = BatchWriter(tmp_path, max_age=3600, memory_limit=row_size(rows[0]) * 2)
+    assert writer.add("logs", rows)
+    assert writer.add("logs", rows)
+    assert not writer.add("logs", rows)
+    assert writer.saturated()
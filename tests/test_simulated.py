@@ -0,0 +1,92 @@
+"""Tests for the simulated VM provider."""
+
+import random
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from ocaptain.provider import VMStatus, get_connection
+from ocaptain.providers import simulated
+from ocaptain.providers.simulated import Latency, SimulatedProvider
+
+
+def _provider(tmp_path: Path, **settings: str) -> SimulatedProvider:
+    simulated.reset_stats()
+    return SimulatedProvider({"root": str(tmp_path), "time_scale": "0", "seed": "1", **settings})
+
+
+def test_latency_parse() -> None:
+    assert Latency.parse("2.5") == Latency("fixed", (2.5,))
+    assert Latency.parse("uniform:1,3") == Latency("uniform", (1.0, 3.0))
+    assert Latency.parse("lognormal:20,0.3") == Latency("lognormal", (20.0, 0.3))
+    with pytest.raises(ValueError):
+        Latency.parse("uniform:1")
+    with pytest.raises(ValueError):
+        Latency.parse("pareto:1,2")
+
+
+def test_latency_sample_bounds() -> None:
+    rng = random.Random(0)  # nosec: B311
+    assert Latency.parse("fixed:2").sample(rng) == 2.0
+    assert all(1 <= Latency.parse("uniform:1,3").sample(rng) <= 3 for _ in range(100))
+    # Negative draws from a normal are clamped to zero
+    assert all(Latency.parse("normal:0,5").sample(rng) >= 0 for _ in range(100))
+    assert Latency.parse("lognormal:0,1").sample(rng) == 0.0
+
+
+def test_create_list_get_destroy(tmp_path: Path) -> None:
+    provider = _provider(tmp_path)
+    vm = provider.create("voyage-abc-ship-0")
+    provider.create("voyage-xyz-ship-0")
+
+    assert vm.status == VMStatus.RUNNING
+    assert vm.ssh_dest == "sim://voyage-abc-ship-0"
+    assert provider.get(vm.id) == vm
+    assert [v.name for v in provider.list(prefix="voyage-abc")] == ["voyage-abc-ship-0"]
+    assert len(provider.list()) == 2
+
+    provider.destroy(vm.id)
+    assert provider.get(vm.id) is None
+    with pytest.raises(RuntimeError, match="not found"):
+        provider.destroy(vm.id)
+
+
+def test_connection_runs_in_vm_home(tmp_path: Path) -> None:
+    provider = _provider(tmp_path)
+    vm = provider.create("voyage-abc-ship-0")
+
+    with get_connection(vm, provider) as c:
+        assert c.run("pwd", hide=True).stdout.strip().endswith("home")
+        assert c.run("tailscale ip -4", hide=True).stdout.strip().startswith("100.")
+        assert c.run("sudo systemctl restart sshd", hide=True).ok
+        assert c.run("exit 3", warn=True).return_code == 3
+        with pytest.raises(RuntimeError, match="Command failed"):
+            c.run("exit 3")
+
+        c.put(BytesIO(b"hello"), "~/.ocaptain/file.txt")
+        assert c.run("cat .ocaptain/file.txt", hide=True).stdout == "hello"
+        with pytest.raises(ValueError, match="outside"):
+            c.put(BytesIO(b"x"), "/etc/passwd")
+
+
+def test_failure_injection(tmp_path: Path) -> None:
+    provider = _provider(tmp_path, create_failure_rate="1")
+    with pytest.raises(RuntimeError, match="Simulated create failure"):
+        provider.create("voyage-abc-ship-0")
+    assert provider.list() == []
+    assert simulated.stats()["create"]["failures"] == 1
+
+
+def test_stats_track_peak_concurrency(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    provider = _provider(tmp_path, create_latency="fixed:0.2", time_scale="1")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        vms = list(pool.map(provider.create, [f"voyage-abc-ship-{i}" for i in range(4)]))
+
+    create = simulated.stats()["create"]
+    assert len(vms) == 4
+    assert create["calls"] == 4
+    assert create["peak"] == 4
+    assert create["seconds"] == pytest.approx(0.8)
@@ -0,0 +1,111 @@
+"""Tests for the cached Tailscale status."""
+
+from pathlib import Path
+
+import pytest
+
+from ocaptain import tailscale
+
+STATUS = {
+    "BackendState": "Running",
+    "Self": {
+        "HostName": "laptop",
+        "TailscaleIPs": ["fd7a:115c::1", "100.64.0.1"],
+        "Online": True,
+        "Tags": ["tag:dev"],
+    },
+    "Peer": {
+        "nodekey:a": {
+            "HostName": "voyage-abc-ship-0",
+            "TailscaleIPs": ["100.64.0.2"],
+            "Online": True,
+            "CurAddr": "203.0.113.5:41641",
+            "Relay": "nyc",
+        },
+        "nodekey:b": {"HostName": "voyage-abc-ship-1", "TailscaleIPs": ["100.64.0.3"]},
+    },
+}
+
+
+class FakeTailscale:
+    """Stands in for `tailscale status --json`, counting calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+
+    def query(self) -> tailscale.TailscaleStatus | None:
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            return None
+        return tailscale.parse_status(STATUS)
+
+
+@pytest.fixture  # type: ignore[untyped-decorator]
+def fake(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeTailscale:
+    """Point the cache at tmp_path and replace the tailscale query."""
+    fake = FakeTailscale()
+    monkeypatch.setattr(tailscale, "cache_path", lambda: tmp_path / "tailscale.json")
+    monkeypatch.setattr(tailscale, "_query", fake.query)
+    return fake
+
+
+def test_parse_status() -> None:
+    """Self IPv4, online state, tags and peers (direct or relayed) are extracted."""
+    status = tailscale.parse_status(STATUS)
+    assert (status.ip, status.online, status.tags) == ("100.64.0.1", True, ["tag:dev"])
+    ship0, ship1 = status.peers["voyage-abc-ship-0"], status.peers["voyage-abc-ship-1"]
+    assert (ship0.ip, ship0.online, ship0.direct) == ("100.64.0.2", True, True)
+    assert (ship1.ip, ship1.online, ship1.direct) == ("100.64.0.3", False, False)
+    assert not tailscale.parse_status({**STATUS, "BackendState": "Stopped"}).online
+
+
+def test_parse_status_prefers_online_duplicate() -> None:
+    """A recreated ship's online node wins over its stale offline namesake."""
+    old = {"HostName": "voyage-abc-ship-0", "TailscaleIPs": ["100.64.0.9"], "Online": False}
+    for order in ((STATUS["Peer"]["nodekey:a"], old), (old, STATUS["Peer"]["nodekey:a"])):
+        status = tailscale.parse_status({"Peer": {str(i): node for i, node in enumerate(order)}})
+        assert status.peers["voyage-abc-ship-0"].ip == "100.64.0.2"
+
+
+def test_status_is_cached(fake: FakeTailscale) -> None:
+    """A fresh cache answers without querying; refresh and max_age force a query."""
+    first = tailscale.status()
+    cached = tailscale.status()
+    assert first is not None and cached is not None
+    assert cached.ip == "100.64.0.1"
+    assert cached.peers["voyage-abc-ship-0"].relay == "nyc"
+    assert fake.calls == 1
+    tailscale.status(refresh=True)
+    tailscale.status(max_age=0)
+    assert fake.calls == 3
+
+
+def test_failure_invalidates_cache(fake: FakeTailscale, tmp_path: Path) -> None:
+    """A failed query drops the cache so the next call asks again."""
+    tailscale.status()
+    fake.failures = 1
+    assert tailscale.status(refresh=True) is None
+    assert not (tmp_path / "tailscale.json").exists()
+    assert tailscale.status() is not None
+    assert fake.calls == 3
+
+
+def test_peer_ip_refreshes_on_miss(fake: FakeTailscale) -> None:
+    """An unknown or offline peer triggers one re-query before giving up."""
+    assert tailscale.peer_ip("voyage-abc-ship-0") == "100.64.0.2"
+    assert tailscale.peer_ip("voyage-abc-ship-9") is None
+    assert fake.calls == 2
+    assert tailscale.peer_ip("voyage-abc-ship-1") is None
+    assert fake.calls == 3
+
+
+def test_find_tailscale_off_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without tailscale on PATH, the CLI symlink location is found; doctor agrees."""
+    from ocaptain import doctor
+
+    monkeypatch.setattr(tailscale.shutil, "which", lambda _: None)
+    monkeypatch.setattr(Path, "exists", lambda p: str(p) == "/usr/local/bin/tailscale")
+    assert tailscale.find_tailscale() == "/usr/local/bin/tailscale"
+    assert doctor.find_tool("tailscale") == "/usr/local/bin/tailscale"
@@ -1,8 +1,10 @@
 """Unit tests for task parsing and status derivation."""
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 from ocaptain.tasks import (
     ShipState,
@@ -52,8 +54,41 @@ def test_task_from_json_missing_timestamps() -> None:
     """Test parsing task without created/updated fields."""
     data = {"id": "task-001", "title": "No timestamps", "status": "pending"}
     task = Task.from_json(data)
-    assert task.created is not None
-    assert task.updated is not None
+    assert task.created is None
+    assert task.updated is None
+
+
+def test_task_timestamps_parsed_lazily() -> None:
+    """Timestamps stay raw strings until first accessed."""
+    data = {
+        "id": "1",
+        "title": "t",
+        "status": "in_progress",
+        "metadata": {"claimed_at": "2026-01-24T10:00:00"},
+    }
+    task = Task.from_json(data)
+    assert task._claimed_at == "2026-01-24T10:00:00"
+    assert task.claimed_at == datetime(2026, 1, 24, 10, 0, tzinfo=UTC)
+    assert task._claimed_at is task.claimed_at
+
+
+def test_task_from_json_shares_strings() -> None:
+    """Loaded tasks share status members and interned ship IDs."""
+    records = [
+        {"id": str(i), "title": "t", "status": "in_progress", "owner": f"ship-{i // 10}"}
+        for i in range(3)
+    ]
+    tasks = [Task.from_json(data) for data in records]
+    assert [t.id for t in tasks] == ["0", "1", "2"]
+    assert all(t.status is TaskStatus.IN_PROGRESS for t in tasks)
+    assert tasks[0].assignee is tasks[2].assignee
+    assert not hasattr(tasks[0], "__dict__")
+
+
+def test_task_from_json_invalid_status() -> None:
+    """Unknown statuses are rejected with ValueError."""
+    with pytest.raises(ValueError):
+        Task.from_json({"id": "1", "title": "t", "status": "done"})
 
 
 def test_task_from_json_owner_field_precedence() -> None:
@@ -338,3 +373,307 @@ def test_voyage_state_stalled_all_stale() -> None:
         tasks_total=3,
     )
     assert status.state == VoyageState.STALLED
+
+
+def test_ready_tasks_requires_completed_blockers() -> None:
+    """Only pending tasks with all blockers completed (or gone) are ready."""
+    from ocaptain.tasks import ready_tasks
+
+    tasks = [
+        Task.from_json({"id": "1", "title": "a", "status": "completed"}),
+        Task.from_json({"id": "2", "title": "b", "status": "in_progress"}),
+        Task.from_json({"id": "3", "title": "c", "status": "pending", "blockedBy": ["1"]}),
+        Task.from_json({"id": "4", "title": "d", "status": "pending", "blockedBy": ["2"]}),
+        Task.from_json({"id": "5", "title": "e", "status": "pending", "blockedBy": ["gone"]}),
+    ]
+
+    assert [t.id for t in ready_tasks(tasks)] == ["3", "5"]
+
+
+def _write_task_file(task_dir: Path, data: dict[str, object]) -> Path:
+    import json
+
+    path = task_dir / f"{data['id']}.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+def test_task_cache_refresh_is_incremental(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Only files whose mtime or size changed are re-parsed."""
+    import os
+
+    from ocaptain.tasks import TaskCache
+    from ocaptain.voyage import Voyage
+
+    voyage = Voyage.create("Test", "owner/repo", 2)
+    task_dir = tmp_path / ".claude" / "tasks" / voyage.task_list_id
+    task_dir.mkdir(parents=True)
+    for i in range(3):
+        _write_task_file(task_dir, {"id": str(i), "title": "t", "status": "pending"})
+
+    cache = TaskCache(tmp_path, voyage)
+    assert cache.refresh()
+    assert cache.status().tasks_pending == 3
+
+    parse = mocker.spy(Task, "from_json")
+    assert not cache.refresh()
+    assert parse.call_count == 0
+
+    path = _write_task_file(
+        task_dir, {"id": "1", "title": "t", "status": "in_progress", "owner": "ship-0"}
+    )
+    os.utime(path, ns=(1, 1))
+    (task_dir / "2.json").unlink()
+
+    assert cache.refresh()
+    assert parse.call_count == 1
+    status = cache.status()
+    assert (status.tasks_pending, status.tasks_in_progress, status.tasks_total) == (1, 1, 2)
+    assert [(s.id, s.state, s.current_task) for s in status.ships] == [
+        ("ship-0", ShipState.WORKING, "1")
+    ]
+
+
+def test_task_cache_persists_between_instances(tmp_path: Path, mocker: MockerFixture) -> None:
+    """A saved cache lets a new instance skip reading unchanged files."""
+    from ocaptain.tasks import TaskCache
+    from ocaptain.voyage import Voyage
+
+    voyage = Voyage.create("Test", "owner/repo", 1)
+    task_dir = tmp_path / ".claude" / "tasks" / voyage.task_list_id
+    task_dir.mkdir(parents=True)
+    _write_task_file(task_dir, {"id": "1", "title": "t", "status": "completed", "owner": "ship-0"})
+
+    first = TaskCache(tmp_path, voyage)
+    first.refresh()
+    first.save()
+
+    read = mocker.spy(Path, "read_text")
+    second = TaskCache(tmp_path, voyage)
+    assert not second.refresh()
+    assert all(call.args[0].name != "1.json" for call in read.call_args_list)
+    status = second.status()
+    assert status.state == VoyageState.COMPLETE
+    assert [(s.id, s.state, s.completed_count) for s in status.ships] == [
+        ("ship-0", ShipState.IDLE, 1)
+    ]
+
+
+def test_task_cache_stores_task_fields_not_raw_json(tmp_path: Path) -> None:
+    """The persisted cache rebuilds equal tasks from their fields alone."""
+    from ocaptain.tasks import TASK_CACHE_FILE, TaskCache
+    from ocaptain.voyage import Voyage
+
+    voyage = Voyage.create("Test", "owner/repo", 1)
+    task_dir = tmp_path / ".claude" / "tasks" / voyage.task_list_id
+    task_dir.mkdir(parents=True)
+    data = {
+        "id": "1",
+        "subject": "t",
+        "status": "in_progress",
+        "owner": "ship-0",
+        "blockedBy": ["2"],
+        "created": "2026-01-24T10:00:00+00:00",
+        "metadata": {"claimed_at": "2026-01-24T11:00:00+00:00", "notes": "x" * 1000},
+    }
+    _write_task_file(task_dir, data)
+
+    first = TaskCache(tmp_path, voyage)
+    first.refresh()
+    assert first.tasks()[0].created is not None  # parsed timestamps persist too
+    first.save()
+
+    saved = (tmp_path / TASK_CACHE_FILE).read_text()
+    assert "notes" not in saved
+    assert [p.name for p in tmp_path.iterdir() if p.is_file()] == [TASK_CACHE_FILE]
+    assert TaskCache(tmp_path, voyage).tasks() == [Task.from_json(data)]
+
+
+def test_derive_status_local_matches_task_states(tmp_path: Path) -> None:
+    """derive_status_local reports counts, stale claims and ship states."""
+    from ocaptain.tasks import derive_status_local
+    from ocaptain.voyage import Voyage
+
+    voyage = Voyage.create("Test", "owner/repo", 2)
+    task_dir = tmp_path / ".claude" / "tasks" / voyage.task_list_id
+    task_dir.mkdir(parents=True)
+    old = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
+    _write_task_file(task_dir, {"id": "1", "title": "t", "status": "completed", "owner": "ship-0"})
+    _write_task_file(
+        task_dir,
+        {
+            "id": "2",
+            "title": "t",
+            "status": "in_progress",
+            "owner": "ship-1",
+            "metadata": {"claimed_at": old},
+        },
+    )
+    _write_task_file(task_dir, {"id": "3", "title": "t", "status": "pending"})
+
+    status = derive_status_local(voyage, tmp_path)
+
+    assert status.state == VoyageState.STALLED
+    assert (status.tasks_complete, status.tasks_in_progress, status.tasks_pending) == (1, 1, 1)
+    assert status.tasks_stale == 1
+    assert [(s.id, s.state) for s in status.ships] == [
+        ("ship-0", ShipState.IDLE),
+        ("ship-1", ShipState.STALE),
+    ]
+
+
+def test_derive_status_local_survives_malformed_timestamp(tmp_path: Path) -> None:
+    """A garbage timestamp reads as missing instead of failing the whole voyage."""
+    from ocaptain.tasks import derive_status_local
+    from ocaptain.voyage import Voyage
+
+    voyage = Voyage.create("Test", "owner/repo", 2)
+    task_dir = tmp_path / ".claude" / "tasks" / voyage.task_list_id
+    task_dir.mkdir(parents=True)
+    _write_task_file(
+        task_dir,
+        {
+            "id": "1",
+            "title": "t",
+            "status": "in_progress",
+            "owner": "ship-0",
+            "metadata": {"claimed_at": "garbage"},
+        },
+    )
+    _write_task_file(task_dir, {"id": "2", "title": "t", "status": "pending"})
+
+    status = derive_status_local(voyage, tmp_path)
+
+    assert (status.tasks_in_progress, status.tasks_pending, status.tasks_stale) == (1, 1, 0)
+    assert [(s.id, s.state, s.claimed_at) for s in status.ships] == [
+        ("ship-0", ShipState.WORKING, None)
+    ]
+
+
+def test_status_aggregator_streams_and_reverses() -> None:
+    """Aggregating a generator matches incremental add/remove updates."""
+    from ocaptain.tasks import StatusAggregator
+    from ocaptain.voyage import Voyage
+
+    voyage = Voyage.create("Test", "owner/repo", 2)
+    now = datetime(2026, 1, 24, 12, 0, tzinfo=UTC)
+    old = (now - timedelta(hours=1)).isoformat()
+    tasks = [
+        Task.from_json({"id": "1", "title": "t", "status": "completed", "owner": "ship-0"}),
+        Task.from_json(
+            {
+                "id": "2",
+                "title": "t",
+                "status": "in_progress",
+                "owner": "ship-0",
+                "metadata": {"claimed_at": old},
+            }
+        ),
+        Task.from_json({"id": "3", "title": "t", "status": "pending"}),
+    ]
+
+    streamed = StatusAggregator.from_tasks(t for t in tasks).status(voyage, 30, now)
+    assert streamed.state == VoyageState.STALLED
+    assert streamed.tasks_stale == 1
+    assert [(s.id, s.state, s.current_task) for s in streamed.ships] == [
+        ("ship-0", ShipState.STALE, "2")
+    ]
+
+    aggregator = StatusAggregator.from_tasks(tasks)
+    aggregator.remove(tasks[1])
+    after = aggregator.status(voyage, 30, now)
+    assert (after.tasks_in_progress, after.tasks_total) == (0, 2)
+    assert [(s.id, s.state) for s in after.ships] == [("ship-0", ShipState.IDLE)]
+
+
+def test_progress_tracker_rates() -> None:
+    """ProgressTracker reports overall and per-ship completions per hour."""
+    from ocaptain.tasks import ProgressTracker
+    from ocaptain.voyage import Voyage
+
+    voyage = Voyage.create("Test", "owner/repo", 2)
+
+    def snapshot(ship0: int, ship1: int) -> VoyageStatus:
+        return VoyageStatus(
+            voyage=voyage,
+            state=VoyageState.RUNNING,
+            ships=(
+                ShipStatus("ship-0", ShipState.IDLE, None, None, ship0),
+                ShipStatus("ship-1", ShipState.IDLE, None, None, ship1),
+            ),
+            tasks_complete=ship0 + ship1,
+            tasks_in_progress=0,
+            tasks_pending=10,
+            tasks_stale=0,
+            tasks_total=10 + ship0 + ship1,
+        )
+
+    tracker = ProgressTracker(window_seconds=3600)
+    tracker.record(snapshot(0, 0), at=0)
+    assert tracker.rate() is None
+
+    tracker.record(snapshot(2, 1), at=1800)
+    assert tracker.rate() == 6
+    assert tracker.rate("ship-0") == 4
+    assert tracker.rate("ship-9") == 0
+
+
+def test_parse_task_ndjson_isolates_bad_files() -> None:
+    """A malformed task file is reported on its own; the rest still parse."""
+    import json
+
+    from ocaptain.tasks import parse_task_ndjson
+
+    good = json.dumps({"id": "1", "title": "t", "status": "pending"})
+    output = "\n".join(
+        [
+            json.dumps({"file": "1.json", "mtime": 10.0, "body": good}),
+            json.dumps({"file": "2.json", "mtime": 20.0, "body": "{not json"}),
+            json.dumps({"file": "3.json", "error": "Permission denied"}),
+            json.dumps({"file": "4.json", "mtime": 5.0, "body": good.replace('"1"', '"4"')}),
+            json.dumps({"files": ["1.json", "2.json", "3.json", "4.json"], "marker": True}),
+        ]
+    )
+
+    fetch = parse_task_ndjson(output)
+
+    assert sorted(fetch.tasks) == ["1.json", "4.json"]
+    assert sorted(fetch.errors) == ["2.json", "3.json"]
+    assert fetch.files == ["1.json", "2.json", "3.json", "4.json"]
+    assert fetch.cursor == 20.0
+    assert fetch.has_marker
+    assert not fetch.has_progress
+
+
+def test_remote_fetch_script_respects_cursor(tmp_path: Path) -> None:
+    """The remote script emits only files newer than the cursor, plus a trailer."""
+    import json
+    import os
+    import subprocess
+    import sys
+
+    from ocaptain.tasks import _REMOTE_FETCH_SCRIPT, parse_task_ndjson
+
+    task_dir = tmp_path / "tasks"
+    task_dir.mkdir()
+    for i, mtime in ((1, 100), (2, 200)):
+        path = task_dir / f"{i}.json"
+        path.write_text(json.dumps({"id": str(i), "title": "t", "status": "pending"}))
+        os.utime(path, (mtime, mtime))
+
+    def run(since: float) -> str:
+        return subprocess.run(
+            [sys.executable, "-c", _REMOTE_FETCH_SCRIPT, str(task_dir), str(since)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "HOME": str(tmp_path)},
+        ).stdout
+
+    full = parse_task_ndjson(run(0.0))
+    assert sorted(full.tasks) == ["1.json", "2.json"]
+    assert full.cursor == 200
+
+    incremental = parse_task_ndjson(run(150.0), since=150.0)
+    assert list(incremental.tasks) == ["2.json"]
+    assert incremental.files == ["1.json", "2.json"]
@@ -0,0 +1,189 @@
+"""Tests for telemetry queries over otlp2parquet output."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ocaptain.telemetry import (
+    attributes,
+    build_metrics,
+    compact,
+    load_manifest,
+    partition_name,
+    scan_events,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+T0 = datetime(2026, 1, 24, 10, 0, tzinfo=UTC)
+
+
+def _write_logs(path: Path, rows: list[dict[str, Any]], row_group_size: int = 2) -> None:
+    """Write rows shaped like otlp2parquet's log tables."""
+    attrs_type = pa.map_(pa.string(), pa.string())
+    table = pa.table(
+        {
+            "Timestamp": pa.array([r["ts"] for r in rows], pa.timestamp("ns", tz="UTC")),
+            "Body": [r.get("body", "claude_code." + r["event"]) for r in rows],
+            "ResourceAttributes": pa.array([list(r["resource"].items()) for r in rows], attrs_type),
+            "LogAttributes": pa.array(
+                [[("event.name", r["event"]), *r["attrs"].items()] for r in rows], attrs_type
+            ),
+        }
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path, row_group_size=row_group_size)
+
+
+def _event(minute: int, voyage: str, ship: str, event: str, **attrs: str) -> dict[str, Any]:
+    return {
+        "ts": T0.replace(minute=minute),
+        "resource": {"service.name": "claude-code", "voyage.id": voyage, "ship.id": ship},
+        "event": event,
+        "attrs": attrs,
+    }
+
+
+def test_attributes_normalizes_encodings() -> None:
+    """Maps, OTLP key/value lists and JSON all become plain dicts."""
+    assert attributes([("a", "1")]) == {"a": "1"}
+    assert attributes('[{"key": "a", "value": {"stringValue": "1"}}]') == {"a": "1"}
+    assert attributes('{"a": 1}') == {"a": 1}
+    assert attributes(None) == {}
+
+
+def test_partition_name() -> None:
+    """Names keep dots (as compacted manifests already do) but can't climb out."""
+    assert partition_name("voyage-abc.v2") == "voyage-abc.v2"
+    assert partition_name("my service/x") == "my_service_x"
+    assert (partition_name(".."), partition_name(None)) == ("__", "_unknown")
+
+
+def test_scan_filters_voyage_ship_and_time(tmp_path: Path) -> None:
+    """Only the voyage's events in range are returned, with their ship."""
+    hour = tmp_path / "logs" / "claude-code" / "year=2026" / "month=01" / "day=24" / "hour=10"
+    _write_logs(
+        hour / "a.parquet",
+        [
+            _event(1, "voyage-a", "ship-0", "api_request"),
+            _event(2, "voyage-b", "ship-0", "api_request"),
+            _event(3, "voyage-a", "ship-1", "tool_result"),
+            _event(40, "voyage-a", "ship-0", "tool_result"),
+        ],
+    )
+    # An earlier hour partition is pruned without being opened
+    old = tmp_path / "logs" / "claude-code" / "year=2026" / "month=01" / "day=24" / "hour=08"
+    old.mkdir(parents=True)
+    (old / "broken.parquet").write_bytes(b"not parquet")
+
+    since = T0.timestamp()
+    events = list(scan_events(tmp_path, "voyage-a", since=since))
+    assert [(e.ship, e.name) for e in events] == [
+        ("ship-0", "api_request"),
+        ("ship-1", "tool_result"),
+        ("ship-0", "tool_result"),
+    ]
+    until = T0.replace(minute=30).timestamp()
+    events = list(scan_events(tmp_path, "voyage-a", ship_id="ship-0", until=until))
+    assert [e.ts for e in events] == [T0.replace(minute=1).timestamp()]
+
+
+def test_build_metrics(tmp_path: Path) -> None:
+    """Tokens, cost, latency and tool calls are summed per ship and bucket."""
+    _write_logs(
+        tmp_path / "logs.parquet",
+        [
+            _event(
+                1,
+                "v",
+                "ship-0",
+                "api_request",
+                input_tokens="100",
+                output_tokens="20",
+                cache_read_tokens="5",
+                cost_usd="0.25",
+                duration_ms="1000",
+            ),
+            _event(2, "v", "ship-0", "tool_result", tool_name="Bash", success="true"),
+            _event(3, "v", "ship-1", "tool_result", tool_name="Edit", success="false"),
+            _event(
+                20,
+                "v",
+                "ship-1",
+                "api_request",
+                input_tokens="10",
+                cost_usd="0.5",
+                duration_ms="3000",
+            ),
+            _event(21, "v", "ship-1", "user_prompt"),
+        ],
+    )
+    report = build_metrics(scan_events(tmp_path, "v"), bucket_seconds=900)
+
+    ship0, ship1 = report.ships
+    assert (ship0.ship, ship0.requests, ship0.tokens, ship0.cost_usd) == ("ship-0", 1, 125, 0.25)
+    assert (ship1.tool_calls, ship1.tool_failures, ship1.tools["Edit"]) == (1, 1, 1)
+    assert report.total.requests == 2
+    assert report.total.cost_usd == pytest.approx(0.75)
+    assert (report.total.latency_p50, report.total.latency_p95) == (1000, 3000)
+    assert [(b.requests, b.tokens, b.tool_calls) for b in report.buckets] == [
+        (1, 125, 2),
+        (1, 10, 0),
+    ]
+
+
+def test_compact_partitions_and_prunes(tmp_path: Path) -> None:
+    """Raw files merge into voyage/ship/date partitions that queries prune by manifest."""
+    raw = tmp_path / "logs" / "claude-code" / "year=2026" / "month=01" / "day=24" / "hour=10"
+    _write_logs(
+        raw / "a.parquet",
+        [_event(5, "v1", "ship-0", "api_request"), _event(1, "v2", "ship-0", "api_request")],
+    )
+    _write_logs(raw / "b.parquet", [_event(2, "v1", "ship-0", "tool_result")])
+    before = [(e.ts, e.name) for e in scan_events(tmp_path, "v1")]
+
+    result = compact(tmp_path, min_age=0)
+    assert (result.files, result.rows, result.partitions) == (2, 3, 2)
+    assert list(raw.glob("*.parquet")) == []
+
+    manifest = load_manifest(tmp_path)
+    assert [(p["voyage"], p["ship"], p["date"], p["rows"]) for p in manifest["partitions"]] == [
+        ("v1", "ship-0", "2026-01-24", 2),
+        ("v2", "ship-0", "2026-01-24", 1),
+    ]
+    assert sorted((e.ts, e.name) for e in scan_events(tmp_path, "v1")) == sorted(before)
+
+    # New rows are merged into the existing partition, sorted by time
+    _write_logs(raw / "c.parquet", [_event(0, "v1", "ship-0", "api_request")])
+    assert compact(tmp_path, min_age=0).partitions == 1
+    events = list(scan_events(tmp_path, "v1"))
+    assert [e.ts for e in events] == sorted(e.ts for e in events)
+    assert len(events) == 3
+
+
+def test_compact_finishes_interrupted_batch(tmp_path: Path) -> None:
+    """A batch saved in the manifest but not committed is finished, not redone."""
+    raw = tmp_path / "raw.parquet"
+    _write_logs(raw, [_event(1, "v", "ship-0", "api_request")])
+    compact(tmp_path, min_age=0)
+    partition = load_manifest(tmp_path)["partitions"][0]["file"]
+    live = tmp_path / "compacted" / partition
+
+    # Simulate a crash after saving the next batch: new file beside the live
+    # one, its raw source not yet deleted
+    _write_logs(raw, [_event(2, "v", "ship-0", "api_request")])
+    _write_logs(
+        live.with_name("data.parquet.tmp"),
+        [_event(1, "v", "ship-0", "api_request"), _event(2, "v", "ship-0", "api_request")],
+    )
+    manifest = load_manifest(tmp_path)
+    manifest.update(pending=[partition], sources=["raw.parquet"])
+    (tmp_path / "compacted" / "manifest.json").write_text(json.dumps(manifest))
+
+    assert compact(tmp_path, min_age=0).files == 0
+    assert not raw.exists()
+    assert len(list(scan_events(tmp_path, "v"))) == 2
@@ -1,11 +1,17 @@
 """Integration tests for voyage module with mocked provider."""
 
 from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING
 
 import pytest
 
 from ocaptain.voyage import Voyage
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from ocaptain.tasks import Task
+
 
 def test_voyage_create() -> None:
     """Test creating a new voyage."""
@@ -50,3 +56,71 @@ def test_voyage_is_immutable() -> None:
 
     with pytest.raises(FrozenInstanceError):
         voyage.prompt = "Modified"
+
+
+def _task(task_id: str, status: str, blocked_by: list[str] | None = None) -> "Task":
+    from ocaptain.tasks import Task
+
+    return Task.from_json(
+        {"id": task_id, "title": task_id, "status": status, "blockedBy": blocked_by or []}
+    )
+
+
+def test_autoscale_target_counts_ready_and_active_tasks() -> None:
+    """Fleet target is ready pending tasks plus in-progress claims, clamped."""
+    from ocaptain.voyage import autoscale_target
+
+    tasks = [
+        _task("1", "completed"),
+        _task("2", "in_progress"),
+        _task("3", "pending", ["1"]),
+        _task("4", "pending"),
+        _task("5", "pending", ["2"]),
+    ]
+
+    assert autoscale_target(tasks, min_ships=1, max_ships=10) == 3
+    assert autoscale_target(tasks, min_ships=1, max_ships=2) == 2
+    assert autoscale_target([], min_ships=1, max_ships=10) == 1
+
+
+def test_pick_ships_to_drain_prefers_idle_then_highest_index() -> None:
+    """Idle ships are drained before busy ones, newest first."""
+    from ocaptain.provider import VM, VMStatus
+    from ocaptain.voyage import _pick_ships_to_drain
+
+    vms = [
+        VM(id=f"v-ship{i}", name=f"v-ship{i}", ssh_dest="x", status=VMStatus.RUNNING)
+        for i in range(4)
+    ]
+
+    picked = _pick_ships_to_drain(vms, busy={"ship-3", "ship-1"}, count=3)
+    assert [vm.name for vm in picked] == ["v-ship2", "v-ship0", "v-ship3"]
+
+
+def test_drainer_removes_ships_once_idle_or_out_of_time(mocker: "MockerFixture") -> None:
+    """Drains return at once; polls remove idle ships, and busy ones after the timeout."""
+    from ocaptain.provider import VM, VMStatus
+    from ocaptain.voyage import Drainer
+
+    vms = [
+        VM(id=f"v-ship{i}", name=f"v-ship{i}", ssh_dest="x", status=VMStatus.RUNNING)
+        for i in range(3)
+    ]
+    mocker.patch("ocaptain.voyage._request_drain")
+    remove = mocker.patch("ocaptain.voyage._remove_ship")
+    busy = mocker.patch("ocaptain.voyage._busy_ships", return_value={"ship-1", "ship-2"})
+    clock = mocker.patch("time.monotonic", return_value=1000.0)
+    voyage = Voyage.create("Test", "owner/repo", 3)
+    drainer = Drainer(voyage, mocker.MagicMock(), mocker.MagicMock(), timeout=60)
+
+    drainer.request(vms[1:])
+    assert [vm.name for vm in drainer.active(vms)] == ["v-ship0"]
+    assert drainer.poll() == []
+
+    busy.return_value = {"ship-2"}
+    assert drainer.poll() == ["ship-1"]
+
+    clock.return_value = 1061.0
+    assert drainer.poll() == ["ship-2"]
+    assert remove.call_count == 2
+    assert drainer.draining == {}
@@ -0,0 +1,214 @@
+"""Tests for voyage supervision."""
+
+import json
+import os
+import shutil
+import subprocess
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from ocaptain.provider import VM, VMStatus
+from ocaptain.tasks import Task
+from ocaptain.templates import log_rotate
+from ocaptain.voyage import Voyage
+from ocaptain.watch import (
+    ShipWatchdog,
+    _session_check_command,
+    parse_session_state,
+    reclaim_stale_tasks,
+    reset_task,
+)
+
+
+def _write_task(task_dir: Path, data: dict[str, object]) -> Path:
+    path = task_dir / f"{data['id']}.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+def _setup(tmp_path: Path) -> tuple[Voyage, Path]:
+    voyage = Voyage.create("Test", "owner/repo", 2)
+    task_dir = tmp_path / ".claude" / "tasks" / voyage.task_list_id
+    task_dir.mkdir(parents=True)
+    return voyage, task_dir
+
+
+def test_reset_task_releases_claim_and_records_event() -> None:
+    """reset_task should clear the owner and append a reclaim record."""
+    now = datetime(2026, 1, 24, 12, 0, tzinfo=UTC)
+    data = {
+        "id": "1",
+        "status": "in_progress",
+        "owner": "ship-1",
+        "metadata": {"claimed_at": "2026-01-24T10:00:00+00:00", "voyage": "v"},
+    }
+
+    released = reset_task(data, "stale", now)
+
+    assert released["status"] == "pending"
+    assert "owner" not in released
+    assert "claimed_at" not in released["metadata"]
+    assert released["metadata"]["voyage"] == "v"
+    assert released["metadata"]["reclaimed"] == [
+        {"ship": "ship-1", "reason": "stale", "at": now.isoformat()}
+    ]
+    assert data["status"] == "in_progress"  # input is not mutated
+
+
+def test_reclaim_stale_claim(tmp_path: Path) -> None:
+    """Claims older than the threshold are released."""
+    voyage, task_dir = _setup(tmp_path)
+    old = (datetime.now(UTC) - timedelta(minutes=45)).isoformat()
+    recent = (datetime.now(UTC) - timedelta(minutes=5)).isoformat()
+    stale = _write_task(
+        task_dir,
+        {"id": "1", "status": "in_progress", "owner": "ship-0", "metadata": {"claimed_at": old}},
+    )
+    fresh = _write_task(
+        task_dir,
+        {"id": "2", "status": "in_progress", "owner": "ship-1", "metadata": {"claimed_at": recent}},
+    )
+
+    reclaims = reclaim_stale_tasks(voyage, tmp_path, threshold_minutes=30)
+
+    assert [(r.task_id, r.ship, r.reason) for r in reclaims] == [("1", "ship-0", "stale")]
+    assert json.loads(stale.read_text())["status"] == "pending"
+    assert json.loads(fresh.read_text())["status"] == "in_progress"
+
+
+def test_reclaim_uses_mtime_without_claim_timestamp(tmp_path: Path) -> None:
+    """Claims without claimed_at are aged by file modification time."""
+    voyage, task_dir = _setup(tmp_path)
+    path = _write_task(task_dir, {"id": "1", "status": "in_progress", "owner": "ship-0"})
+    old = time.time() - 3600
+    os.utime(path, (old, old))
+
+    reclaims = reclaim_stale_tasks(voyage, tmp_path, threshold_minutes=30)
+
+    assert [r.task_id for r in reclaims] == ["1"]
+
+
+def test_reclaim_lost_ship_immediately(tmp_path: Path) -> None:
+    """Claims held by ships whose VM is gone are released regardless of age."""
+    voyage, task_dir = _setup(tmp_path)
+    _write_task(task_dir, {"id": "1", "status": "in_progress", "owner": "ship-0"})
+    _write_task(task_dir, {"id": "2", "status": "in_progress", "owner": "ship-1"})
+
+    reclaims = reclaim_stale_tasks(voyage, tmp_path, threshold_minutes=30, live_ships={"ship-1"})
+
+    assert [(r.task_id, r.reason) for r in reclaims] == [("1", "ship-lost")]
+
+
+def test_parse_session_state_finished_run() -> None:
+    """A dead run-claude.exp with an Exit line reports the exit code."""
+    output = "session:yes\nrunning:no\ndrain:no\n[ship-0] Exit 137 at 2026-01-24T10:00:00+00:00\n"
+
+    state = parse_session_state(output)
+
+    assert state.session
+    assert not state.running
+    assert not state.draining
+    assert state.exit_code == 137
+
+
+def test_parse_session_state_running() -> None:
+    """A live run reports no exit code."""
+    state = parse_session_state("session:yes\nrunning:yes\ndrain:no\n[ship-0] Starting at x\n")
+
+    assert state.running
+    assert state.exit_code is None
+
+
+def test_session_check_finds_exit_in_rotated_segment(tmp_path: Path) -> None:
+    """The last Exit line is found even after the ship rotated it out of the log."""
+    script = tmp_path / ".ocaptain" / "log-rotate.py"
+    script.parent.mkdir()
+    shutil.copy(Path(log_rotate.__file__), script)
+    path = tmp_path / "voyage" / "logs" / "ship-0.log"
+    path.parent.mkdir(parents=True)
+    log = log_rotate.RotatingLog(str(path), max_bytes=1 << 20, max_age=0, keep=5)
+    log.write(b"[ship-0] Exit 137 at 2026-01-24T10:00:00+00:00\n")
+    log.rotate(background=False)
+    log.write(b"output after rotation\n")
+    log.close()
+
+    output = subprocess.run(
+        ["bash", "-c", _session_check_command("ship-0")],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "HOME": str(tmp_path)},
+        check=False,
+    ).stdout
+
+    assert parse_session_state(output).exit_code == 137
+
+
+def _ship(index: int) -> VM:
+    return VM(id=f"v-ship{index}", name=f"v-ship{index}", ssh_dest="x", status=VMStatus.RUNNING)
+
+
+def test_watchdog_relaunches_with_backoff_and_cap(mocker: MockerFixture) -> None:
+    """Stopped ships are relaunched, then backed off, then given up on."""
+    voyage = Voyage.create("Test", "owner/repo", 1)
+    dead = parse_session_state("session:yes\nrunning:no\ndrain:no\n[ship-0] Exit 1 at x\n")
+    mocker.patch("ocaptain.watch.check_session", return_value=dead)
+    relaunch = mocker.patch("ocaptain.tmux.relaunch_claude")
+    clock = mocker.patch("ocaptain.watch.time.monotonic", return_value=1000.0)
+    tasks = [Task.from_json({"id": "1", "title": "t", "status": "pending"})]
+    watchdog = ShipWatchdog(voyage, "token", max_restarts=2, backoff_seconds=10)
+
+    first = watchdog.check([_ship(0)], tasks, MagicMock())
+    assert [(e.ship, e.attempt, e.exit_code) for e in first] == [("ship-0", 1, 1)]
+
+    assert watchdog.check([_ship(0)], tasks, MagicMock()) == []  # backing off
+
+    clock.return_value = 1011.0
+    assert [e.attempt for e in watchdog.check([_ship(0)], tasks, MagicMock())] == [2]
+
+    clock.return_value = 2000.0
+    final = watchdog.check([_ship(0)], tasks, MagicMock())
+    assert [e.gave_up for e in final] == [True]
+    assert relaunch.call_count == 2
+
+
+def test_watchdog_reports_failed_relaunch(mocker: MockerFixture) -> None:
+    """A relaunch that raises is reported as failed and still uses up an attempt."""
+    voyage = Voyage.create("Test", "owner/repo", 1)
+    dead = parse_session_state("session:yes\nrunning:no\ndrain:no\n[ship-0] Exit 1 at x\n")
+    mocker.patch("ocaptain.watch.check_session", return_value=dead)
+    mocker.patch("ocaptain.tmux.relaunch_claude", side_effect=RuntimeError("ssh timed out"))
+    clock = mocker.patch("ocaptain.watch.time.monotonic", return_value=1000.0)
+    tasks = [Task.from_json({"id": "1", "title": "t", "status": "pending"})]
+    watchdog = ShipWatchdog(voyage, "token", max_restarts=1, backoff_seconds=10)
+
+    failed = watchdog.check([_ship(0)], tasks, MagicMock())
+    assert [(e.attempt, e.error, e.gave_up) for e in failed] == [(1, "ssh timed out", False)]
+
+    clock.return_value = 1011.0
+    assert [e.gave_up for e in watchdog.check([_ship(0)], tasks, MagicMock())] == [True]
+
+
+def test_watchdog_ignores_ships_without_work(mocker: MockerFixture) -> None:
+    """No relaunch when nothing is claimable and the ship holds no task."""
+    voyage = Voyage.create("Test", "owner/repo", 1)
+    check = mocker.patch("ocaptain.watch.check_session")
+    tasks = [Task.from_json({"id": "1", "title": "t", "status": "completed"})]
+
+    assert ShipWatchdog(voyage, "token").check([_ship(0)], tasks, MagicMock()) == []
+    check.assert_not_called()
+
+
+def test_reclaim_ownerless_claim_only_when_stale(tmp_path: Path) -> None:
+    """An in-progress task with no owner is aged, not treated as held by a lost ship."""
+    voyage, task_dir = _setup(tmp_path)
+    _write_task(task_dir, {"id": "1", "status": "in_progress"})
+    old = _write_task(task_dir, {"id": "2", "status": "in_progress"})
+    os.utime(old, (time.time() - 3600, time.time() - 3600))
+
+    reclaims = reclaim_stale_tasks(voyage, tmp_path, threshold_minutes=30, live_ships={"ship-1"})
+
+    assert [(r.task_id, r.reason) for r in reclaims] == [("2", "stale")]